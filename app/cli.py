@@ -172,6 +172,7 @@ def cmd_translate(
     """Translate text or file."""
     settings = _load_settings(config_path)
     translator = Translator(settings)
+    click.get_current_context().call_on_close(translator.close)
 
     if directory:
         return _cmd_translate_directory(
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 LANGUAGES: dict[str, str] = {
     "auto": "Auto-detect",
     "en": "English",
@@ -154,21 +160,41 @@ CHATGPT_PROXY_LANG_MAP: dict[str, str] = {
 }
 
 
+def _case_lookup(mapping: dict[str, str]) -> dict[str, str]:
+    """Key *mapping* by lowercase and uppercase code, so either hits without normalising."""
+    lookup = {k.lower(): v for k, v in mapping.items()}
+    lookup.update({k.upper(): v for k, v in lookup.items()})
+    return lookup
+
+
+# Mixed-case codes such as "zh-Cn" miss these tables and fall back to .lower()
+_LANGUAGE_NAMES = _case_lookup(LANGUAGES)
+_DEEPL_LOOKUP = _case_lookup(DEEPL_LANG_MAP)
+_CHATGPT_PROXY_LOOKUP = _case_lookup(CHATGPT_PROXY_LANG_MAP)
+
+
 def get_language_name(code: str) -> str:
-    return LANGUAGES.get(code.lower(), code)
+    return _LANGUAGE_NAMES.get(code) or _LANGUAGE_NAMES.get(code.lower(), code)
 
 
 def get_deepl_code(code: str) -> str | None:
-    return DEEPL_LANG_MAP.get(code.lower())
+    return _DEEPL_LOOKUP.get(code) or _DEEPL_LOOKUP.get(code.lower())
 
 
 def get_chatgpt_proxy_code(code: str) -> str | None:
-    return CHATGPT_PROXY_LANG_MAP.get(code.lower())
+    return _CHATGPT_PROXY_LOOKUP.get(code) or _CHATGPT_PROXY_LOOKUP.get(code.lower())
+
+
+_SOURCE_LANGUAGES: Mapping[str, str] = MappingProxyType(dict(LANGUAGES))
+_TARGET_LANGUAGES: Mapping[str, str] = MappingProxyType(
+    {k: v for k, v in LANGUAGES.items() if k != "auto"}
+)
 
 
-def get_source_languages() -> dict[str, str]:
-    return LANGUAGES.copy()
+def get_source_languages() -> Mapping[str, str]:
+    """Read-only view of the languages selectable as a source, including "auto"."""
+    return _SOURCE_LANGUAGES
 
 
-def get_target_languages() -> dict[str, str]:
-    return {k: v for k, v in LANGUAGES.items() if k != "auto"}
+def get_target_languages() -> Mapping[str, str]:
+    return _TARGET_LANGUAGES
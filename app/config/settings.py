@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import stat
+import tempfile
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +19,7 @@ from app.config.schema import (
     ApiKeysSchema,
     SettingsSchema,
 )
+from app.utils.json_helpers import dumps_json, loads_json
 
 logger = logging.getLogger(__name__)
 
@@ -73,26 +77,46 @@ class Settings:
         self.load()
 
     def load(self) -> None:
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, encoding="utf-8") as f:
-                    loaded = json.load(f)
-                merged = self._deep_merge(self.DEFAULT_SETTINGS.copy(), loaded)
-                self._schema = SettingsSchema.model_validate(merged)
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning("Failed to load settings from %s: %s", self.config_path, e)
-                self._schema = SettingsSchema()
-            except ValidationError as e:
-                logger.warning("Invalid settings in %s: %s", self.config_path, e)
-                self._schema = SettingsSchema()
-        else:
+        try:
+            loaded = loads_json(self.config_path.read_bytes())
+            merged = self._deep_merge(self.DEFAULT_SETTINGS.copy(), loaded)
+            self._schema = SettingsSchema.model_validate(merged)
+        except FileNotFoundError:
+            self._schema = SettingsSchema()
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Failed to load settings from %s: %s", self.config_path, e)
+            self._schema = SettingsSchema()
+        except ValidationError as e:
+            logger.warning("Invalid settings in %s: %s", self.config_path, e)
             self._schema = SettingsSchema()
 
     def save(self) -> None:
+        # Write beside the config and rename over it, so a crash mid-write
+        # never leaves a truncated config.json behind. The temp name is unique
+        # so concurrent saves cannot clobber each other's half-written file.
+        data = dumps_json(self.to_dict(), indent=True)
+        tmp_path: Path | None = None
         try:
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            with tempfile.NamedTemporaryFile(
+                dir=self.config_path.parent,
+                prefix=self.config_path.name + ".",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp:
+                tmp_path = Path(tmp.name)
+                tmp.write(data)
+            # The temp file starts at 0o600, which suits a new file holding API keys;
+            # an existing config keeps whatever mode the user gave it
+            try:
+                mode = stat.S_IMODE(self.config_path.stat().st_mode)
+            except FileNotFoundError:
+                pass
+            else:
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, self.config_path)
         except OSError as e:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
             raise ValueError(f"Failed to save settings: {e}") from e
 
     def _deep_merge(self, base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
@@ -131,6 +155,10 @@ class Settings:
 
     def validate(self, key: str, value: Any) -> None:
         """Validate a setting value. Raises ValueError if invalid."""
+        self._validated(key, value)
+
+    def _validated(self, key: str, value: Any) -> SettingsSchema:
+        """Return the settings with *key* set to *value*, or raise ValueError."""
         # Pre-check: type mismatch for known fields — produce backward-compatible messages
         if key in self._FIELD_TYPES:
             type_name, expected_type = self._FIELD_TYPES[key]
@@ -161,7 +189,7 @@ class Settings:
         try:
             current = self.to_dict()
             current[key] = value
-            SettingsSchema.model_validate(current)
+            return SettingsSchema.model_validate(current)
         except ValidationError as e:
             # Extract the original ValueError message from Pydantic
             for error in e.errors():
@@ -174,10 +202,8 @@ class Settings:
             raise ValueError(str(e)) from e
 
     def set(self, key: str, value: Any) -> None:
-        self.validate(key, value)
-        current = self.to_dict()
-        current[key] = value
-        self._schema = SettingsSchema.model_validate(current)
+        # One dump + validate pass, shared with validate() rather than repeated
+        self._schema = self._validated(key, value)
 
     def get_api_keys(self) -> dict[str, str]:
         return self._schema.api_keys.model_dump()
@@ -188,8 +214,11 @@ class Settings:
         self._schema.api_keys = ApiKeysSchema.model_validate(keys)
 
     def get_api_key(self, service: str) -> str:
-        keys = self._schema.api_keys.model_dump()
-        return keys.get(service, "")
+        # Read the one field instead of dumping every key per lookup
+        api_keys = self._schema.api_keys
+        if service in ApiKeysSchema.model_fields:
+            return getattr(api_keys, service)
+        return (api_keys.model_extra or {}).get(service, "")
 
     def get_theme(self) -> str:
         return self._schema.theme
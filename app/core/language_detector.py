@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import threading
 from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from app.config.languages import LANGUAGES, get_language_name
 
 try:
-    from langdetect import detect, detect_langs
+    from langdetect import PROFILES_DIRECTORY, DetectorFactory
     from langdetect.lang_detect_exception import LangDetectException
 
     LANGDETECT_AVAILABLE = True
@@ -16,34 +20,152 @@ except ImportError:
     LANGDETECT_AVAILABLE = False
     LangDetectException = Exception  # type: ignore[misc, assignment]
 
+try:
+    import fasttext
+
+    FASTTEXT_AVAILABLE = True
+except ImportError:
+    FASTTEXT_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from langdetect.language import Language
+
 logger = logging.getLogger(__name__)
 
 _CACHE_MAX_SIZE = 256
 _CACHE_KEY_PREFIX_LEN = 200
 
 
+# Scripts written by exactly one of the loaded profiles: (first, last code point, language).
+# Cyrillic (ru/uk/bg/sr) and Han (zh-cn/zh-tw) are ambiguous and left to langdetect.
+_UNIQUE_SCRIPTS = (
+    (0x0370, 0x03FF, "el"),
+    (0x0590, 0x05FF, "he"),
+    (0x0600, 0x06FF, "ar"),
+    (0x0E00, 0x0E7F, "th"),
+    (0x3040, 0x30FF, "ja"),  # Hiragana and Katakana
+    (0xAC00, 0xD7AF, "ko"),  # Hangul syllables
+)
+_CJK_IDEOGRAPHS = (0x4E00, 0x9FFF)
+_SCRIPT_SAMPLE_LEN = 64
+_SCRIPT_MIN_SHARE = 0.95
+
+
+def _script_language(text: str) -> str | None:
+    """Name the language outright when its script alone settles it, else None."""
+    votes: dict[str, int] = {}
+    han = letters = 0
+    for char in text[:_SCRIPT_SAMPLE_LEN]:
+        if not char.isalpha():
+            continue
+        letters += 1
+        code = ord(char)
+        if _CJK_IDEOGRAPHS[0] <= code <= _CJK_IDEOGRAPHS[1]:
+            han += 1
+            continue
+        for first, last, lang in _UNIQUE_SCRIPTS:
+            if first <= code <= last:
+                votes[lang] = votes.get(lang, 0) + 1
+                break
+
+    if not votes:
+        return None
+    # Japanese mixes kana with kanji; Chinese never uses kana
+    if "ja" in votes and votes["ja"] + han == letters:
+        return "ja"
+    lang, count = max(votes.items(), key=lambda item: item[1])
+    return lang if count >= letters * _SCRIPT_MIN_SHARE else None
+
+
+_FACTORY_LOCK = threading.Lock()
+
+
+def _get_factory() -> DetectorFactory:
+    # Concurrent first callers wait for one build instead of each parsing the profiles
+    with _FACTORY_LOCK:
+        return _build_factory()
+
+
+@functools.cache
+def _build_factory() -> DetectorFactory:
+    # Profiles are parsed once, on first use. langdetect's own global factory is
+    # unseeded, so the same text could come back as different languages per run.
+    # Only languages we can translate from are loaded (35 of 55 n-gram tables).
+    factory = DetectorFactory()
+    profiles = sorted(Path(PROFILES_DIRECTORY).iterdir())
+    factory.load_json_profile(
+        [
+            profile.read_text(encoding="utf-8")
+            for profile in profiles
+            if profile.name.split("-")[0] in LANGUAGES
+        ]
+    )
+    factory.set_seed(0)
+    return factory
+
+
+def detect(text: str) -> str:
+    detector = _get_factory().create()
+    detector.append(text)
+    return detector.detect()
+
+
+def detect_langs(text: str) -> list[Language]:
+    detector = _get_factory().create()
+    detector.append(text)
+    return detector.get_probabilities()
+
+
+def _fasttext_predict(model: Any, text: str, k: int) -> list[tuple[str, float]]:
+    # Calls the native binding: the Python wrapper's predict() builds its result with
+    # np.array(copy=False), which NumPy 2 rejects. fastText predicts one
+    # newline-terminated line and labels classes as "__label__<code>".
+    predictions = model.f.predict(text.replace("\n", " ") + "\n", k, 0.0, "strict")
+    return [(label.removeprefix("__label__"), float(prob)) for prob, label in predictions]
+
+
 class LanguageDetector:
     """Detects the language of text content."""
 
     SUPPORTED_LANGUAGES = LANGUAGES
 
     _cache: OrderedDict[str, str | None] = OrderedDict()
+    _confidence_cache: OrderedDict[str, tuple[tuple[str, float], ...]] = OrderedDict()
+    # Guards both caches; detection itself runs unlocked on per-call Detector objects
+    _cache_lock = threading.Lock()
+    # fastText language-ID model; replaces langdetect once loaded
+    _fasttext_model: Any = None
+
+    @classmethod
+    def load_fasttext_model(cls, model_path: str | Path) -> None:
+        """Detect with a fastText model such as lid.176.bin instead of langdetect."""
+        if not FASTTEXT_AVAILABLE:
+            raise RuntimeError("fasttext is not installed")
+        cls._fasttext_model = fasttext.load_model(str(model_path))
+        cls.clear_cache()
 
     @classmethod
     def detect(cls, text: str) -> str | None:
-        if not LANGDETECT_AVAILABLE:
+        if not cls.is_available():
             return None
 
         if not text or len(text.strip()) < 10:
             return None
 
         cache_key = text.strip()[:_CACHE_KEY_PREFIX_LEN]
-        if cache_key in cls._cache:
-            cls._cache.move_to_end(cache_key)
-            return cls._cache[cache_key]
+        with cls._cache_lock:
+            if cache_key in cls._cache:
+                cls._cache.move_to_end(cache_key)
+                return cls._cache[cache_key]
 
         try:
-            lang = detect(text)
+            lang = _script_language(text.strip())
+            if lang is None and cls._fasttext_model is not None:
+                lang = _fasttext_predict(cls._fasttext_model, text, 1)[0][0]
+            elif lang is None:
+                lang = detect(text)
             if lang == "zh-cn" or lang == "zh-tw":
                 result: str | None = lang
             else:
@@ -54,36 +176,58 @@ class LanguageDetector:
             logger.debug("Language detection failed: %s", e)
             result = None
 
-        cls._cache[cache_key] = result
-        if len(cls._cache) > _CACHE_MAX_SIZE:
-            cls._cache.popitem(last=False)
+        with cls._cache_lock:
+            cls._cache[cache_key] = result
+            if len(cls._cache) > _CACHE_MAX_SIZE:
+                cls._cache.popitem(last=False)
 
         return result
 
+    @classmethod
+    def detect_many(cls, texts: Iterable[str]) -> list[str | None]:
+        """Detect each text in order; all share the cache and the loaded profiles."""
+        return [cls.detect(text) for text in texts]
+
     @classmethod
     def detect_with_confidence(cls, text: str) -> list[tuple[str, float]]:
-        if not LANGDETECT_AVAILABLE:
+        if not cls.is_available():
             return []
 
         if not text or len(text.strip()) < 10:
             return []
 
+        cache_key = text.strip()[:_CACHE_KEY_PREFIX_LEN]
+        with cls._cache_lock:
+            if cache_key in cls._confidence_cache:
+                cls._confidence_cache.move_to_end(cache_key)
+                return list(cls._confidence_cache[cache_key])
+
         try:
-            results = detect_langs(text)
-            return [(str(r.lang), float(r.prob)) for r in results]
+            if cls._fasttext_model is not None:
+                results = tuple(_fasttext_predict(cls._fasttext_model, text, 5))
+            else:
+                results = tuple((str(r.lang), float(r.prob)) for r in detect_langs(text))
         except LangDetectException:
-            return []
+            results = ()
         except Exception:
-            return []
+            results = ()
 
-    @classmethod
-    def get_language_name(cls, code: str) -> str:
-        return get_language_name(code)
+        with cls._cache_lock:
+            cls._confidence_cache[cache_key] = results
+            if len(cls._confidence_cache) > _CACHE_MAX_SIZE:
+                cls._confidence_cache.popitem(last=False)
+
+        return list(results)
+
+    # Bound directly so lookups skip a wrapper frame
+    get_language_name = staticmethod(get_language_name)
 
     @classmethod
     def is_available(cls) -> bool:
-        return LANGDETECT_AVAILABLE
+        return LANGDETECT_AVAILABLE or cls._fasttext_model is not None
 
     @classmethod
     def clear_cache(cls) -> None:
-        cls._cache.clear()
+        with cls._cache_lock:
+            cls._cache.clear()
+            cls._confidence_cache.clear()
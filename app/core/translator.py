@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from nltk.tokenize import sent_tokenize
@@ -26,27 +30,32 @@ from app.services import (
 from app.services.llm_base import LLMTranslationService
 from app.utils.cache import TranslationCache
 from app.utils.glossary import Glossary
+from app.utils.nltk_resources import nltk_missing, nltk_ready
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from concurrent.futures import Executor
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on progress callbacks per parallel translation
+_PROGRESS_STEPS = 100
+# Size of the shared chunk pool, the top of the settings slider; threads start on demand
+_POOL_WORKERS = 10
+
 
 class SimpleTokenizer:
+    # One pass in the regex engine: a sentence runs to the first terminator that neither
+    # opens it nor follows a digit ("3.14"); anything after the last one is the tail.
+    _SENT_RE = re.compile(r"[\s\S]*?\D[.!?]|[\s\S]+")
+
     @staticmethod
     def sent_tokenize(text: str) -> list[str]:
-        sentences: list[str] = []
-        current_sentence = ""
-
-        for char in text:
-            current_sentence += char
-            if char in ".!?" and len(current_sentence) > 1 and not current_sentence[-2].isdigit():
-                sentences.append(current_sentence.strip())
-                current_sentence = ""
-
-        if current_sentence.strip():
-            sentences.append(current_sentence.strip())
+        sentences = [
+            sentence
+            for chunk in SimpleTokenizer._SENT_RE.findall(text)
+            if (sentence := chunk.strip())
+        ]
 
         if not sentences:
             sentences = [text]
@@ -54,10 +63,20 @@ class SimpleTokenizer:
         return sentences
 
 
+@functools.lru_cache(maxsize=32)
+def _punkt_tokenize(text: str) -> tuple[str, ...]:
+    # Punkt is far slower than the regex fallback, and a document is split again
+    # on every retry or re-run; failures raise and so are never cached
+    return tuple(sent_tokenize(text))
+
+
 def safe_sent_tokenize(text: str) -> list[str]:
+    if not nltk_ready.is_set() or nltk_missing.is_set():
+        return SimpleTokenizer.sent_tokenize(text)
     try:
-        return sent_tokenize(text)
+        return list(_punkt_tokenize(text))
     except LookupError:
+        nltk_missing.set()
         return SimpleTokenizer.sent_tokenize(text)
     except Exception:
         return SimpleTokenizer.sent_tokenize(text)
@@ -75,6 +94,9 @@ class Translator:
             enabled=self.settings.get("cache_enabled", True),
             max_size=self.settings.get("cache_max_size", 10000),
         )
+        # Chunk worker pool, shared by every translate_parallel call on this instance
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
         self._initialize_services()
         logger.info("Translator initialized with %d services", len(self.services))
 
@@ -154,27 +176,43 @@ class Translator:
             self.services[plugin.service_id] = plugin.service
 
     def reload_services(self) -> None:
+        self._close_services()
         self.services.clear()
         self._initialize_services()
 
+    def _close_services(self) -> None:
+        for name, service in self.services.items():
+            try:
+                service.close()
+            except Exception as e:
+                logger.warning("Failed to close service %s: %s", name, e)
+
     def get_available_services(self) -> list[str]:
         return [name for name, service in self.services.items() if service.is_configured()]
 
     def split_text(self, text: str, chunk_size: int = 1000) -> list[str]:
         sentences = safe_sent_tokenize(text)
         chunks: list[str] = []
-        current_chunk = ""
+        # Sentences of the open chunk and its joined length, so no string is rebuilt per step
+        parts: list[str] = []
+        length = 0
 
         for sent in sentences:
-            if len(current_chunk + sent) <= chunk_size:
-                current_chunk += " " + sent if current_chunk else sent
+            if length + len(sent) <= chunk_size:
+                if length:
+                    parts.append(sent)
+                    length += len(sent) + 1
+                else:
+                    parts = [sent]
+                    length = len(sent)
             else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sent
+                if length:
+                    chunks.append(" ".join(parts).strip())
+                parts = [sent]
+                length = len(sent)
 
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if length:
+            chunks.append(" ".join(parts).strip())
 
         return chunks if chunks else [text]
 
@@ -186,6 +224,19 @@ class Translator:
         service_name: str,
         on_token: Callable[[str], None] | None = None,
     ) -> str:
+        return self.glossary.apply(
+            self._translate_raw(text, source_lang, target_lang, service_name, on_token)
+        )
+
+    def _translate_raw(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        service_name: str,
+        on_token: Callable[[str], None] | None = None,
+    ) -> str:
+        """translate() without the glossary, for callers that apply it to the whole document."""
         service = self.services.get(service_name)
         if service is None:
             raise ValueError(f"Service '{service_name}' is not available")
@@ -193,13 +244,13 @@ class Translator:
         if not service.is_configured():
             raise ValueError(f"Service '{service_name}' is not configured")
 
-        cached = self.cache.get(text, source_lang, target_lang, service_name)
+        cache_service = self._cache_service_key(service_name, service)
+        cached = self.cache.get(text, source_lang, target_lang, cache_service)
         if cached is not None:
             logger.debug("Cache hit for %s (%s→%s)", service_name, source_lang, target_lang)
-            result = self.glossary.apply(cached)
             if on_token:
-                on_token(result)
-            return result
+                on_token(cached)
+            return cached
 
         if on_token and isinstance(service, LLMTranslationService) and service.supports_streaming():
             translated = service.translate_stream(text, source_lang, target_lang, on_token)
@@ -208,8 +259,19 @@ class Translator:
             if on_token:
                 on_token(translated)
 
-        self.cache.put(text, source_lang, target_lang, service_name, translated)
-        return self.glossary.apply(translated)
+        self.cache.put(text, source_lang, target_lang, cache_service, translated)
+        return translated
+
+    @staticmethod
+    def _cache_service_key(service_name: str, service: TranslationService) -> str:
+        """Cache namespace for a service; LLM results are also keyed by model."""
+        # Older LLM entries under the bare service name are left to age out: they
+        # do not record which model produced them, so serving them could be wrong
+        if isinstance(service, LLMTranslationService):
+            model = getattr(service, "model", "")
+            if model:
+                return f"{service_name}:{model}"
+        return service_name
 
     def translate_chunk(
         self,
@@ -241,7 +303,16 @@ class Translator:
         max_workers: int = 3,
         progress_callback: Callable[[int, int], None] | None = None,
         on_token: dict[str, Callable[[str], None]] | None = None,
+        executor: Executor | None = None,
     ) -> dict[str, str]:
+        """Translate *text* with every service in *services*, chunk by chunk.
+
+        Chunk calls run on *executor* when given; otherwise on a pool owned by
+        this translator, created on first use and kept until :meth:`close`
+        (a *max_workers* above the pool size gets a pool for this call only).
+        Inside a running event loop this degrades to one chunk at a time; await
+        :meth:`atranslate_parallel` there instead.
+        """
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
@@ -253,7 +324,7 @@ class Translator:
             )
 
         return asyncio.run(
-            self._translate_parallel_async(
+            self.atranslate_parallel(
                 text,
                 source_lang,
                 target_lang,
@@ -262,20 +333,51 @@ class Translator:
                 max_workers,
                 progress_callback,
                 on_token,
+                executor,
             )
         )
 
-    async def _translate_parallel_async(
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Sized once and never swapped out, so concurrent calls can share it safely
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(_POOL_WORKERS, thread_name_prefix="translate")
+            return self._executor
+
+    def close(self, wait: bool = True) -> None:
+        """Shut down the chunk worker pool and the services' connection pools.
+
+        Both are recreated on next use. With ``wait=False`` queued chunks are
+        cancelled and running ones are not awaited.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=not wait)
+                self._executor = None
+        self._close_services()
+
+    def __enter__(self) -> Translator:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def atranslate_parallel(
         self,
         text: str,
         source_lang: str,
         target_lang: str,
         services: list[str],
-        chunk_size: int,
-        max_workers: int,
+        chunk_size: int = 1000,
+        max_workers: int = 3,
         progress_callback: Callable[[int, int], None] | None = None,
         on_token: dict[str, Callable[[str], None]] | None = None,
+        executor: Executor | None = None,
     ) -> dict[str, str]:
+        """Coroutine form of :meth:`translate_parallel` for callers with a running loop.
+
+        Up to *max_workers* chunk calls are in flight at once, on the same pool.
+        """
         chunks = self.split_text(text, chunk_size)
 
         # Deduplicate chunks: translate each unique chunk only once per service
@@ -292,28 +394,40 @@ class Translator:
             len(services),
         )
 
+        # A call wanting more workers than the shared pool has gets a pool of its own
+        own_pool = None
+        if executor is None and max_workers > _POOL_WORKERS:
+            own_pool = ThreadPoolExecutor(max_workers, thread_name_prefix="translate")
+        pool = executor or own_pool or self._get_executor()
         semaphore = asyncio.Semaphore(max_workers)
+        # Report roughly every 1% plus the final task, not after every chunk
+        progress_step = max(1, -(-total_tasks // _PROGRESS_STEPS))
+        reported = 0
         unique_results: dict[str, dict[str, str]] = {service: {} for service in services}
 
         async def translate_task(chunk: str, service_name: str) -> None:
-            nonlocal completed
+            nonlocal completed, reported
             async with semaphore:
                 try:
                     token_cb = on_token.get(service_name) if on_token else None
-                    result = await asyncio.to_thread(
-                        self.translate,
+                    call = functools.partial(
+                        self._translate_raw,
                         chunk,
                         source_lang,
                         target_lang,
                         service_name,
                         token_cb,
                     )
+                    result = await asyncio.get_running_loop().run_in_executor(pool, call)
                 except Exception as e:
                     logger.error("Chunk failed for %s: %s", service_name, e)
                     result = f"[Error: {e}]"
                 unique_results[service_name][chunk] = result
                 completed += 1
-                if progress_callback:
+                if progress_callback and (
+                    completed - reported >= progress_step or completed == total_tasks
+                ):
+                    reported = completed
                     progress_callback(completed, total_tasks)
 
         tasks = []
@@ -321,16 +435,16 @@ class Translator:
             for service_name in services:
                 tasks.append(translate_task(chunk, service_name))
 
-        await asyncio.gather(*tasks)
-
-        # Map unique results back to original chunk order
-        final_results: dict[str, str] = {}
-        for service_name in services:
-            ordered = [unique_results[service_name][chunk] for chunk in chunks]
-            final_results[service_name] = " ".join(ordered)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            if own_pool is not None:
+                own_pool.shutdown()
 
-        for service in final_results:
-            final_results[service] = self.glossary.apply(final_results[service])
+        final_results = {
+            service_name: self._assemble(chunks, unique_results[service_name])
+            for service_name in services
+        }
 
         self.cache.save()
         return final_results
@@ -352,6 +466,8 @@ class Translator:
         unique_chunks = list(dict.fromkeys(chunks))
         total_tasks = len(unique_chunks) * len(services)
         completed = 0
+        progress_step = max(1, -(-total_tasks // _PROGRESS_STEPS))
+        reported = 0
 
         unique_results: dict[str, dict[str, str]] = {service: {} for service in services}
 
@@ -359,25 +475,34 @@ class Translator:
             for service_name in services:
                 try:
                     token_cb = on_token.get(service_name) if on_token else None
-                    result = self.translate(chunk, source_lang, target_lang, service_name, token_cb)
+                    result = self._translate_raw(
+                        chunk, source_lang, target_lang, service_name, token_cb
+                    )
                 except Exception as e:
                     result = f"[Error: {e}]"
                 unique_results[service_name][chunk] = result
                 completed += 1
-                if progress_callback:
+                if progress_callback and (
+                    completed - reported >= progress_step or completed == total_tasks
+                ):
+                    reported = completed
                     progress_callback(completed, total_tasks)
 
-        # Map unique results back to original chunk order
-        final_results: dict[str, str] = {}
-        for service_name in services:
-            ordered = [unique_results[service_name][chunk] for chunk in chunks]
-            final_results[service_name] = " ".join(ordered)
-
-        for service in final_results:
-            final_results[service] = self.glossary.apply(final_results[service])
+        final_results = {
+            service_name: self._assemble(chunks, unique_results[service_name])
+            for service_name in services
+        }
 
         self.cache.save()
         return final_results
 
+    def _assemble(self, chunks: list[str], translated: dict[str, str]) -> str:
+        """Join chunk translations in original order, then apply the glossary once.
+
+        Chunks are translated raw, so a glossary term spanning a chunk boundary
+        still matches in the joined document.
+        """
+        return self.glossary.apply(" ".join(translated[chunk] for chunk in chunks))
+
     def detect_language(self, text: str) -> str | None:
         return self.language_detector.detect(text)
@@ -606,6 +606,8 @@ class MainWindow(
     def _on_close(self) -> None:
         self.settings.set_window_geometry(self.root.geometry())
         self.settings.save()
+        # A translation may still be running in a worker thread; don't block the exit on it
+        self.translator.close(wait=False)
         self.root.destroy()
 
     def run(self) -> None:
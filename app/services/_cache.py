@@ -0,0 +1,70 @@
+"""Embedding-similarity cache for LLM translations."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Sequence
+
+import numpy as np
+
+
+class SemanticCache:
+    """Reuses a translation when a new text embeds next to an earlier one.
+
+    Entries are partitioned by language pair, so a hit never crosses languages.
+    Lookup is an exact cosine scan over the pair's vectors, which is plenty
+    for the few thousand strings of one session.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        max_distance: float = 0.03,
+        max_size: int = 5000,
+    ) -> None:
+        self._embed = embed
+        self._max_distance = max_distance
+        self._max_size = max_size
+        self._partitions: dict[tuple[str, str], tuple[list[np.ndarray], list[str]]] = {}
+        self._matrices: dict[tuple[str, str], np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def embed(self, text: str) -> np.ndarray:
+        vector = np.asarray(self._embed(text), dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def get(self, vector: np.ndarray, source_lang: str, target_lang: str) -> str | None:
+        key = (source_lang.lower(), target_lang.lower())
+        with self._lock:
+            partition = self._partitions.get(key)
+            if not partition:
+                return None
+            vectors, translations = partition
+            matrix = self._matrices.get(key)
+            if matrix is None:
+                matrix = self._matrices[key] = np.vstack(vectors)
+            similarities = matrix @ vector
+            best = int(np.argmax(similarities))
+            if 1.0 - float(similarities[best]) <= self._max_distance:
+                return translations[best]
+            return None
+
+    def put(self, vector: np.ndarray, source_lang: str, target_lang: str, translation: str) -> None:
+        key = (source_lang.lower(), target_lang.lower())
+        with self._lock:
+            vectors, translations = self._partitions.setdefault(key, ([], []))
+            vectors.append(vector)
+            translations.append(translation)
+            if len(vectors) > self._max_size:
+                del vectors[0], translations[0]
+            self._matrices.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._partitions.clear()
+            self._matrices.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(translations) for _, translations in self._partitions.values())
@@ -0,0 +1,47 @@
+"""Bounded, rate-limited fan-out for batch translation."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncRateLimiter:
+    """Spaces request starts at least ``1 / qps`` seconds apart on the running loop."""
+
+    def __init__(self, qps: float) -> None:
+        if qps <= 0:
+            raise ValueError("qps must be positive")
+        self._interval = 1.0 / qps
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+                now = self._next
+            self._next = now + self._interval
+
+
+async def bounded_gather(
+    coros: Iterable[Awaitable[T]],
+    *,
+    concurrency: int,
+    limiter: AsyncRateLimiter | None = None,
+) -> list[T]:
+    """Like asyncio.gather(), with at most *concurrency* awaitables in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(coro: Awaitable[T]) -> T:
+        async with semaphore:
+            if limiter is not None:
+                await limiter.acquire()
+            return await coro
+
+    return list(await asyncio.gather(*(run(coro) for coro in coros)))
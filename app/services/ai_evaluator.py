@@ -9,6 +9,10 @@ from app.utils.json_helpers import parse_json_response
 
 logger = logging.getLogger(__name__)
 
+# Ren'Py dialogue lines look like '    character "dialogue"'
+_RENPY_RE = re.compile(r'^\s*\w+\s*["\'].*?["\']', re.MULTILINE)
+_RENPY_LINE_RE = re.compile(r'^([^\S\n]*)(\w+)[^\S\n]*(["\'])(.*?)(["\'])(.*)$', re.MULTILINE)
+
 
 @dataclass
 class EvaluationResult:
@@ -41,7 +45,7 @@ class AIEvaluator:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         evaluation_prompt = self._create_evaluation_prompt(
-            original_text, translations, source_lang, target_lang
+            original_text, translations, source_lang, target_lang, is_renpy
         )
 
         try:
@@ -49,25 +53,27 @@ class AIEvaluator:
         except Exception as e:
             raise RuntimeError(f"Evaluation failed: {str(e)}") from e
 
-        evaluations = self._parse_evaluation_response(evaluation_response, timestamp)
-
-        improvement_prompt = self._create_improvement_prompt(
-            original_text, translations, source_lang, target_lang, is_renpy
+        result: dict[str, EvaluationResult | str] = dict(
+            self._parse_evaluation_response(evaluation_response, timestamp)
         )
 
-        try:
-            improved_translation = self.llm_service.translate(improvement_prompt, "en", "en")
-        except Exception as e:
-            logger.warning("Failed to generate improved translation: %s", e)
-            improved_translation = ""
-
-        if is_renpy and improved_translation:
-            improved_translation = self._preserve_renpy_structure(
-                original_text, improved_translation
+        improved_translation = self._parse_improved_translation(evaluation_response)
+        if not improved_translation:
+            # The model ignored the combined format; ask for the improvement on its own
+            improvement_prompt = self._create_improvement_prompt(
+                original_text, translations, source_lang, target_lang, is_renpy
             )
+            try:
+                improved_translation = self.llm_service.translate(improvement_prompt, "en", "en")
+            except Exception as e:
+                logger.warning("Failed to generate improved translation: %s", e)
+                improved_translation = ""
 
-        result = {**evaluations}
         if improved_translation:
+            if is_renpy:
+                improved_translation = self._preserve_renpy_structure(
+                    original_text, improved_translation
+                )
             result["ai_improved"] = improved_translation
 
         return result
@@ -78,6 +84,7 @@ class AIEvaluator:
         translations: dict[str, str],
         source_lang: str,
         target_lang: str,
+        is_renpy: bool = False,
     ) -> str:
         translations_text = "\n".join(
             [
@@ -86,6 +93,10 @@ class AIEvaluator:
             ]
         )
 
+        renpy_instruction = ""
+        if is_renpy:
+            renpy_instruction = "\nIn the improved translation, preserve all Ren'Py dialogue markers, character names, and indentation exactly."
+
         prompt = f"""You are a professional translation quality evaluator.
 
 Evaluate these translations of the text from {source_lang} to {target_lang}.
@@ -100,12 +111,16 @@ For each translation, provide:
 - Score (0-10) based on accuracy, fluency, and naturalness
 - Brief explanation (1-2 sentences) highlighting strengths/weaknesses
 
+Then write an improved translation that combines the best aspects of all of them,
+preserving the exact meaning with maximum naturalness and fluency.{renpy_instruction}
+
 Respond in JSON format:
 {{
   "evaluations": [
     {{"service": "service_name", "score": 8.5, "explanation": "..."}},
     ...
-  ]
+  ],
+  "improved_translation": "..."
 }}
 
 Provide ONLY the JSON response, no additional text."""
@@ -149,9 +164,16 @@ Output only the improved translation, no explanations."""
         self, response: str, timestamp: str
     ) -> dict[str, EvaluationResult]:
         try:
-            data = parse_json_response(response)
-
-            evaluations = {}
+            try:
+                data = parse_json_response(response)
+            except json.JSONDecodeError:
+                # A malformed improved translation must not cost the scores that precede it
+                head, found, _ = response.partition('"improved_translation"')
+                if not found:
+                    raise
+                data = parse_json_response(head.rstrip().rstrip(",") + "}")
+
+            evaluations: dict[str, EvaluationResult] = {}
             for eval_item in data.get("evaluations", []):
                 service = eval_item.get("service", "")
                 score = float(eval_item.get("score", 0))
@@ -173,44 +195,31 @@ Output only the improved translation, no explanations."""
         except (json.JSONDecodeError, ValueError, KeyError) as e:
             raise RuntimeError(f"Failed to parse evaluation response: {str(e)}") from e
 
+    def _parse_improved_translation(self, response: str) -> str:
+        try:
+            data = parse_json_response(response)
+        except (json.JSONDecodeError, ValueError):
+            return ""
+
+        improved = data.get("improved_translation") if isinstance(data, dict) else None
+        return improved.strip() if isinstance(improved, str) else ""
+
     def _preserve_renpy_structure(self, original: str, improved: str) -> str:
         if not self._is_renpy_dialogue(original):
             return improved
 
-        # Ren'Py dialogue pattern: matches lines like '    character "dialogue"'
-        dialogue_pattern = re.compile(r'^(\s*)(\w+)\s*(["\'])(.*?)(["\'])(.*)$', re.MULTILINE)
-
-        original_lines = original.split("\n")
-        improved_lines = improved.split("\n")
-
-        result_lines = []
-        improved_idx = 0
-
-        for orig_line in original_lines:
-            match = dialogue_pattern.match(orig_line)
-            if match:
-                if improved_idx < len(improved_lines):
-                    indent = match.group(1)
-                    character = match.group(2)
-                    start_quote = match.group(3)
-                    end_quote = match.group(5)
-                    rest = match.group(6)
-
-                    new_dialogue = improved_lines[improved_idx].strip()
-                    new_dialogue = new_dialogue.strip('"').strip("'")
+        improved_lines = iter(improved.split("\n"))
 
-                    result_lines.append(
-                        f"{indent}{character} {start_quote}{new_dialogue}{end_quote}{rest}"
-                    )
-                    improved_idx += 1
-                else:
-                    result_lines.append(orig_line)
-            else:
-                result_lines.append(orig_line)
+        def replace(match: re.Match[str]) -> str:
+            line = next(improved_lines, None)
+            if line is None:
+                return match.group(0)
+            indent, character, start_quote, _, end_quote, rest = match.groups()
+            new_dialogue = line.strip().strip('"').strip("'")
+            return f"{indent}{character} {start_quote}{new_dialogue}{end_quote}{rest}"
 
-        return "\n".join(result_lines)
+        # One pass over the script; dialogue lines take improved lines in order
+        return _RENPY_LINE_RE.sub(replace, original)
 
     def _is_renpy_dialogue(self, text: str) -> bool:
-        # Ren'Py dialogue pattern: matches lines like '    character "dialogue"'
-        dialogue_pattern = re.compile(r'^\s*\w+\s*["\'].*?["\']', re.MULTILINE)
-        return bool(dialogue_pattern.search(text))
+        return bool(_RENPY_RE.search(text))
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 
+from app.services._concurrency import AsyncRateLimiter, bounded_gather
+
 
 class TranslationService(ABC):
     """Abstract base class for translation services."""
 
+    # translate_many() defaults: requests in flight, and request starts per second (None = unlimited)
+    MAX_CONCURRENCY: int = 5
+    MAX_QPS: float | None = None
+
     @abstractmethod
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """
@@ -26,6 +33,35 @@ class TranslationService(ABC):
         """
         ...
 
+    async def atranslate(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Translate text without blocking the event loop."""
+        return await asyncio.to_thread(self.translate, text, source_lang, target_lang)
+
+    async def translate_many(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        concurrency: int | None = None,
+    ) -> list[str]:
+        """
+        Translate several texts concurrently, preserving input order.
+
+        Identical inputs are translated once; at most ``concurrency`` requests
+        (default ``MAX_CONCURRENCY``) are in flight, started no faster than ``MAX_QPS``.
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        results = await bounded_gather(
+            (self.atranslate(text, source_lang, target_lang) for text in unique_texts),
+            concurrency=concurrency or self.MAX_CONCURRENCY,
+            limiter=self._create_rate_limiter(),
+        )
+        translated = dict(zip(unique_texts, results, strict=True))
+        return [translated[text] for text in texts]
+
+    def _create_rate_limiter(self) -> AsyncRateLimiter | None:
+        return AsyncRateLimiter(self.MAX_QPS) if self.MAX_QPS else None
+
     @abstractmethod
     def is_configured(self) -> bool:
         """
@@ -46,6 +82,10 @@ class TranslationService(ABC):
         """
         ...
 
+    def close(self) -> None:
+        """Release pooled connections; services without any keep this no-op."""
+        return
+
     def get_supported_languages(self) -> list[str]:
         """
         Get list of supported language codes.
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import logging
+import threading
 import uuid
+from typing import TYPE_CHECKING
 
 import httpx
 
 from app.config.languages import CHATGPT_PROXY_LANG_MAP
 from app.services.base import TranslationService
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,8 +23,42 @@ class ChatGPTProxyService(TranslationService):
 
     API_URL = "https://mtdev.bytequests.com/v1/translation/chat-gpt"
 
-    def __init__(self, timeout: float = 1800.0) -> None:
+    def __init__(
+        self,
+        timeout: float = 1800.0,
+        http_post: Callable[..., httpx.Response] | None = None,
+    ) -> None:
         self.timeout = timeout
+        # Defaults to the pooled client's post; inject to reroute requests
+        self._http_post = http_post
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """Return the keep-alive client, created on first use.
+
+        translate_parallel sends every chunk to the same host, so reusing
+        connections skips a TCP and TLS handshake per chunk.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=httpx.Limits(max_connections=32, max_keepalive_connections=8),
+                    )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> ChatGPTProxyService:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         source_code = CHATGPT_PROXY_LANG_MAP.get(source_lang.lower(), -1)
@@ -52,7 +91,8 @@ class ChatGPTProxyService(TranslationService):
         }
 
         try:
-            response = httpx.post(self.API_URL, json=data, headers=headers, timeout=self.timeout)
+            post = self._http_post or self._get_client().post
+            response = post(self.API_URL, json=data, headers=headers, timeout=self.timeout)
         except httpx.RequestError as e:
             raise ValueError(f"ChatGPT Proxy request failed: {e}") from e
 
@@ -23,6 +23,10 @@ class DeepLService(TranslationService):
     UNOFFICIAL_API_URL = "https://www2.deepl.com/jsonrpc"
 
     _rate_limiter = RateLimiter(min_interval=1.0)
+    # The keyed API fails over to the free endpoint, which has its own retries,
+    # so one quick retry is enough here
+    _API_MAX_RETRIES = 1
+    _API_RETRY_DELAY = 0.5
 
     _SENTENCE_PATTERN = re.compile(r'^\s+|(?:\s*\n)+\s*|[.!?"\x27:;\u0964](?:\s+)|\s+$')
 
@@ -60,10 +64,14 @@ class DeepLService(TranslationService):
         if source_lang_deepl and source_lang.lower() != "auto":
             params["source_lang"] = source_lang_deepl
 
-        try:
-            response = httpx.post(url, data=params, timeout=self.timeout)
-        except httpx.RequestError as e:
-            raise ValueError(f"DeepL API request failed: {e}") from e
+        response = retry_with_backoff(
+            None,
+            lambda: httpx.post(url, data=params, timeout=self.timeout),
+            "DeepL API",
+            max_retries=self._API_MAX_RETRIES,
+            base_delay=self._API_RETRY_DELAY,
+            rate_limit_hint="Please try again later.",
+        )
 
         if response.status_code == 200:
             result = response.json()
@@ -153,12 +161,14 @@ class DeepLService(TranslationService):
 
         try:
             result = response.json()
-            if result.get("result") and result["result"].get("translations"):
+            rpc_result = result.get("result")
+            translations = rpc_result.get("translations") if rpc_result else None
+            if translations:
                 translated_sentences = []
-                for translation in result["result"]["translations"]:
-                    if translation.get("beams") and len(translation["beams"]) > 0:
-                        translated_text = translation["beams"][0].get("postprocessed_sentence", "")
-                        translated_sentences.append(translated_text)
+                for translation in translations:
+                    beams = translation.get("beams")
+                    if beams:
+                        translated_sentences.append(beams[0].get("postprocessed_sentence", ""))
                     else:
                         translated_sentences.append("")
 
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import weakref
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Any
 
 from app.config.languages import get_language_name
+from app.services._cache import SemanticCache
+from app.services._concurrency import bounded_gather
 from app.services.base import TranslationService
 
 if TYPE_CHECKING:
@@ -14,11 +19,28 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_SYSTEM_MESSAGE: dict[str, str] = {
+    "role": "system",
+    "content": "You are a professional translator. Provide accurate, natural translations. Only output the translation, nothing else.",
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _prompt_prefix(source_lang: str, target_lang: str) -> str:
+    """Instruction preceding the text, built once per language pair."""
+    source_name = get_language_name(source_lang) if source_lang != "auto" else "the source language"
+    target_name = get_language_name(target_lang)
+    return (
+        f"Translate the following text from {source_name} to {target_name}. "
+        "Be accurate and preserve meaning:\n\n"
+    )
+
 
 class LLMTranslationService(TranslationService):
     """Base for LLM-based translation services (OpenAI-compatible)."""
 
     AVAILABLE_MODELS: list[str] = []
+    EMBEDDING_MODEL: str = ""
 
     def __init__(
         self,
@@ -34,26 +56,65 @@ class LLMTranslationService(TranslationService):
         self._error_prefix = error_prefix
         self.timeout = timeout
         self._client: Any = None
+        # Async SDK clients are bound to the loop they were created on: one per loop
+        self._async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._semantic_cache: SemanticCache | None = None
+
+    def enable_semantic_cache(self, max_distance: float = 0.03) -> None:
+        """Reuse translations of near-identical texts, matched by ``EMBEDDING_MODEL`` embeddings."""
+        if not self.EMBEDDING_MODEL:
+            raise ValueError(f"{self._display_name} does not support embeddings")
+        self._semantic_cache = SemanticCache(self._embed, max_distance=max_distance)
 
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         if not self.is_configured():
             raise ValueError(f"{self._error_prefix} not configured")
 
-        source_name = (
-            get_language_name(source_lang) if source_lang != "auto" else "the source language"
-        )
-        target_name = get_language_name(target_lang)
+        prompt = self._build_prompt(text, source_lang, target_lang)
 
-        prompt = (
-            f"Translate the following text from {source_name} to {target_name}. "
-            f"Be accurate and preserve meaning:\n\n{text}"
-        )
+        if self._semantic_cache is not None:
+            return self._translate_semantic_cached(
+                self._semantic_cache, text, source_lang, target_lang, prompt
+            )
 
         try:
             return self._call_llm(prompt)
         except Exception as e:
             raise ValueError(f"{self._error_prefix} error: {e}") from e
 
+    def _translate_semantic_cached(
+        self, cache: SemanticCache, text: str, source_lang: str, target_lang: str, prompt: str
+    ) -> str:
+        try:
+            vector = cache.embed(text)
+        except Exception as e:
+            # The cache is an optimisation: an embedding failure must not fail the translation
+            logger.warning(
+                "%s embedding failed, skipping semantic cache: %s", self._display_name, e
+            )
+            vector = None
+
+        if vector is not None:
+            cached = cache.get(vector, source_lang, target_lang)
+            if cached is not None:
+                logger.debug("Semantic cache hit (%s→%s)", source_lang, target_lang)
+                return cached
+
+        try:
+            translated = self._call_llm(prompt)
+        except Exception as e:
+            raise ValueError(f"{self._error_prefix} error: {e}") from e
+
+        if vector is not None:
+            cache.put(vector, source_lang, target_lang, translated)
+        return translated
+
+    def _embed(self, text: str) -> list[float]:
+        response = self._get_client().embeddings.create(model=self.EMBEDDING_MODEL, input=text)
+        return response.data[0].embedding
+
     def _call_llm(self, prompt: str) -> str:
         client = self._get_client()
         response = client.chat.completions.create(
@@ -65,6 +126,94 @@ class LLMTranslationService(TranslationService):
         content = response.choices[0].message.content
         return content.strip() if content else ""
 
+    async def atranslate(self, text: str, source_lang: str, target_lang: str) -> str:
+        # Checked before any SDK client exists: building one without a key raises
+        if not self.is_configured():
+            raise ValueError(f"{self._error_prefix} not configured")
+
+        async_client = self._get_async_client()
+        if async_client is None or self._semantic_cache is not None:
+            # The semantic cache embeds and looks up synchronously
+            return await asyncio.to_thread(self.translate, text, source_lang, target_lang)
+
+        prompt = self._build_prompt(text, source_lang, target_lang)
+        try:
+            return await self._acall_llm(async_client, prompt)
+        except Exception as e:
+            raise ValueError(f"{self._error_prefix} error: {e}") from e
+
+    async def translate_many(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        concurrency: int | None = None,
+    ) -> list[str]:
+        """Translate several texts concurrently, preserving input order."""
+        if not self.is_configured():
+            raise ValueError(f"{self._error_prefix} not configured")
+
+        # Identical inputs are sent once and fanned back out to their positions
+        unique_texts = list(dict.fromkeys(texts))
+        results = await bounded_gather(
+            (self.atranslate(text, source_lang, target_lang) for text in unique_texts),
+            concurrency=concurrency or self.MAX_CONCURRENCY,
+            limiter=self._create_rate_limiter(),
+        )
+
+        translated = dict(zip(unique_texts, results, strict=True))
+        return [translated[text] for text in texts]
+
+    def translate_many_sync(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        concurrency: int | None = None,
+    ) -> list[str]:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop and loop.is_running():
+            return [self.translate(text, source_lang, target_lang) for text in texts]
+
+        async def run() -> list[str]:
+            # The loop dies with asyncio.run, so its client must be closed before then
+            try:
+                return await self.translate_many(texts, source_lang, target_lang, concurrency)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
+
+    async def _acall_llm(self, client: Any, prompt: str) -> str:
+        response = await client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(prompt),
+            max_tokens=2000,
+            temperature=0.3,
+        )
+        content = response.choices[0].message.content
+        return content.strip() if content else ""
+
+    def _create_async_client(self) -> Any:
+        """Async SDK client for atranslate(); None runs the sync client in threads."""
+        return None
+
+    def _get_async_client(self) -> Any:
+        loop = asyncio.get_running_loop()
+        if loop not in self._async_clients:
+            self._async_clients[loop] = self._create_async_client()
+        return self._async_clients[loop]
+
+    async def aclose(self) -> None:
+        """Close the async client of the running loop, if one was created."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
     def supports_streaming(self) -> bool:
         return True
 
@@ -78,15 +227,7 @@ class LLMTranslationService(TranslationService):
         if not self.is_configured():
             raise ValueError(f"{self._error_prefix} not configured")
 
-        source_name = (
-            get_language_name(source_lang) if source_lang != "auto" else "the source language"
-        )
-        target_name = get_language_name(target_lang)
-
-        prompt = (
-            f"Translate the following text from {source_name} to {target_name}. "
-            f"Be accurate and preserve meaning:\n\n{text}"
-        )
+        prompt = self._build_prompt(text, source_lang, target_lang)
 
         try:
             return self._call_llm_stream(prompt, on_token)
@@ -110,15 +251,18 @@ class LLMTranslationService(TranslationService):
                 on_token(token)
         return "".join(full_text).strip()
 
+    @staticmethod
+    def _build_prompt(text: str, source_lang: str, target_lang: str) -> str:
+        return _prompt_prefix(source_lang, target_lang) + text
+
     @staticmethod
     def _build_messages(prompt: str) -> list[dict[str, str]]:
-        return [
-            {
-                "role": "system",
-                "content": "You are a professional translator. Provide accurate, natural translations. Only output the translation, nothing else.",
-            },
-            {"role": "user", "content": prompt},
-        ]
+        return [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
     def _get_client(self) -> Any:
         if not self._is_available():
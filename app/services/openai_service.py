@@ -7,17 +7,22 @@ from typing import Any
 from app.services.llm_base import LLMTranslationService
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     OpenAI = None  # type: ignore[misc, assignment]
+    AsyncOpenAI = None  # type: ignore[misc, assignment]
 
 
 class OpenAIService(LLMTranslationService):
     """OpenAI GPT translation service."""
 
+    MAX_CONCURRENCY = 20
+    MAX_QPS = 50.0
+    EMBEDDING_MODEL = "text-embedding-3-small"
+
     AVAILABLE_MODELS = [
         "gpt-4.1",
         "gpt-4.1-mini",
@@ -29,7 +34,11 @@ class OpenAIService(LLMTranslationService):
     ]
 
     def __init__(
-        self, api_key: str = "", model: str = "gpt-4o-mini", timeout: float = 1800.0
+        self,
+        api_key: str = "",
+        model: str = "gpt-4o-mini",
+        timeout: float = 1800.0,
+        semantic_cache: bool = False,
     ) -> None:
         super().__init__(
             api_key=api_key,
@@ -38,9 +47,14 @@ class OpenAIService(LLMTranslationService):
             error_prefix="OpenAI API",
             timeout=timeout,
         )
+        if semantic_cache:
+            self.enable_semantic_cache()
 
     def _create_client(self) -> Any:
         return OpenAI(api_key=self.api_key, timeout=self.timeout)
 
+    def _create_async_client(self) -> Any:
+        return AsyncOpenAI(api_key=self.api_key, timeout=self.timeout)
+
     def _is_available(self) -> bool:
         return OPENAI_AVAILABLE
@@ -7,18 +7,22 @@ from typing import Any
 from app.services.llm_base import LLMTranslationService
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     OpenAI = None  # type: ignore[misc, assignment]
+    AsyncOpenAI = None  # type: ignore[misc, assignment]
 
 
 class OpenRouterService(LLMTranslationService):
     """OpenRouter API translation service (OpenAI-compatible)."""
 
     BASE_URL = "https://openrouter.ai/api/v1"
+    MAX_CONCURRENCY = 10
+    MAX_QPS = 10.0
+    EMBEDDING_MODEL = "openai/text-embedding-3-small"
 
     def __init__(
         self,
@@ -27,6 +31,7 @@ class OpenRouterService(LLMTranslationService):
         site_url: str = "",
         site_name: str = "Translator App",
         timeout: float = 1800.0,
+        semantic_cache: bool = False,
     ) -> None:
         super().__init__(
             api_key=api_key,
@@ -37,17 +42,30 @@ class OpenRouterService(LLMTranslationService):
         )
         self.site_url = site_url
         self.site_name = site_name
+        if semantic_cache:
+            self.enable_semantic_cache()
 
     def _create_client(self) -> Any:
         return OpenAI(
             base_url=self.BASE_URL,
             api_key=self.api_key,
             timeout=self.timeout,
-            default_headers={
-                "HTTP-Referer": self.site_url,
-                "X-Title": self.site_name,
-            },
+            default_headers=self._default_headers(),
         )
 
+    def _create_async_client(self) -> Any:
+        return AsyncOpenAI(
+            base_url=self.BASE_URL,
+            api_key=self.api_key,
+            timeout=self.timeout,
+            default_headers=self._default_headers(),
+        )
+
+    def _default_headers(self) -> dict[str, str]:
+        return {
+            "HTTP-Referer": self.site_url,
+            "X-Title": self.site_name,
+        }
+
     def _is_available(self) -> bool:
         return OPENAI_AVAILABLE
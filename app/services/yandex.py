@@ -1,25 +1,84 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-import uuid
+import os
+import threading
+from typing import Any
 
 import httpx
 
+from app.services._concurrency import bounded_gather
 from app.services.base import TranslationService
+from app.utils.json_helpers import loads_json
 from app.utils.rate_limiter import RateLimiter, retry_with_backoff
 
+try:
+    import h2  # noqa: F401
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _error_body(response: httpx.Response, limit: int = 512) -> str:
+    """Decode at most *limit* bytes of an error response for the exception message."""
+    return response.content[:limit].decode("utf-8", "replace")
+
+
 class YandexService(TranslationService):
     API_URL = "https://translate.api.cloud.yandex.net/translate/v2/translate"
     FREE_API_URL = "https://translate.yandex.net/api/v1/tr.json/translate"
+    # The paid API caps the total characters in one request at 10,000
+    MAX_BATCH_CHARS = 9500
+    MAX_CONCURRENCY = 10
+    MAX_QPS = 20.0
     _rate_limiter = RateLimiter(min_interval=0.5)
 
     def __init__(self, api_key: str = "", timeout: float = 1800.0) -> None:
         self.api_key = api_key
         self.timeout = timeout
-        self.uuid = str(uuid.uuid4()).replace("-", "")
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+
+    @functools.cached_property
+    def uuid(self) -> str:
+        """Client id for the free API, generated on first use (the paid path never needs it)."""
+        return os.urandom(16).hex()
+
+    def _get_client(self) -> httpx.Client:
+        """Return the pooled keep-alive client, creating it on first use.
+
+        With ``h2`` installed the client speaks HTTP/2, so concurrent
+        translate_many() requests are multiplexed over one TLS connection.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        http2=H2_AVAILABLE,
+                        timeout=self.timeout,
+                        limits=httpx.Limits(max_connections=32, max_keepalive_connections=8),
+                    )
+        return self._client
+
+    def _http_post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Single choke point for both endpoints' requests."""
+        return self._get_client().post(url, **kwargs)
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> YandexService:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         if self.api_key:
@@ -29,26 +88,93 @@ class YandexService(TranslationService):
                 logger.warning("Yandex paid API failed, falling back to free: %s", e)
         return self._translate_free(text, source_lang, target_lang)
 
+    def translate_batch(self, texts: list[str], source_lang: str, target_lang: str) -> list[str]:
+        """Translate several texts, packing them into as few paid API requests as possible."""
+        if not self.api_key:
+            return [self._translate_free(text, source_lang, target_lang) for text in texts]
+
+        results: list[str] = []
+        for batch in self._split_batches(texts):
+            try:
+                results.extend(self._translate_batch_with_api_key(batch, source_lang, target_lang))
+            except Exception as e:
+                logger.warning("Yandex paid API failed, falling back to free: %s", e)
+                results.extend(
+                    self._translate_free(text, source_lang, target_lang) for text in batch
+                )
+        return results
+
+    async def translate_many(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        concurrency: int | None = None,
+    ) -> list[str]:
+        if not self.api_key:
+            return await super().translate_many(texts, source_lang, target_lang, concurrency)
+
+        unique_texts = list(dict.fromkeys(texts))
+        batch_results = await bounded_gather(
+            (
+                asyncio.to_thread(self.translate_batch, batch, source_lang, target_lang)
+                for batch in self._split_batches(unique_texts)
+            ),
+            concurrency=concurrency or self.MAX_CONCURRENCY,
+            limiter=self._create_rate_limiter(),
+        )
+        results = [result for batch in batch_results for result in batch]
+        translated = dict(zip(unique_texts, results, strict=True))
+        return [translated[text] for text in texts]
+
+    @classmethod
+    def _split_batches(cls, texts: list[str]) -> list[list[str]]:
+        """Group texts greedily so each request stays under the per-request character limit."""
+        batches: list[list[str]] = []
+        current: list[str] = []
+        size = 0
+        for text in texts:
+            if current and size + len(text) > cls.MAX_BATCH_CHARS:
+                batches.append(current)
+                current = []
+                size = 0
+            current.append(text)
+            size += len(text)
+        if current:
+            batches.append(current)
+        return batches
+
     def _translate_with_api_key(self, text: str, source_lang: str, target_lang: str) -> str:
+        return self._translate_batch_with_api_key([text], source_lang, target_lang)[0]
+
+    def _translate_batch_with_api_key(
+        self, texts: list[str], source_lang: str, target_lang: str
+    ) -> list[str]:
         headers = {
             "Authorization": f"Api-Key {self.api_key}",
             "Content-Type": "application/json",
         }
         data: dict[str, str | list[str]] = {
-            "texts": [text],
+            "texts": texts,
             "targetLanguageCode": target_lang,
         }
         if source_lang.lower() != "auto":
             data["sourceLanguageCode"] = source_lang
 
         try:
-            response = httpx.post(self.API_URL, headers=headers, json=data, timeout=self.timeout)
+            response = self._http_post(self.API_URL, headers=headers, json=data)
         except httpx.RequestError as e:
             raise ValueError(f"Yandex API request failed: {e}") from e
 
-        if response.status_code == 200:
-            return response.json()["translations"][0]["text"]
-        raise ValueError(f"Yandex API error {response.status_code}: {response.text}")
+        if response.status_code != 200:
+            raise ValueError(f"Yandex API error {response.status_code}: {_error_body(response)}")
+
+        translations = [item["text"] for item in loads_json(response.content)["translations"]]
+        if len(translations) != len(texts):
+            raise ValueError(
+                f"Yandex API returned {len(translations)} translations for {len(texts)} texts"
+            )
+        return translations
 
     def _translate_free(self, text: str, source_lang: str, target_lang: str) -> str:
         source_code = source_lang.lower() if source_lang.lower() != "auto" else ""
@@ -70,16 +196,16 @@ class YandexService(TranslationService):
 
         response = retry_with_backoff(
             self._rate_limiter,
-            lambda: httpx.post(
-                self.FREE_API_URL, params=params, data=data, headers=headers, timeout=self.timeout
-            ),
+            lambda: self._http_post(self.FREE_API_URL, params=params, data=data, headers=headers),
             "Yandex free API",
         )
 
         if response.status_code != 200:
-            raise ValueError(f"Yandex free API HTTP error {response.status_code}: {response.text}")
+            raise ValueError(
+                f"Yandex free API HTTP error {response.status_code}: {_error_body(response)}"
+            )
 
-        result = response.json()
+        result = loads_json(response.content)
         if result.get("code") == 200:
             return "\n".join(result.get("text", []))
         raise ValueError(f"Yandex free API error: {result.get('message', 'Unknown error')}")
@@ -6,14 +6,79 @@ import json
 import logging
 import re
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from app.utils.json_helpers import dumps_json, loads_json
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+def _trie_to_regex(node: dict[str, Any], replacements: list[str]) -> str:
+    """Render a term trie as one regex with shared prefixes factored out.
+
+    A flat ``a|b|c`` alternation makes ``re`` try every term at every position;
+    the trie form only follows branches whose next character matches. Each
+    term ends in an empty group, appended to *replacements* in group order,
+    and sits after the longer continuations so the longest term wins.
+    """
+    branches = [
+        re.escape(char) + _trie_to_regex(child, replacements)
+        for char, child in node.items()
+        if char
+    ]
+    if "" in node:
+        replacements.append(node[""])
+        branches.append("()")
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+def _fold_case(term: str) -> str:
+    """Lowercase *term* per character so IGNORECASE variants share trie branches.
+
+    Characters whose lowercase form is longer (e.g. "İ") are kept as-is, since
+    ``re.IGNORECASE`` only pairs single code points.
+    """
+    return "".join(low if len(low := char.lower()) == 1 else char for char in term)
+
+
 class Glossary:
     """Manages a glossary of terms for post-translation replacement."""
 
     def __init__(self, glossary_path: str | Path | None = None) -> None:
+        self._setup(glossary_path)
+        self.load()
+
+    @classmethod
+    def from_dict(
+        cls,
+        entries: Mapping[str, str],
+        case_sensitive: bool = False,
+        glossary_path: str | Path | None = None,
+    ) -> Glossary:
+        """Build a glossary from in-memory entries without reading *glossary_path*.
+
+        The path is only used by a later save().
+        """
+        glossary = cls.__new__(cls)
+        glossary._setup(glossary_path)
+        glossary._entries = dict(entries)
+        glossary._case_sensitive = case_sensitive
+        return glossary
+
+    def _setup(self, glossary_path: str | Path | None) -> None:
         if glossary_path is None:
             self.glossary_path = Path("glossary.json")
         else:
@@ -21,32 +86,49 @@ class Glossary:
 
         self._entries: dict[str, str] = {}
         self._case_sensitive: bool = False
-        self.load()
+        self._compiled: tuple[re.Pattern[str], list[str]] | None = None
+        self._automaton: Any = None
+        self._prefilter: re.Pattern[str] | None = None
 
     def load(self) -> None:
-        if self.glossary_path.exists():
-            try:
-                with open(self.glossary_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        self._entries = data.get("entries", {})
-                        self._case_sensitive = data.get("case_sensitive", False)
-                    else:
-                        self._entries = data
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning("Failed to load glossary from %s: %s", self.glossary_path, e)
-                self._entries = {}
+        self._invalidate()
+        self._entries = {}
+        # Read straight away rather than exists() + open(): one stat, no TOCTOU window
+        try:
+            raw = self.glossary_path.read_bytes()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning("Failed to load glossary from %s: %s", self.glossary_path, e)
+            return
+
+        try:
+            self.load_from_string(raw)
+        except json.JSONDecodeError as e:
+            logger.warning("Failed to load glossary from %s: %s", self.glossary_path, e)
+
+    def load_from_string(self, data: str | bytes) -> None:
+        """Replace the entries with a document produced by _serialize()."""
+        self._invalidate()
+        self._entries = {}
+        parsed = loads_json(data)
+
+        if isinstance(parsed, dict):
+            self._entries = parsed.get("entries", {})
+            self._case_sensitive = parsed.get("case_sensitive", False)
         else:
-            self._entries = {}
+            self._entries = parsed
 
-    def save(self) -> None:
+    def _serialize(self) -> bytes:
         data = {
             "entries": self._entries,
             "case_sensitive": self._case_sensitive,
         }
+        return dumps_json(data, indent=True)
+
+    def save(self) -> None:
         try:
-            with open(self.glossary_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.glossary_path.write_bytes(self._serialize())
         except OSError as e:
             raise ValueError(f"Failed to save glossary: {e}") from e
 
@@ -54,47 +136,136 @@ class Glossary:
         if not original or not replacement:
             raise ValueError("Both original and replacement must be non-empty")
         self._entries[original] = replacement
+        self._invalidate()
 
     def remove_entry(self, original: str) -> bool:
         if original in self._entries:
             del self._entries[original]
+            self._invalidate()
             return True
         return False
 
     def get_entry(self, original: str) -> str | None:
         return self._entries.get(original)
 
-    def get_all_entries(self) -> dict[str, str]:
-        return self._entries.copy()
+    def get_all_entries(self) -> Mapping[str, str]:
+        """Read-only view of the entries; use export_to_dict() for a detached copy."""
+        return MappingProxyType(self._entries)
 
     def set_entries(self, entries: dict[str, str]) -> None:
         self._entries = entries.copy()
+        self._invalidate()
 
     def clear(self) -> None:
         self._entries.clear()
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._compiled = None
+        self._automaton = None
+        self._prefilter = None
+
+    def _rebuild_prefilter(self) -> re.Pattern[str]:
+        # A regex character class (not a set of chars) so IGNORECASE equivalences
+        # such as "ſ"/"s" are honoured exactly like in the main pattern.
+        first_chars = sorted({original[0] for original in self._entries if original})
+        source = "[" + "".join(re.escape(c) for c in first_chars) + "]" if first_chars else "(?!)"
+        flags = 0 if self._case_sensitive else re.IGNORECASE
+        self._prefilter = re.compile(source, flags)
+        return self._prefilter
+
+    def _rebuild_compiled(self) -> tuple[re.Pattern[str], list[str]]:
+        trie: dict[str, Any] = {}
+        for original, replacement in self._entries.items():
+            if not original:
+                continue
+            # Case variants of one term must share a path, or a shorter term spelled
+            # differently could match ahead of a longer one; the first entry wins
+            term = original if self._case_sensitive else _fold_case(original)
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node.setdefault("", replacement)
+
+        replacements: list[str] = []
+        source = _trie_to_regex(trie, replacements) if trie else "(?!)"
+        flags = 0 if self._case_sensitive else re.IGNORECASE
+        self._compiled = (re.compile(source, flags), replacements)
+        return self._compiled
+
+    def _rebuild_automaton(self) -> Any:
+        automaton = ahocorasick.Automaton()
+        for original, replacement in self._entries.items():
+            if original:
+                automaton.add_word(original, (len(original), replacement))
+        automaton.make_automaton()
+        self._automaton = automaton
+        return automaton
+
+    def _apply_automaton_into(self, text: str, out: list[str]) -> None:
+        automaton = self._automaton if self._automaton is not None else self._rebuild_automaton()
+        if automaton.kind != ahocorasick.AHOCORASICK:
+            out.append(text)
+            return
+
+        # Leftmost-longest, non-overlapping — the same matches the alternation regex picks
+        matches = sorted(
+            (
+                (end - length + 1, length, replacement)
+                for end, (length, replacement) in automaton.iter(text)
+            ),
+            key=lambda m: (m[0], -m[1]),
+        )
+        pos = 0
+        for start, length, replacement in matches:
+            if start < pos:
+                continue
+            out.append(text[pos:start])
+            out.append(replacement)
+            pos = start + length
+        out.append(text[pos:])
 
     def apply(self, text: str) -> str:
-        if not self._entries:
-            return text
+        out: list[str] = []
+        self.apply_into(text, out)
+        return out[0] if len(out) == 1 else "".join(out)
 
-        result = text
+    def apply_into(self, text: str, out: list[str]) -> None:
+        """Append *text* with terms replaced to *out* as unchanged spans and replacements.
+
+        Lets callers assembling a document join everything once instead of
+        building an intermediate string per chunk.
+        """
+        if not self._entries:
+            out.append(text)
+            return
 
-        sorted_entries = sorted(self._entries.items(), key=lambda x: len(x[0]), reverse=True)
+        # Most chunks contain no glossary term at all: skip them with one char-class scan
+        prefilter = self._prefilter if self._prefilter is not None else self._rebuild_prefilter()
+        if prefilter.search(text) is None:
+            out.append(text)
+            return
 
-        for original, replacement in sorted_entries:
-            if self._case_sensitive:
-                result = result.replace(original, replacement)
-            else:
-                pattern = re.compile(re.escape(original), re.IGNORECASE)
-                result = pattern.sub(replacement, result)
+        if self._case_sensitive and AHOCORASICK_AVAILABLE:
+            self._apply_automaton_into(text, out)
+            return
 
-        return result
+        pattern, replacements = (
+            self._compiled if self._compiled is not None else self._rebuild_compiled()
+        )
+        pos = 0
+        for match in pattern.finditer(text):
+            out.append(text[pos : match.start()])
+            out.append(replacements[(match.lastindex or 1) - 1])
+            pos = match.end()
+        out.append(text[pos:])
 
     def is_case_sensitive(self) -> bool:
         return self._case_sensitive
 
     def set_case_sensitive(self, value: bool) -> None:
         self._case_sensitive = value
+        self._invalidate()
 
     def import_from_dict(self, data: dict[str, str]) -> int:
         count = 0
@@ -102,6 +273,7 @@ class Glossary:
             if original and replacement:
                 self._entries[original] = replacement
                 count += 1
+        self._invalidate()
         return count
 
     def export_to_dict(self) -> dict[str, str]:
@@ -5,6 +5,13 @@ from __future__ import annotations
 import json
 from typing import Any
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def parse_json_response(response: str) -> Any:
     """Strip markdown fences from LLM response and parse JSON."""
@@ -15,4 +22,18 @@ def parse_json_response(response: str) -> Any:
         response = response[3:]
     if response.endswith("```"):
         response = response[:-3]
-    return json.loads(response.strip())
+    return loads_json(response.strip())
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON with orjson when installed. Errors are json.JSONDecodeError."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (non-ASCII kept as-is), via orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
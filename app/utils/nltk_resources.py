@@ -0,0 +1,47 @@
+"""Background download of the NLTK data used for sentence splitting."""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+
+NLTK_RESOURCES = ("punkt", "punkt_tab")
+
+# Cleared while a download is in flight; sentence splitting falls back to the
+# simple tokenizer until it is set again.
+nltk_ready = threading.Event()
+nltk_ready.set()
+
+# Set once sentence splitting finds the tokenizer data missing, so later calls skip
+# NLTK's data-path search; the next download attempt clears it.
+nltk_missing = threading.Event()
+
+
+def download_nltk_resources() -> None:
+    """Fetch missing tokenizer data; resources already on disk cost no network I/O."""
+    try:
+        import nltk
+    except ImportError:
+        nltk_ready.set()
+        return
+
+    try:
+        for resource in NLTK_RESOURCES:
+            try:
+                nltk.data.find(f"tokenizers/{resource}")
+                continue
+            except LookupError:
+                pass
+            with contextlib.suppress(Exception):
+                nltk.download(resource, quiet=True)
+    finally:
+        nltk_missing.clear()
+        nltk_ready.set()
+
+
+def start_nltk_download() -> threading.Thread:
+    """Run download_nltk_resources() in a daemon thread and return it."""
+    nltk_ready.clear()
+    thread = threading.Thread(target=download_nltk_resources, name="nltk-download", daemon=True)
+    thread.start()
+    return thread
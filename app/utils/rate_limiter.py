@@ -42,15 +42,17 @@ class RateLimiter:
 
 
 def retry_with_backoff(
-    rate_limiter: RateLimiter,
+    rate_limiter: RateLimiter | None,
     request_fn: Callable[[], httpx.Response],
     service_name: str,
     max_retries: int = 3,
     base_delay: float = 2.0,
+    rate_limit_hint: str = "Please try again later or use an API key.",
 ) -> httpx.Response:
-    """Execute request_fn with rate limiting, retry on errors and 429s."""
+    """Execute request_fn with optional rate limiting, retry on errors and 429s."""
     for attempt in range(max_retries + 1):
-        rate_limiter.wait()
+        if rate_limiter is not None:
+            rate_limiter.wait()
         try:
             response = request_fn()
         except httpx.RequestError as e:
@@ -74,9 +76,7 @@ def retry_with_backoff(
                 )
                 time.sleep(delay)
                 continue
-            raise ValueError(
-                f"{service_name} rate limit exceeded. Please try again later or use an API key."
-            )
+            raise ValueError(f"{service_name} rate limit exceeded. {rate_limit_hint}")
 
         return response
 
@@ -11,26 +11,14 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 
-def download_nltk_resources() -> None:
-    import contextlib
-
-    try:
-        import nltk
-
-        resources = ["punkt", "punkt_tab"]
-        for resource in resources:
-            with contextlib.suppress(Exception):
-                nltk.download(resource, quiet=True)
-    except ImportError:
-        pass
-
-
 def main() -> None:
     from app.utils.logging import setup_logging
+    from app.utils.nltk_resources import start_nltk_download
 
     setup_logging()
 
-    download_nltk_resources()
+    # Check NLTK data in the background while the CLI or GUI modules are imported
+    nltk_thread = start_nltk_download()
 
     if len(sys.argv) > 1 and sys.argv[1] in (
         "translate",
@@ -49,10 +37,13 @@ def main() -> None:
     ):
         from app.cli import run_cli
 
+        # The CLI splits text right away, so it needs the tokenizer data before running
+        nltk_thread.join()
         run_cli()
     else:
         from app.gui.main_window import MainWindow
 
+        # The tokenizer is only needed once a translation starts: don't block the window on it
         app = MainWindow()
         app.run()
 
@@ -0,0 +1 @@
+"""Micro-benchmarks for the hot translation paths."""
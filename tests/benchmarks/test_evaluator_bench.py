@@ -0,0 +1,43 @@
+"""Benchmarks for AI evaluator prompt building and response parsing."""
+
+from __future__ import annotations
+
+import json
+import types
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.services.ai_evaluator import AIEvaluator
+
+pytest.importorskip("pytest_benchmark")
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+# About 25 KB: 100 services with 200-character explanations
+_EVAL_PAYLOAD = json.dumps(
+    {
+        "evaluations": [
+            {"service": f"s{i}", "score": 5, "explanation": "x" * 200} for i in range(100)
+        ]
+    }
+)
+_TRANSLATIONS = {f"service{i}": f"Перевод номер {i}. " * 5 for i in range(50)}
+
+
+@pytest.fixture(scope="module")
+def evaluator() -> AIEvaluator:
+    return AIEvaluator(types.SimpleNamespace(is_configured=lambda: True))
+
+
+def test_parse_evaluation_response(benchmark: BenchmarkFixture, evaluator: AIEvaluator) -> None:
+    results = benchmark(evaluator._parse_evaluation_response, _EVAL_PAYLOAD, "ts")
+    assert len(results) == 100
+
+
+def test_create_improvement_prompt(benchmark: BenchmarkFixture, evaluator: AIEvaluator) -> None:
+    prompt = benchmark(
+        evaluator._create_improvement_prompt, "Hello world", _TRANSLATIONS, "en", "ru", True
+    )
+    assert "service49" in prompt
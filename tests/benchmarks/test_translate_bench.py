@@ -0,0 +1,109 @@
+"""Benchmarks for service translate paths against mocked endpoints."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Generator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+import respx
+
+from app.core.translator import SimpleTokenizer
+from app.services.ai_evaluator import _RENPY_RE
+from app.services.deepl import DeepLService
+from app.services.yandex import YandexService
+from app.utils.glossary import Glossary
+from app.utils.rate_limiter import RateLimiter
+
+pytest.importorskip("pytest_benchmark")
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+_ROUNDS = 200
+_TEXT = "Hello world. How are you? " * 20
+_SENTENCES = len(DeepLService()._parse_text(_TEXT)) // 2
+
+_FREE_BODY = json.dumps(
+    {
+        "result": {
+            "translations": [
+                {"beams": [{"postprocessed_sentence": "Привет мир."}]} for _ in range(_SENTENCES)
+            ]
+        }
+    }
+).encode()
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@pytest.fixture(scope="module")
+def router() -> Generator[respx.MockRouter, None, None]:
+    with respx.mock(assert_all_called=False) as router:
+        router.post(DeepLService.UNOFFICIAL_API_URL).mock(
+            return_value=httpx.Response(200, content=_FREE_BODY, headers=_JSON_HEADERS)
+        )
+        router.post(YandexService.API_URL).mock(
+            return_value=httpx.Response(
+                200,
+                content=json.dumps(
+                    {"translations": [{"text": "Привет"} for _ in range(50)]}
+                ).encode(),
+                headers=_JSON_HEADERS,
+            )
+        )
+        yield router
+
+
+@pytest.fixture
+def no_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Drop the free endpoint's one-second spacing; only our own code is timed."""
+    monkeypatch.setattr(DeepLService, "_rate_limiter", RateLimiter(min_interval=0.0))
+
+
+def test_deepl_free_translate(
+    benchmark: BenchmarkFixture, router: respx.MockRouter, no_rate_limit: None
+) -> None:
+    service = DeepLService(api_key="")
+    result = benchmark.pedantic(
+        service.translate, args=(_TEXT, "en", "ru"), rounds=_ROUNDS, iterations=1
+    )
+    assert result.startswith("Привет мир.")
+
+
+def test_deepl_parse_text(benchmark: BenchmarkFixture) -> None:
+    service = DeepLService(api_key="")
+    segments = benchmark(service._parse_text, _TEXT)
+    assert segments
+
+
+def test_yandex_batch_translate(benchmark: BenchmarkFixture, router: respx.MockRouter) -> None:
+    service = YandexService(api_key="test_key")
+    texts = [f"Hello {i}" for i in range(50)]
+    result = benchmark.pedantic(
+        service.translate_batch, args=(texts, "en", "ru"), rounds=_ROUNDS, iterations=1
+    )
+    assert len(result) == 50
+
+
+def test_glossary_apply(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    glossary = Glossary(tmp_path / "glossary.json")
+    for i in range(200):
+        glossary.add_entry(f"term{i}", f"термин{i}")
+    text = " ".join(f"term{i} and more words" for i in range(200))
+    result = benchmark(glossary.apply, text)
+    assert "термин0" in result
+
+
+def test_renpy_dialogue_match(benchmark: BenchmarkFixture) -> None:
+    lines = [f'    eileen "Line {i}"' if i % 2 else f"Plain line {i}" for i in range(10_000)]
+    matched = benchmark(lambda: sum(1 for line in lines if _RENPY_RE.match(line)))
+    assert matched == 5_000
+
+
+def test_simple_sent_tokenize(benchmark: BenchmarkFixture) -> None:
+    text = "Pi is 3.14 here. How are you? " * 2_000
+    sentences = benchmark(SimpleTokenizer.sent_tokenize, text)
+    assert len(sentences) == 4_000
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import copy
+import io
 import json
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 @pytest.fixture(autouse=True)
 def _clear_lang_cache() -> Generator[None, None, None]:
@@ -21,6 +27,19 @@ def _clear_lang_cache() -> Generator[None, None, None]:
     LanguageDetector.clear_cache()
 
 
+@pytest.fixture(autouse=True)
+def _reset_nltk_missing() -> Generator[None, None, None]:
+    """Forget NLTK state (missing-data verdict, cached splits) from a previous test."""
+    from app.core.translator import _punkt_tokenize
+    from app.utils.nltk_resources import nltk_missing
+
+    nltk_missing.clear()
+    _punkt_tokenize.cache_clear()
+    yield
+    nltk_missing.clear()
+    _punkt_tokenize.cache_clear()
+
+
 @pytest.fixture(autouse=True)
 def _isolate_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Ensure tests don't read/write the real cache.json."""
@@ -64,6 +83,12 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
+@pytest.fixture(scope="session")
+def shared_temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One directory for single-file tests; give each file a unique name."""
+    return tmp_path_factory.mktemp("fp_tests")
+
+
 @pytest.fixture
 def temp_config(temp_dir: Path) -> Path:
     """Create a temporary config file."""
@@ -84,17 +109,17 @@ def temp_config(temp_dir: Path) -> Path:
     return config_path
 
 
+@pytest.fixture(scope="session")
+def glossary_entries() -> Mapping[str, str]:
+    """Entries of the sample glossary, read-only so the session can share them."""
+    return MappingProxyType({"Hello": "Привет", "world": "мир"})
+
+
 @pytest.fixture
-def temp_glossary(temp_dir: Path) -> Path:
+def temp_glossary(temp_dir: Path, glossary_entries: Mapping[str, str]) -> Path:
     """Create a temporary glossary file."""
     glossary_path = temp_dir / "glossary.json"
-    glossary = {
-        "entries": {
-            "Hello": "Привет",
-            "world": "мир",
-        },
-        "case_sensitive": False,
-    }
+    glossary = {"entries": dict(glossary_entries), "case_sensitive": False}
     with open(glossary_path, "w", encoding="utf-8") as f:
         json.dump(glossary, f)
     return glossary_path
@@ -108,7 +133,7 @@ def sample_txt_file(temp_dir: Path) -> Path:
     return file_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rpy_content() -> bytes:
     """Sample Ren'Py file content."""
     return b"""
@@ -128,25 +153,139 @@ label start:
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def blank_pdf_bytes() -> bytes:
+    """A one-page PDF with no text."""
+    import pypdf
+
+    pdf_writer = pypdf.PdfWriter()
+    pdf_writer.add_blank_page(width=200, height=200)
+    output = io.BytesIO()
+    pdf_writer.write(output)
+    return output.getvalue()
+
+
+def _docx_bytes(*paragraphs: str) -> bytes:
+    from docx import Document
+
+    doc = Document()
+    for paragraph in paragraphs:
+        doc.add_paragraph(paragraph)
+    output = io.BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+
+@pytest.fixture(scope="session")
+def simple_docx_bytes() -> bytes:
+    """DOCX with two paragraphs."""
+    return _docx_bytes("Hello, world!", "This is a test document.")
+
+
+@pytest.fixture(scope="session")
+def empty_docx_bytes() -> bytes:
+    """DOCX with no paragraphs."""
+    return _docx_bytes()
+
+
+@pytest.fixture(scope="session")
+def multi_para_docx_bytes() -> bytes:
+    """DOCX with paragraphs "Paragraph 0" to "Paragraph 4"."""
+    return _docx_bytes(*(f"Paragraph {i}" for i in range(5)))
+
+
+@pytest.fixture(scope="session")
+def pptx_template() -> Any:
+    """The default python-pptx template, unzipped and parsed once."""
+    import pptx
+
+    return pptx.Presentation()
+
+
+def _pptx_bytes(template: Any, *titles: str) -> bytes:
+    # Work on a copy so the shared template never gains slides
+    presentation = copy.deepcopy(template)
+    for title in titles:
+        slide = presentation.slides.add_slide(presentation.slide_layouts[0])
+        slide.shapes.title.text = title
+    output = io.BytesIO()
+    presentation.save(output)
+    return output.getvalue()
+
+
+@pytest.fixture(scope="session")
+def simple_pptx_bytes(pptx_template: Any) -> bytes:
+    """PPTX with a single title slide."""
+    return _pptx_bytes(pptx_template, "Test Presentation")
+
+
+@pytest.fixture(scope="session")
+def multi_slide_pptx_bytes(pptx_template: Any) -> bytes:
+    """PPTX with title slides "Slide 0" to "Slide 2"."""
+    return _pptx_bytes(pptx_template, *(f"Slide {i}" for i in range(3)))
+
+
+@pytest.fixture(scope="session")
+def empty_pptx_bytes(pptx_template: Any) -> bytes:
+    """PPTX with no slides."""
+    return _pptx_bytes(pptx_template)
+
+
+def _xlsx_bytes(sheets: dict[str, list[list[Any]]]) -> bytes:
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for title, rows in sheets.items():
+        sheet = workbook.create_sheet(title)
+        for row in rows:
+            sheet.append(row)
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+@pytest.fixture(scope="session")
+def simple_xlsx_bytes() -> bytes:
+    """XLSX with one sheet of two columns."""
+    return _xlsx_bytes({"Sheet1": [["A", "B"], [1, "x"], [2, "y"], [3, "z"]]})
+
+
+@pytest.fixture(scope="session")
+def multi_sheet_xlsx_bytes() -> bytes:
+    """XLSX with sheets "Sheet1" and "Sheet2"."""
+    return _xlsx_bytes({"Sheet1": [["A"], [1], [2]], "Sheet2": [["B"], [3], [4]]})
+
+
+@pytest.fixture(scope="session")
+def empty_xlsx_bytes() -> bytes:
+    """XLSX with an empty sheet."""
+    return _xlsx_bytes({"Sheet1": []})
+
+
+@pytest.fixture(scope="session")
 def mock_deepl_response() -> dict[str, Any]:
-    """Mock DeepL API response."""
+    """Mock DeepL API response.
+
+    The mock response fixtures are session-scoped; tests only hand them to
+    ``httpx.Response(json=...)`` and must not mutate them.
+    """
     return {"translations": [{"text": "Привет, мир!"}]}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_yandex_response() -> dict[str, Any]:
     """Mock Yandex API response."""
     return {"translations": [{"text": "Привет, мир!"}]}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_google_response() -> dict[str, Any]:
     """Mock Google API response."""
     return {"data": {"translations": [{"translatedText": "Привет, мир!"}]}}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_chatgpt_proxy_response() -> dict[str, Any]:
     """Mock ChatGPT Proxy response."""
     return {"response": {"translated_text": "Привет, мир!"}}
@@ -0,0 +1,58 @@
+"""Lightweight stand-ins for third-party SDK clients."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+
+class FakeOpenAIClient:
+    """Just enough of the OpenAI SDK client for ``chat.completions.create()``.
+
+    Set ``reply`` to the completion text, to an exception to raise it, or to a
+    callable building the text from the request; ``requests`` holds the keyword
+    arguments of every call and ``last_request`` those of the latest one.
+    """
+
+    def __init__(self) -> None:
+        self.reply: str | Exception | Callable[[dict[str, Any]], str] = ""
+        self.requests: list[dict[str, Any]] = []
+        self.last_request: dict[str, Any] = {}
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs: Any) -> SimpleNamespace:
+        self.requests.append(kwargs)
+        self.last_request = kwargs
+        if isinstance(self.reply, Exception):
+            raise self.reply
+        content = self.reply(kwargs) if callable(self.reply) else self.reply
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeAsyncOpenAIClient(FakeOpenAIClient):
+    """The ``AsyncOpenAI`` counterpart: awaitable ``create()`` and ``close()``.
+
+    ``closed`` counts the ``close()`` calls.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.closed = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._acreate))
+
+    async def _acreate(self, **kwargs: Any) -> SimpleNamespace:
+        return self._create(**kwargs)
+
+    async def close(self) -> None:
+        self.closed += 1
+
+
+def api_error(message: str = "API Error") -> Exception:
+    """A fresh SDK failure per call, so no traceback leaks between tests."""
+    return Exception(message)
+
+
+def raise_api_error(**kwargs: Any) -> Any:
+    """Drop-in for an SDK ``create()`` method that always fails."""
+    raise api_error()
@@ -0,0 +1,46 @@
+"""Shared fixtures for service tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+
+import httpx
+import pytest
+import respx
+
+from tests.services._fakes import FakeOpenAIClient
+
+# (method, url, canned response)
+RouteSpec = tuple[str, str, httpx.Response]
+
+
+@pytest.fixture(scope="module")
+def _module_router() -> Generator[respx.MockRouter, None, None]:
+    """One respx router patched into httpx for the whole test module."""
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
+@pytest.fixture
+def router(_module_router: respx.MockRouter) -> respx.MockRouter:
+    """The module router with the previous test's routes and calls cleared."""
+    _module_router.clear()
+    _module_router.reset()
+    return _module_router
+
+
+@pytest.fixture
+def register_routes(router: respx.MockRouter) -> Callable[..., None]:
+    """Register several canned ``(method, url, response)`` routes in one call."""
+
+    def register(*routes: RouteSpec) -> None:
+        for method, url, response in routes:
+            router.route(method=method, url=url).mock(return_value=response)
+
+    return register
+
+
+@pytest.fixture
+def openai_client() -> FakeOpenAIClient:
+    """A fresh fake OpenAI-style SDK client."""
+    return FakeOpenAIClient()
@@ -22,12 +22,21 @@ class TestChatGPTProxyService:
         service = ChatGPTProxyService()
         assert service.get_name() == "ChatGPT Proxy"
 
-    def test_supported_languages(self) -> None:
+    @pytest.mark.parametrize("language", ["en", "ru", "de"])
+    def test_supported_languages(self, language: str) -> None:
+        assert language in ChatGPTProxyService().get_supported_languages()
+
+    def test_client_is_reused(self) -> None:
         service = ChatGPTProxyService()
-        languages = service.get_supported_languages()
-        assert "en" in languages
-        assert "ru" in languages
-        assert "de" in languages
+        client = service._get_client()
+        assert service._get_client() is client
+        service.close()
+        assert client.is_closed
+
+    def test_context_manager_closes_client(self) -> None:
+        with ChatGPTProxyService() as service:
+            client = service._get_client()
+        assert client.is_closed
 
     @respx.mock
     def test_translate_success(self, mock_chatgpt_proxy_response: dict[str, Any]) -> None:
@@ -56,9 +65,8 @@ class TestChatGPTProxyService:
         )
 
         service = ChatGPTProxyService()
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="ChatGPT Proxy error"):
             service.translate("Hello", "en", "ru")
-        assert "ChatGPT Proxy error" in str(exc_info.value)
 
     @respx.mock
     def test_translate_unexpected_response(self) -> None:
@@ -67,12 +75,10 @@ class TestChatGPTProxyService:
         )
 
         service = ChatGPTProxyService()
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Unexpected response"):
             service.translate("Hello", "en", "ru")
-        assert "Unexpected response" in str(exc_info.value)
 
     def test_unsupported_target_language(self) -> None:
         service = ChatGPTProxyService()
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="does not support"):
             service.translate("Hello", "en", "xyz")
-        assert "does not support" in str(exc_info.value)
@@ -2,100 +2,87 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from app.services.claude import ClaudeService
+from tests.services._fakes import raise_api_error
 
 
-class TestClaudeService:
-    """Tests for ClaudeService class."""
+@pytest.fixture(scope="module")
+def anthropic_available() -> Generator[MagicMock, None, None]:
+    """Patch the SDK in once for the whole module; tests inject their own client."""
+    with (
+        patch("app.services.claude.ANTHROPIC_AVAILABLE", True),
+        patch("app.services.claude.Anthropic") as mock_anthropic_class,
+    ):
+        yield mock_anthropic_class
 
-    def test_not_configured_without_key(self) -> None:
-        service = ClaudeService(api_key="")
-        assert service.is_configured() is False
 
-    def test_configured_with_key(self) -> None:
-        service = ClaudeService(api_key="test_key")
-        assert service.api_key == "test_key"
+@pytest.fixture
+def mock_client(anthropic_available: MagicMock) -> MagicMock:
+    """Fresh SDK client handed out by the patched constructor."""
+    client = MagicMock()
+    anthropic_available.return_value = client
+    return client
 
-    def test_get_name(self) -> None:
-        service = ClaudeService(api_key="test_key", model="claude-sonnet-4-6")
-        assert "claude-sonnet-4-6" in service.get_name()
-        assert "Claude" in service.get_name()
 
-    def test_available_models(self) -> None:
-        assert "claude-sonnet-4-6" in ClaudeService.AVAILABLE_MODELS
-        assert "claude-haiku-4-5-20251001" in ClaudeService.AVAILABLE_MODELS
-        assert "claude-3-5-sonnet-20241022" in ClaudeService.AVAILABLE_MODELS
+@pytest.fixture(scope="class")
+def configured_service() -> ClaudeService:
+    return ClaudeService(api_key="test_key", model="claude-sonnet-4-6")
 
-    def test_translate_without_key(self) -> None:
-        service = ClaudeService(api_key="")
-        with pytest.raises(ValueError) as exc_info:
-            service.translate("Hello", "en", "ru")
-        assert "not set" in str(exc_info.value) or "not configured" in str(exc_info.value)
 
-    @patch("app.services.claude.ANTHROPIC_AVAILABLE", True)
-    @patch("app.services.claude.Anthropic")
-    def test_translate_success(self, mock_anthropic_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_anthropic_class.return_value = mock_client
+@pytest.fixture(scope="class")
+def unconfigured_service() -> ClaudeService:
+    return ClaudeService(api_key="")
 
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock()]
-        mock_response.content[0].text = "Привет, мир!"
-        mock_client.messages.create.return_value = mock_response
 
-        service = ClaudeService(api_key="test_key")
-        service._client = mock_client
+class TestClaudeService:
+    """Tests for ClaudeService class."""
 
-        result = service.translate("Hello, world!", "en", "ru")
-        assert result == "Привет, мир!"
+    def test_not_configured_without_key(self, unconfigured_service: ClaudeService) -> None:
+        assert unconfigured_service.is_configured() is False
 
-    @patch("app.services.claude.ANTHROPIC_AVAILABLE", True)
-    @patch("app.services.claude.Anthropic")
-    def test_translate_with_auto_detect(self, mock_anthropic_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_anthropic_class.return_value = mock_client
+    def test_configured_with_key(self, configured_service: ClaudeService) -> None:
+        assert configured_service.api_key == "test_key"
 
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock()]
-        mock_response.content[0].text = "Привет!"
-        mock_client.messages.create.return_value = mock_response
+    def test_get_name(self, configured_service: ClaudeService) -> None:
+        assert configured_service.get_name() == "Claude (claude-sonnet-4-6)"
 
-        service = ClaudeService(api_key="test_key")
-        service._client = mock_client
+    @pytest.mark.parametrize(
+        "model", ["claude-sonnet-4-6", "claude-haiku-4-5-20251001", "claude-3-5-sonnet-20241022"]
+    )
+    def test_available_models(self, model: str) -> None:
+        assert model in ClaudeService.AVAILABLE_MODELS
 
-        result = service.translate("Hello!", "auto", "ru")
-        assert result == "Привет!"
+    @pytest.mark.parametrize(
+        ("source_lang", "text", "expected"),
+        [("en", "Hello, world!", "Привет, мир!"), ("auto", "Hello!", "Привет!")],
+    )
+    def test_translate(
+        self, mock_client: MagicMock, source_lang: str, text: str, expected: str
+    ) -> None:
+        mock_client.messages.create.return_value = SimpleNamespace(
+            content=[SimpleNamespace(text=expected)]
+        )
 
-    @patch("app.services.claude.ANTHROPIC_AVAILABLE", True)
-    @patch("app.services.claude.Anthropic")
-    def test_translate_api_error(self, mock_anthropic_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_anthropic_class.return_value = mock_client
-        mock_client.messages.create.side_effect = Exception("API Error")
+        service = ClaudeService(api_key="test_key")
+        assert service.translate(text, source_lang, "ru") == expected
 
+    def test_translate_api_error(self, anthropic_available: MagicMock) -> None:
         service = ClaudeService(api_key="test_key")
-        service._client = mock_client
+        service._client = SimpleNamespace(messages=SimpleNamespace(create=raise_api_error))
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Claude API error"):
             service.translate("Hello", "en", "ru")
-        assert "Claude API error" in str(exc_info.value)
-
-    @patch("app.services.claude.ANTHROPIC_AVAILABLE", True)
-    @patch("app.services.claude.Anthropic")
-    def test_translate_empty_response(self, mock_anthropic_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_anthropic_class.return_value = mock_client
 
-        mock_response = MagicMock()
-        mock_response.content = []
+    def test_translate_empty_response(self, mock_client: MagicMock) -> None:
+        mock_response = SimpleNamespace(content=[])
         mock_client.messages.create.return_value = mock_response
 
         service = ClaudeService(api_key="test_key")
-        service._client = mock_client
-
         result = service.translate("Hello", "en", "ru")
         assert result == ""
@@ -0,0 +1,65 @@
+"""Tests for the batch fan-out helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services._concurrency import AsyncRateLimiter, bounded_gather
+from app.services.deepl import DeepLService
+from app.services.openai_service import OpenAIService
+
+
+class TestAsyncRateLimiter:
+    def test_rejects_non_positive_qps(self) -> None:
+        with pytest.raises(ValueError):
+            AsyncRateLimiter(0)
+
+    async def test_spaces_acquisitions(self) -> None:
+        limiter = AsyncRateLimiter(qps=20)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(4):
+            await limiter.acquire()
+        # The first acquire is immediate, the next three wait 50 ms each
+        assert loop.time() - start >= 0.14
+
+
+class TestBoundedGather:
+    async def test_preserves_order(self) -> None:
+        async def delayed(value: int) -> int:
+            await asyncio.sleep(0.01 * (5 - value))
+            return value
+
+        results = await bounded_gather((delayed(i) for i in range(5)), concurrency=5)
+        assert results == [0, 1, 2, 3, 4]
+
+    async def test_limits_in_flight(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def task() -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await bounded_gather((task() for _ in range(10)), concurrency=3)
+        assert peak == 3
+
+    async def test_propagates_errors(self) -> None:
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await bounded_gather([fail()], concurrency=1)
+
+
+class TestServiceDefaults:
+    def test_rate_limiter_from_class_qps(self) -> None:
+        assert isinstance(OpenAIService(api_key="k")._create_rate_limiter(), AsyncRateLimiter)
+
+    def test_no_rate_limiter_without_qps(self) -> None:
+        assert DeepLService()._create_rate_limiter() is None
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+import json
+from typing import TYPE_CHECKING, Any
 
 import httpx
 import pytest
@@ -10,17 +11,36 @@ import respx
 
 from app.services.deepl import DeepLService
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _free_response(*sentences: str) -> bytes:
+    payload = {
+        "result": {
+            "translations": [
+                {"beams": [{"postprocessed_sentence": sentence}]} for sentence in sentences
+            ]
+        }
+    }
+    return json.dumps(payload).encode()
+
+
+# JSON-RPC payloads of the free endpoint, serialized once at import
+_FREE_HELLO = _free_response("Привет")
+_FREE_HELLO_WORLD = _free_response("Привет, мир!")
+_FREE_TWO_SENTENCES = _free_response("Привет мир.", "Как дела?")
+_QUOTA_EXCEEDED_BODY = b'{"message": "Quota exceeded"}'
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class TestDeepLService:
     """Tests for DeepLService class."""
 
-    def test_configured_without_key(self) -> None:
-        service = DeepLService(api_key="")
-        assert service.is_configured() is True
-
-    def test_configured_with_key(self) -> None:
-        service = DeepLService(api_key="test_key")
-        assert service.is_configured() is True
+    @pytest.mark.parametrize("api_key", ["", "test_key"])
+    def test_always_configured(self, api_key: str) -> None:
+        # The free endpoint needs no key, so the service is usable either way
+        assert DeepLService(api_key=api_key).is_configured() is True
 
     def test_get_name_with_key(self) -> None:
         service = DeepLService(api_key="test_key")
@@ -30,16 +50,14 @@ class TestDeepLService:
         service = DeepLService(api_key="")
         assert service.get_name() == "DeepL (Free)"
 
-    def test_supported_languages(self) -> None:
-        service = DeepLService(api_key="test_key")
-        languages = service.get_supported_languages()
-        assert "en" in languages
-        assert "ru" in languages
-        assert "de" in languages
-
-    @respx.mock
-    def test_translate_with_api_key_success(self, mock_deepl_response: dict[str, Any]) -> None:
-        respx.post("https://api-free.deepl.com/v2/translate").mock(
+    @pytest.mark.parametrize("language", ["en", "ru", "de"])
+    def test_supported_languages(self, language: str) -> None:
+        assert language in DeepLService(api_key="test_key").get_supported_languages()
+
+    def test_translate_with_api_key_success(
+        self, router: respx.MockRouter, mock_deepl_response: dict[str, Any]
+    ) -> None:
+        router.post("https://api-free.deepl.com/v2/translate").mock(
             return_value=httpx.Response(200, json=mock_deepl_response)
         )
 
@@ -47,9 +65,10 @@ class TestDeepLService:
         result = service.translate("Hello, world!", "en", "ru")
         assert result == "Привет, мир!"
 
-    @respx.mock
-    def test_translate_pro_plan(self, mock_deepl_response: dict[str, Any]) -> None:
-        respx.post("https://api.deepl.com/v2/translate").mock(
+    def test_translate_pro_plan(
+        self, router: respx.MockRouter, mock_deepl_response: dict[str, Any]
+    ) -> None:
+        router.post("https://api.deepl.com/v2/translate").mock(
             return_value=httpx.Response(200, json=mock_deepl_response)
         )
 
@@ -57,163 +76,134 @@ class TestDeepLService:
         result = service.translate("Hello, world!", "en", "ru")
         assert result == "Привет, мир!"
 
-    @respx.mock
-    def test_translate_free_api_without_key(self) -> None:
-        free_response = {
-            "result": {
-                "translations": [
-                    {
-                        "beams": [
-                            {"postprocessed_sentence": "Привет, мир!"},
-                        ]
-                    },
-                ]
-            }
-        }
-        respx.post("https://www2.deepl.com/jsonrpc").mock(
-            return_value=httpx.Response(200, json=free_response)
+    def test_translate_with_api_key_retries_request_error(
+        self,
+        router: respx.MockRouter,
+        mock_deepl_response: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("app.utils.rate_limiter.time.sleep", lambda _: None)
+        route = router.post("https://api-free.deepl.com/v2/translate")
+        route.side_effect = [
+            httpx.ConnectError("reset"),
+            httpx.Response(200, json=mock_deepl_response),
+        ]
+
+        service = DeepLService(api_key="test_key", is_free_plan=True)
+        result = service._translate_with_api_key("Hello, world!", "en", "ru")
+        assert result == "Привет, мир!"
+        assert route.call_count == 2
+
+    def test_api_key_rate_limit_retries_once(
+        self, router: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        delays: list[float] = []
+        monkeypatch.setattr("app.utils.rate_limiter.time.sleep", delays.append)
+        route = router.post("https://api-free.deepl.com/v2/translate").mock(
+            return_value=httpx.Response(429)
+        )
+
+        service = DeepLService(api_key="test_key", is_free_plan=True)
+        with pytest.raises(ValueError, match="rate limit exceeded") as exc_info:
+            service._translate_with_api_key("Hello", "en", "ru")
+        assert "API key" not in str(exc_info.value)
+        assert route.call_count == 2
+        assert delays == [0.5]
+
+    def test_translate_free_api_without_key(self, router: respx.MockRouter) -> None:
+        router.post("https://www2.deepl.com/jsonrpc").mock(
+            return_value=httpx.Response(200, content=_FREE_HELLO_WORLD, headers=_JSON_HEADERS)
         )
 
         service = DeepLService(api_key="")
         result = service.translate("Hello world!", "en", "ru")
-        assert "Привет, мир!" in result
-
-    @respx.mock
-    def test_translate_free_api_multiple_sentences(self) -> None:
-        free_response = {
-            "result": {
-                "translations": [
-                    {
-                        "beams": [
-                            {"postprocessed_sentence": "Привет мир."},
-                        ]
-                    },
-                    {
-                        "beams": [
-                            {"postprocessed_sentence": "Как дела?"},
-                        ]
-                    },
-                ]
-            }
-        }
-        respx.post("https://www2.deepl.com/jsonrpc").mock(
-            return_value=httpx.Response(200, json=free_response)
+        assert result == "Привет, мир!"
+
+    def test_translate_free_api_multiple_sentences(self, router: respx.MockRouter) -> None:
+        router.post("https://www2.deepl.com/jsonrpc").mock(
+            return_value=httpx.Response(200, content=_FREE_TWO_SENTENCES, headers=_JSON_HEADERS)
         )
 
         service = DeepLService(api_key="")
         result = service.translate("Hello world. How are you?", "en", "ru")
-        assert "Привет мир." in result
-        assert "Как дела?" in result
-        assert " " in result
-
-    @respx.mock
-    def test_translate_fallback_to_free_api(self) -> None:
-        respx.post("https://api-free.deepl.com/v2/translate").mock(
-            return_value=httpx.Response(403, json={"message": "Invalid API key"})
-        )
-        free_response = {
-            "result": {
-                "translations": [
-                    {
-                        "beams": [
-                            {"postprocessed_sentence": "Привет, мир!"},
-                        ]
-                    }
-                ]
-            }
-        }
-        respx.post("https://www2.deepl.com/jsonrpc").mock(
-            return_value=httpx.Response(200, json=free_response)
+        assert result == "Привет мир. Как дела?"
+
+    def test_translate_fallback_to_free_api(self, register_routes: Callable[..., None]) -> None:
+        register_routes(
+            (
+                "POST",
+                "https://api-free.deepl.com/v2/translate",
+                httpx.Response(403, json={"message": "Invalid API key"}),
+            ),
+            (
+                "POST",
+                "https://www2.deepl.com/jsonrpc",
+                httpx.Response(200, content=_FREE_HELLO_WORLD, headers=_JSON_HEADERS),
+            ),
         )
 
         service = DeepLService(api_key="invalid_key", is_free_plan=True)
         result = service.translate("Hello, world!", "en", "ru")
-        assert "Привет, мир!" in result
+        assert result == "Привет, мир!"
 
-    @respx.mock
-    def test_translate_quota_exceeded_fallback(self) -> None:
-        respx.post("https://api-free.deepl.com/v2/translate").mock(
-            return_value=httpx.Response(456, json={"message": "Quota exceeded"})
+    def test_translate_quota_exceeded_fallback(self, router: respx.MockRouter) -> None:
+        paid_route = router.post("https://api-free.deepl.com/v2/translate").mock(
+            return_value=httpx.Response(456, content=_QUOTA_EXCEEDED_BODY, headers=_JSON_HEADERS)
         )
-        free_response = {
-            "result": {
-                "translations": [
-                    {
-                        "beams": [
-                            {"postprocessed_sentence": "Привет"},
-                        ]
-                    }
-                ]
-            }
-        }
-        respx.post("https://www2.deepl.com/jsonrpc").mock(
-            return_value=httpx.Response(200, json=free_response)
+        router.post("https://www2.deepl.com/jsonrpc").mock(
+            return_value=httpx.Response(200, content=_FREE_HELLO, headers=_JSON_HEADERS)
         )
 
         service = DeepLService(api_key="test_key", is_free_plan=True)
         result = service.translate("Hello", "en", "ru")
-        assert "Привет" in result
+        assert result == "Привет"
+        assert paid_route.call_count == 1
 
-    @respx.mock
-    def test_unsupported_target_language_with_free_api(self) -> None:
+    def test_unsupported_target_language_with_free_api(self, router: respx.MockRouter) -> None:
         service = DeepLService(api_key="")
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="does not support"):
             service.translate("Hello", "en", "xyz")
-        assert "does not support" in str(exc_info.value)
 
-    @respx.mock
-    def test_free_api_error_handling(self) -> None:
-        respx.post("https://www2.deepl.com/jsonrpc").mock(
+    def test_free_api_error_handling(self, router: respx.MockRouter) -> None:
+        router.post("https://www2.deepl.com/jsonrpc").mock(
             return_value=httpx.Response(500, json={"error": "Server error"})
         )
 
         service = DeepLService(api_key="")
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="HTTP error 500"):
             service.translate("Hello", "en", "ru")
-        assert "HTTP error 500" in str(exc_info.value)
 
-    @respx.mock
-    def test_free_api_unexpected_response_format(self) -> None:
-        respx.post("https://www2.deepl.com/jsonrpc").mock(
+    def test_free_api_unexpected_response_format(self, router: respx.MockRouter) -> None:
+        router.post("https://www2.deepl.com/jsonrpc").mock(
             return_value=httpx.Response(200, json={"unexpected": "format"})
         )
 
         service = DeepLService(api_key="")
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Unexpected response format"):
             service.translate("Hello", "en", "ru")
-        assert "Unexpected response format" in str(exc_info.value)
-
-    @respx.mock
-    def test_free_api_rate_limit_retry_success(self) -> None:
-        free_response = {
-            "result": {
-                "translations": [
-                    {
-                        "beams": [
-                            {"postprocessed_sentence": "Привет, мир!"},
-                        ]
-                    }
-                ]
-            }
-        }
-        route = respx.post("https://www2.deepl.com/jsonrpc")
+
+    @pytest.mark.slow
+    def test_free_api_rate_limit_retry_success(self, router: respx.MockRouter) -> None:
+        route = router.post("https://www2.deepl.com/jsonrpc")
         route.side_effect = [
             httpx.Response(429, json={"code": 429, "message": "Too many requests"}),
-            httpx.Response(200, json=free_response),
+            httpx.Response(200, content=_FREE_HELLO_WORLD, headers=_JSON_HEADERS),
         ]
 
         service = DeepLService(api_key="")
         result = service.translate("Hello, world!", "en", "ru")
-        assert "Привет, мир!" in result
+        assert result == "Привет, мир!"
         assert route.call_count == 2
 
-    @respx.mock
-    def test_free_api_rate_limit_max_retries_exceeded(self) -> None:
-        respx.post("https://www2.deepl.com/jsonrpc").mock(
+    @pytest.mark.slow
+    def test_free_api_rate_limit_max_retries_exceeded(
+        self, router: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("app.utils.rate_limiter.time.sleep", lambda _: None)
+        router.post("https://www2.deepl.com/jsonrpc").mock(
             return_value=httpx.Response(429, json={"code": 429, "message": "Too many requests"})
         )
 
         service = DeepLService(api_key="")
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="(?i)rate limit exceeded"):
             service.translate("Hello", "en", "ru")
-        assert "rate limit exceeded" in str(exc_info.value).lower()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 import pytest
@@ -10,17 +10,17 @@ import respx
 
 from app.services.google import GoogleService
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class TestGoogleService:
     """Tests for GoogleService class."""
 
-    def test_not_configured_without_key(self) -> None:
-        service = GoogleService(api_key="")
-        assert service.is_configured() is True
-
-    def test_configured_with_key(self) -> None:
-        service = GoogleService(api_key="test_key")
-        assert service.is_configured() is True
+    @pytest.mark.parametrize("api_key", ["", "test_key"])
+    def test_always_configured(self, api_key: str) -> None:
+        # The free endpoint needs no key, so the service is usable either way
+        assert GoogleService(api_key=api_key).is_configured() is True
 
     def test_get_name(self) -> None:
         service = GoogleService(api_key="test_key")
@@ -30,43 +30,40 @@ class TestGoogleService:
         service = GoogleService(api_key="")
         assert service.get_name() == "Google Translate (Free)"
 
-    @respx.mock
-    def test_translate_success(self, mock_google_response: dict[str, Any]) -> None:
-        respx.post("https://translation.googleapis.com/language/translate/v2").mock(
+    @pytest.mark.parametrize("source_lang", ["en", "auto"])
+    def test_translate_success(
+        self, router: respx.MockRouter, mock_google_response: dict[str, Any], source_lang: str
+    ) -> None:
+        router.post("https://translation.googleapis.com/language/translate/v2").mock(
             return_value=httpx.Response(200, json=mock_google_response)
         )
 
         service = GoogleService(api_key="test_key")
-        result = service.translate("Hello, world!", "en", "ru")
+        result = service.translate("Hello, world!", source_lang, "ru")
         assert result == "Привет, мир!"
 
-    @respx.mock
-    def test_translate_with_auto_detect(self, mock_google_response: dict[str, Any]) -> None:
-        respx.post("https://translation.googleapis.com/language/translate/v2").mock(
-            return_value=httpx.Response(200, json=mock_google_response)
-        )
-
-        service = GoogleService(api_key="test_key")
-        result = service.translate("Hello, world!", "auto", "ru")
-        assert result == "Привет, мир!"
-
-    @respx.mock
-    def test_translate_api_error_fallback_to_free(self) -> None:
-        respx.post("https://translation.googleapis.com/language/translate/v2").mock(
-            return_value=httpx.Response(403, json={"error": {"message": "Invalid API key"}})
-        )
-
-        respx.get("https://translate.googleapis.com/translate_a/single").mock(
-            return_value=httpx.Response(200, json=[[["Привет", "Hello", None, None]]])
+    def test_translate_api_error_fallback_to_free(
+        self, register_routes: Callable[..., None]
+    ) -> None:
+        register_routes(
+            (
+                "POST",
+                "https://translation.googleapis.com/language/translate/v2",
+                httpx.Response(403, json={"error": {"message": "Invalid API key"}}),
+            ),
+            (
+                "GET",
+                "https://translate.googleapis.com/translate_a/single",
+                httpx.Response(200, json=[[["Привет", "Hello", None, None]]]),
+            ),
         )
 
         service = GoogleService(api_key="invalid_key")
         result = service.translate("Hello", "en", "ru")
         assert result == "Привет"
 
-    @respx.mock
-    def test_translate_with_free_api(self) -> None:
-        respx.get("https://translate.googleapis.com/translate_a/single").mock(
+    def test_translate_with_free_api(self, router: respx.MockRouter) -> None:
+        router.get("https://translate.googleapis.com/translate_a/single").mock(
             return_value=httpx.Response(200, json=[[["Привет", "Hello", None, None]]])
         )
 
@@ -74,31 +71,26 @@ class TestGoogleService:
         result = service.translate("Hello", "en", "ru")
         assert result == "Привет"
 
-    @respx.mock
-    def test_translate_free_api_error(self) -> None:
-        respx.get("https://translate.googleapis.com/translate_a/single").mock(
+    def test_translate_free_api_error(self, router: respx.MockRouter) -> None:
+        router.get("https://translate.googleapis.com/translate_a/single").mock(
             return_value=httpx.Response(500, json={"error": "Server error"})
         )
 
         service = GoogleService(api_key="")
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Google free API"):
             service.translate("Hello", "en", "ru")
-        assert "Google free API" in str(exc_info.value)
 
-    @respx.mock
-    def test_translate_free_api_unexpected_format(self) -> None:
-        respx.get("https://translate.googleapis.com/translate_a/single").mock(
+    def test_translate_free_api_unexpected_format(self, router: respx.MockRouter) -> None:
+        router.get("https://translate.googleapis.com/translate_a/single").mock(
             return_value=httpx.Response(200, json={"unexpected": "format"})
         )
 
         service = GoogleService(api_key="")
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="(?i)parse|unexpected"):
             service.translate("Hello", "en", "ru")
-        assert "parse" in str(exc_info.value).lower() or "unexpected" in str(exc_info.value).lower()
 
-    @respx.mock
-    def test_translate_paid_api_error(self) -> None:
-        respx.post("https://translation.googleapis.com/language/translate/v2").mock(
+    def test_translate_paid_api_error(self, router: respx.MockRouter) -> None:
+        router.post("https://translation.googleapis.com/language/translate/v2").mock(
             return_value=httpx.Response(403, json={"error": "forbidden"})
         )
 
@@ -107,9 +99,8 @@ class TestGoogleService:
         result = service.translate("Hello", "en", "ru")
         assert result == "fallback"
 
-    @respx.mock
-    def test_translate_paid_api_request_exception(self) -> None:
-        respx.post("https://translation.googleapis.com/language/translate/v2").mock(
+    def test_translate_paid_api_request_exception(self, router: respx.MockRouter) -> None:
+        router.post("https://translation.googleapis.com/language/translate/v2").mock(
             side_effect=httpx.ConnectError("timeout")
         )
 
@@ -117,9 +108,9 @@ class TestGoogleService:
         with pytest.raises(ValueError, match="Google API request failed"):
             service._translate_with_api_key("Hello", "en", "ru")
 
-    @respx.mock
-    def test_translate_free_api_429_retry_then_success(self) -> None:
-        route = respx.get("https://translate.googleapis.com/translate_a/single")
+    @pytest.mark.slow
+    def test_translate_free_api_429_retry_then_success(self, router: respx.MockRouter) -> None:
+        route = router.get("https://translate.googleapis.com/translate_a/single")
         route.side_effect = [
             httpx.Response(429),
             httpx.Response(200, json=[[["Привет", "Hello"]]]),
@@ -129,9 +120,9 @@ class TestGoogleService:
         result = service._translate_free("Hello", "en", "ru")
         assert result == "Привет"
 
-    @respx.mock
-    def test_translate_free_api_429_exhausted(self) -> None:
-        respx.get("https://translate.googleapis.com/translate_a/single").mock(
+    @pytest.mark.slow
+    def test_translate_free_api_429_exhausted(self, router: respx.MockRouter) -> None:
+        router.get("https://translate.googleapis.com/translate_a/single").mock(
             return_value=httpx.Response(429)
         )
 
@@ -139,9 +130,9 @@ class TestGoogleService:
         with pytest.raises(ValueError, match="rate limit"):
             service._translate_free("Hello", "en", "ru")
 
-    @respx.mock
-    def test_translate_free_api_request_error_retry(self) -> None:
-        route = respx.get("https://translate.googleapis.com/translate_a/single")
+    @pytest.mark.slow
+    def test_translate_free_api_request_error_retry(self, router: respx.MockRouter) -> None:
+        route = router.get("https://translate.googleapis.com/translate_a/single")
         route.side_effect = [
             httpx.ConnectError("fail"),
             httpx.Response(200, json=[[["Привет", "Hello"]]]),
@@ -151,9 +142,9 @@ class TestGoogleService:
         result = service._translate_free("Hello", "en", "ru")
         assert result == "Привет"
 
-    @respx.mock
-    def test_translate_free_api_request_error_exhausted(self) -> None:
-        respx.get("https://translate.googleapis.com/translate_a/single").mock(
+    @pytest.mark.slow
+    def test_translate_free_api_request_error_exhausted(self, router: respx.MockRouter) -> None:
+        router.get("https://translate.googleapis.com/translate_a/single").mock(
             side_effect=httpx.ConnectError("fail")
         )
 
@@ -161,9 +152,9 @@ class TestGoogleService:
         with pytest.raises(ValueError, match="request failed"):
             service._translate_free("Hello", "en", "ru")
 
-    @respx.mock
-    def test_translate_free_api_max_retries_exceeded(self) -> None:
-        respx.get("https://translate.googleapis.com/translate_a/single").mock(
+    @pytest.mark.slow
+    def test_translate_free_api_max_retries_exceeded(self, router: respx.MockRouter) -> None:
+        router.get("https://translate.googleapis.com/translate_a/single").mock(
             return_value=httpx.Response(429)
         )
 
@@ -2,83 +2,79 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from app.services.groq_service import GroqService
+from tests.services._fakes import raise_api_error
 
 
-class TestGroqService:
-    """Tests for GroqService class."""
+@pytest.fixture(scope="module")
+def groq_available() -> Generator[MagicMock, None, None]:
+    """Patch the SDK in once for the whole module; tests inject their own client."""
+    with (
+        patch("app.services.groq_service.GROQ_AVAILABLE", True),
+        patch("app.services.groq_service.Groq") as mock_groq_class,
+    ):
+        yield mock_groq_class
 
-    def test_not_configured_without_key(self) -> None:
-        service = GroqService(api_key="")
-        assert service.is_configured() is False
 
-    def test_configured_with_key(self) -> None:
-        service = GroqService(api_key="test_key")
-        assert service.api_key == "test_key"
+@pytest.fixture
+def mock_client(groq_available: MagicMock) -> MagicMock:
+    """Fresh SDK client handed out by the patched constructor."""
+    client = MagicMock()
+    groq_available.return_value = client
+    return client
 
-    def test_get_name(self) -> None:
-        service = GroqService(api_key="test_key", model="llama-3.3-70b-versatile")
-        assert "llama-3.3-70b-versatile" in service.get_name()
-        assert "Groq" in service.get_name()
 
-    def test_available_models(self) -> None:
-        assert "mixtral-8x7b-32768" in GroqService.AVAILABLE_MODELS
-        assert "llama-3.3-70b-versatile" in GroqService.AVAILABLE_MODELS
+@pytest.fixture(scope="class")
+def configured_service() -> GroqService:
+    return GroqService(api_key="test_key", model="llama-3.3-70b-versatile")
 
-    def test_translate_without_key(self) -> None:
-        service = GroqService(api_key="")
-        with pytest.raises(ValueError) as exc_info:
-            service.translate("Hello", "en", "ru")
-        assert "not set" in str(exc_info.value) or "not configured" in str(exc_info.value)
 
-    @patch("app.services.groq_service.GROQ_AVAILABLE", True)
-    @patch("app.services.groq_service.Groq")
-    def test_translate_success(self, mock_groq_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_groq_class.return_value = mock_client
+@pytest.fixture(scope="class")
+def unconfigured_service() -> GroqService:
+    return GroqService(api_key="")
 
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Привет, мир!"
-        mock_client.chat.completions.create.return_value = mock_response
 
-        service = GroqService(api_key="test_key")
-        service._client = mock_client
+class TestGroqService:
+    """Tests for GroqService class."""
 
-        result = service.translate("Hello, world!", "en", "ru")
-        assert result == "Привет, мир!"
+    def test_not_configured_without_key(self, unconfigured_service: GroqService) -> None:
+        assert unconfigured_service.is_configured() is False
 
-    @patch("app.services.groq_service.GROQ_AVAILABLE", True)
-    @patch("app.services.groq_service.Groq")
-    def test_translate_with_auto_detect(self, mock_groq_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_groq_class.return_value = mock_client
+    def test_configured_with_key(self, configured_service: GroqService) -> None:
+        assert configured_service.api_key == "test_key"
 
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Привет!"
-        mock_client.chat.completions.create.return_value = mock_response
+    def test_get_name(self, configured_service: GroqService) -> None:
+        assert configured_service.get_name() == "Groq (llama-3.3-70b-versatile)"
 
-        service = GroqService(api_key="test_key")
-        service._client = mock_client
+    @pytest.mark.parametrize("model", ["mixtral-8x7b-32768", "llama-3.3-70b-versatile"])
+    def test_available_models(self, model: str) -> None:
+        assert model in GroqService.AVAILABLE_MODELS
 
-        result = service.translate("Hello!", "auto", "ru")
-        assert result == "Привет!"
+    @pytest.mark.parametrize(
+        ("source_lang", "text", "expected"),
+        [("en", "Hello, world!", "Привет, мир!"), ("auto", "Hello!", "Привет!")],
+    )
+    def test_translate(
+        self, mock_client: MagicMock, source_lang: str, text: str, expected: str
+    ) -> None:
+        mock_client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=expected))]
+        )
 
-    @patch("app.services.groq_service.GROQ_AVAILABLE", True)
-    @patch("app.services.groq_service.Groq")
-    def test_translate_api_error(self, mock_groq_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_groq_class.return_value = mock_client
-        mock_client.chat.completions.create.side_effect = Exception("API Error")
+        service = GroqService(api_key="test_key")
+        assert service.translate(text, source_lang, "ru") == expected
 
+    def test_translate_api_error(self, groq_available: MagicMock) -> None:
         service = GroqService(api_key="test_key")
-        service._client = mock_client
+        service._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=raise_api_error))
+        )
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Groq API error"):
             service.translate("Hello", "en", "ru")
-        assert "Groq API error" in str(exc_info.value)
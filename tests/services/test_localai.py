@@ -2,97 +2,75 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import importlib.util
 
 import pytest
 
 from app.services.localai import LocalAIService
+from tests.services._fakes import FakeOpenAIClient, api_error
+
+pytestmark = pytest.mark.skipif(
+    importlib.util.find_spec("openai") is None, reason="openai SDK not installed"
+)
+
+
+@pytest.fixture(autouse=True)
+def fake_sdk_client(monkeypatch: pytest.MonkeyPatch, openai_client: FakeOpenAIClient) -> None:
+    """Route the SDK constructor to the test's fake client."""
+    monkeypatch.setattr("app.services.localai.OpenAI", lambda **kwargs: openai_client)
 
 
 class TestLocalAIService:
     """Tests for LocalAIService class."""
 
-    def test_not_configured_without_url(self) -> None:
-        service = LocalAIService(base_url="")
-        assert service.is_configured() is False
-
-    def test_configured_with_url(self) -> None:
-        service = LocalAIService(base_url="http://localhost:8080/v1")
-        # Configuration also depends on openai package availability
-        assert service.base_url == "http://localhost:8080/v1"
+    @pytest.mark.parametrize(
+        ("base_url", "expected"), [("", False), ("http://localhost:8080/v1", True)]
+    )
+    def test_is_configured(self, base_url: str, expected: bool) -> None:
+        service = LocalAIService(base_url=base_url)
+        assert service.base_url == base_url
+        assert service.is_configured() is expected
 
     def test_get_name(self) -> None:
         service = LocalAIService(base_url="http://localhost:8080/v1", model="my-model")
-        assert "my-model" in service.get_name()
-        assert "LocalAI" in service.get_name()
+        assert service.get_name() == "LocalAI (my-model)"
 
     def test_url_trailing_slash_removed(self) -> None:
         service = LocalAIService(base_url="http://localhost:8080/v1/")
         assert service.base_url == "http://localhost:8080/v1"
 
-    def test_translate_without_url(self) -> None:
-        service = LocalAIService(base_url="")
-        with pytest.raises(ValueError) as exc_info:
-            service.translate("Hello", "en", "ru")
-        assert "not configured" in str(exc_info.value)
-
-    @patch("app.services.localai.OPENAI_AVAILABLE", True)
-    @patch("app.services.localai.OpenAI")
-    def test_translate_success(self, mock_openai_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Привет, мир!"
-        mock_client.chat.completions.create.return_value = mock_response
+    def test_translate_success(self, openai_client: FakeOpenAIClient) -> None:
+        openai_client.reply = "Привет, мир!"
 
         service = LocalAIService(base_url="http://localhost:8080/v1")
-        service._client = mock_client
-
         result = service.translate("Hello, world!", "en", "ru")
         assert result == "Привет, мир!"
 
-    @patch("app.services.localai.OPENAI_AVAILABLE", True)
-    @patch("app.services.localai.OpenAI")
-    def test_translate_with_custom_model(self, mock_openai_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Привет!"
-        mock_client.chat.completions.create.return_value = mock_response
+    def test_translate_with_custom_model(self, openai_client: FakeOpenAIClient) -> None:
+        openai_client.reply = "Привет!"
 
         service = LocalAIService(base_url="http://localhost:8080/v1", model="custom-model")
-        service._client = mock_client
-
         result = service.translate("Hello!", "en", "ru")
         assert result == "Привет!"
 
         # Verify model was used
-        call_kwargs = mock_client.chat.completions.create.call_args.kwargs
-        assert call_kwargs["model"] == "custom-model"
+        assert openai_client.last_request["model"] == "custom-model"
 
-    @patch("app.services.localai.OPENAI_AVAILABLE", True)
-    @patch("app.services.localai.OpenAI")
-    def test_translate_api_error(self, mock_openai_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
-        mock_client.chat.completions.create.side_effect = Exception("Connection refused")
+    def test_translate_api_error(self, openai_client: FakeOpenAIClient) -> None:
+        openai_client.reply = api_error("Connection refused")
 
         service = LocalAIService(base_url="http://localhost:8080/v1")
-        service._client = mock_client
-
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="LocalAI error"):
             service.translate("Hello", "en", "ru")
-        assert "LocalAI error" in str(exc_info.value)
-
-    def test_api_key_default(self) -> None:
-        service = LocalAIService(base_url="http://localhost:8080/v1")
-        # Default should be set for local servers that don't need auth
-        assert service.api_key == "not-needed"
 
-    def test_custom_api_key(self) -> None:
-        service = LocalAIService(base_url="http://localhost:8080/v1", api_key="my-secret-key")
-        assert service.api_key == "my-secret-key"
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            # Default for local servers that don't need auth
+            ({}, "not-needed"),
+            ({"api_key": "my-secret-key"}, "my-secret-key"),
+        ],
+    )
+    def test_api_key(self, kwargs: dict[str, str], expected: str) -> None:
+        service = LocalAIService(base_url="http://localhost:8080/v1", **kwargs)
+        assert service.api_key == expected
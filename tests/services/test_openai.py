@@ -2,82 +2,67 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import importlib.util
+from unittest.mock import MagicMock
 
 import pytest
 
 from app.services.openai_service import OpenAIService
+from tests.services._fakes import FakeOpenAIClient, api_error
+
+pytestmark = pytest.mark.skipif(
+    importlib.util.find_spec("openai") is None, reason="openai SDK not installed"
+)
+
+
+@pytest.fixture(autouse=True)
+def fake_sdk_client(monkeypatch: pytest.MonkeyPatch, openai_client: FakeOpenAIClient) -> None:
+    """Route the SDK constructor to the test's fake client."""
+    monkeypatch.setattr("app.services.openai_service.OpenAI", lambda **kwargs: openai_client)
 
 
 class TestOpenAIService:
     """Tests for OpenAIService class."""
 
-    def test_not_configured_without_key(self) -> None:
-        service = OpenAIService(api_key="")
-        assert service.is_configured() is False
-
-    def test_configured_with_key(self) -> None:
-        service = OpenAIService(api_key="test_key")
-        # Configuration also depends on openai package availability
-        # Just check basic logic
-        assert service.api_key == "test_key"
+    @pytest.mark.parametrize(("api_key", "expected"), [("", False), ("test_key", True)])
+    def test_is_configured(self, api_key: str, expected: bool) -> None:
+        service = OpenAIService(api_key=api_key)
+        assert service.api_key == api_key
+        assert service.is_configured() is expected
 
     def test_get_name(self) -> None:
         service = OpenAIService(api_key="test_key", model="gpt-4")
-        assert "gpt-4" in service.get_name()
-        assert "OpenAI" in service.get_name()
-
-    def test_translate_without_key(self) -> None:
-        service = OpenAIService(api_key="")
-        with pytest.raises(ValueError) as exc_info:
-            service.translate("Hello", "en", "ru")
-        assert "not set" in str(exc_info.value) or "not configured" in str(exc_info.value)
+        assert service.get_name() == "OpenAI (gpt-4)"
 
-    @patch("app.services.openai_service.OPENAI_AVAILABLE", True)
-    @patch("app.services.openai_service.OpenAI")
-    def test_translate_success(self, mock_openai_class: MagicMock) -> None:
-        # Setup mock
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Привет, мир!"
-        mock_client.chat.completions.create.return_value = mock_response
+    def test_translate_success(self, openai_client: FakeOpenAIClient) -> None:
+        openai_client.reply = "Привет, мир!"
 
         service = OpenAIService(api_key="test_key")
-        service._client = mock_client
-
         result = service.translate("Hello, world!", "en", "ru")
         assert result == "Привет, мир!"
 
-    @patch("app.services.openai_service.OPENAI_AVAILABLE", True)
-    @patch("app.services.openai_service.OpenAI")
-    def test_translate_with_auto_detect(self, mock_openai_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Привет!"
-        mock_client.chat.completions.create.return_value = mock_response
+    def test_translate_with_auto_detect(self, openai_client: FakeOpenAIClient) -> None:
+        openai_client.reply = "Привет!"
 
         service = OpenAIService(api_key="test_key")
-        service._client = mock_client
-
         result = service.translate("Hello!", "auto", "ru")
         assert result == "Привет!"
 
-    @patch("app.services.openai_service.OPENAI_AVAILABLE", True)
-    @patch("app.services.openai_service.OpenAI")
-    def test_translate_api_error(self, mock_openai_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
-        mock_client.chat.completions.create.side_effect = Exception("API Error")
+    def test_translate_api_error(self, openai_client: FakeOpenAIClient) -> None:
+        openai_client.reply = api_error()
 
         service = OpenAIService(api_key="test_key")
-        service._client = mock_client
-
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="API error|Error"):
             service.translate("Hello", "en", "ru")
-        assert "API error" in str(exc_info.value) or "Error" in str(exc_info.value)
+
+    def test_create_async_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        mock_async_class = MagicMock()
+        monkeypatch.setattr("app.services.openai_service.AsyncOpenAI", mock_async_class)
+        service = OpenAIService(api_key="test_key", timeout=60.0)
+        client = service._create_async_client()
+        assert client is mock_async_class.return_value
+        mock_async_class.assert_called_once_with(api_key="test_key", timeout=60.0)
+
+    def test_semantic_cache_opt_in(self) -> None:
+        assert OpenAIService(api_key="test_key")._semantic_cache is None
+        assert OpenAIService(api_key="test_key", semantic_cache=True)._semantic_cache is not None
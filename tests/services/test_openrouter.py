@@ -2,59 +2,50 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import importlib.util
+from unittest.mock import MagicMock
 
 import pytest
 
 from app.services.openrouter import OpenRouterService
+from tests.services._fakes import FakeOpenAIClient, api_error
+
+pytestmark = pytest.mark.skipif(
+    importlib.util.find_spec("openai") is None, reason="openai SDK not installed"
+)
+
+
+@pytest.fixture(autouse=True)
+def fake_sdk_client(monkeypatch: pytest.MonkeyPatch, openai_client: FakeOpenAIClient) -> None:
+    """Route the SDK constructor to the test's fake client."""
+    monkeypatch.setattr("app.services.openrouter.OpenAI", lambda **kwargs: openai_client)
 
 
 class TestOpenRouterService:
     """Tests for OpenRouterService class."""
 
-    def test_not_configured_without_key(self) -> None:
-        service = OpenRouterService(api_key="")
-        assert service.is_configured() is False
-
-    def test_configured_with_key(self) -> None:
-        service = OpenRouterService(api_key="test_key")
-        assert service.api_key == "test_key"
+    @pytest.mark.parametrize(("api_key", "expected"), [("", False), ("test_key", True)])
+    def test_is_configured(self, api_key: str, expected: bool) -> None:
+        service = OpenRouterService(api_key=api_key)
+        assert service.api_key == api_key
+        assert service.is_configured() is expected
 
     def test_get_name(self) -> None:
         service = OpenRouterService(api_key="test_key", model="anthropic/claude-3-opus")
-        assert "anthropic/claude-3-opus" in service.get_name()
-        assert "OpenRouter" in service.get_name()
+        assert service.get_name() == "OpenRouter (anthropic/claude-3-opus)"
 
     def test_base_url(self) -> None:
         service = OpenRouterService(api_key="test_key")
         assert service.BASE_URL == "https://openrouter.ai/api/v1"
 
-    def test_translate_without_key(self) -> None:
-        service = OpenRouterService(api_key="")
-        with pytest.raises(ValueError) as exc_info:
-            service.translate("Hello", "en", "ru")
-        assert "not set" in str(exc_info.value) or "not configured" in str(exc_info.value)
-
-    @patch("app.services.openrouter.OPENAI_AVAILABLE", True)
-    @patch("app.services.openrouter.OpenAI")
-    def test_translate_success(self, mock_openai_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Привет, мир!"
-        mock_client.chat.completions.create.return_value = mock_response
+    def test_translate_success(self, openai_client: FakeOpenAIClient) -> None:
+        openai_client.reply = "Привет, мир!"
 
         service = OpenRouterService(api_key="test_key")
-        service._client = mock_client
-
         result = service.translate("Hello, world!", "en", "ru")
         assert result == "Привет, мир!"
 
-    @patch("app.services.openrouter.OPENAI_AVAILABLE", True)
-    @patch("app.services.openrouter.OpenAI")
-    def test_site_headers(self, mock_openai_class: MagicMock) -> None:
+    def test_site_headers(self) -> None:
         service = OpenRouterService(
             api_key="test_key",
             site_url="https://example.com",
@@ -64,35 +55,25 @@ class TestOpenRouterService:
         assert service.site_url == "https://example.com"
         assert service.site_name == "My App"
 
-    def test_is_configured_with_key(self) -> None:
-        service = OpenRouterService(api_key="test_key")
-        assert service.is_configured() is True
-
-    @patch("app.services.openrouter.OPENAI_AVAILABLE", True)
-    @patch("app.services.openrouter.OpenAI")
-    def test_translate_api_error(self, mock_openai_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
-        mock_client.chat.completions.create.side_effect = Exception("API down")
+    def test_translate_api_error(self, openai_client: FakeOpenAIClient) -> None:
+        openai_client.reply = api_error("API down")
 
         service = OpenRouterService(api_key="test_key")
-        service._client = mock_client
-
         with pytest.raises(ValueError, match="OpenRouter API error"):
             service.translate("Hello", "en", "ru")
 
-    @patch("app.services.openrouter.OPENAI_AVAILABLE", True)
-    @patch("app.services.openrouter.OpenAI")
-    def test_translate_with_auto_source(self, mock_openai_class: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Результат"
-        mock_client.chat.completions.create.return_value = mock_response
+    def test_translate_with_auto_source(self, openai_client: FakeOpenAIClient) -> None:
+        openai_client.reply = "Результат"
 
         service = OpenRouterService(api_key="test_key")
-        service._client = mock_client
-
         result = service.translate("Hello", "auto", "ru")
         assert result == "Результат"
+
+    def test_create_async_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        mock_async_class = MagicMock()
+        monkeypatch.setattr("app.services.openrouter.AsyncOpenAI", mock_async_class)
+        service = OpenRouterService(api_key="test_key", site_url="https://example.com")
+        service._create_async_client()
+        kwargs = mock_async_class.call_args.kwargs
+        assert kwargs["base_url"] == "https://openrouter.ai/api/v1"
+        assert kwargs["default_headers"]["HTTP-Referer"] == "https://example.com"
@@ -0,0 +1,53 @@
+"""Tests for the embedding-similarity translation cache."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.services._cache import SemanticCache
+
+_VECTORS = {
+    "Hello world": [1.0, 0.0, 0.0],
+    "Hello world!": [0.99, 0.01, 0.0],
+    "Goodbye": [0.0, 1.0, 0.0],
+}
+
+
+@pytest.fixture
+def cache() -> SemanticCache:
+    return SemanticCache(lambda text: _VECTORS[text])
+
+
+class TestSemanticCache:
+    def test_embed_normalizes(self, cache: SemanticCache) -> None:
+        vector = SemanticCache(lambda text: [3.0, 4.0]).embed("x")
+        assert np.allclose(vector, [0.6, 0.8])
+        assert np.allclose(cache.embed("Hello world"), [1.0, 0.0, 0.0])
+
+    def test_near_duplicate_hit(self, cache: SemanticCache) -> None:
+        cache.put(cache.embed("Hello world"), "en", "ru", "Привет, мир")
+        assert cache.get(cache.embed("Hello world!"), "en", "ru") == "Привет, мир"
+
+    def test_distant_text_misses(self, cache: SemanticCache) -> None:
+        cache.put(cache.embed("Hello world"), "en", "ru", "Привет, мир")
+        assert cache.get(cache.embed("Goodbye"), "en", "ru") is None
+
+    def test_partitioned_by_language_pair(self, cache: SemanticCache) -> None:
+        cache.put(cache.embed("Hello world"), "en", "ru", "Привет, мир")
+        assert cache.get(cache.embed("Hello world"), "en", "de") is None
+        assert cache.get(cache.embed("Hello world"), "EN", "RU") == "Привет, мир"
+
+    def test_max_size_drops_oldest(self) -> None:
+        cache = SemanticCache(lambda text: _VECTORS[text], max_size=1)
+        cache.put(cache.embed("Hello world"), "en", "ru", "Привет, мир")
+        cache.put(cache.embed("Goodbye"), "en", "ru", "Пока")
+        assert len(cache) == 1
+        assert cache.get(cache.embed("Hello world"), "en", "ru") is None
+        assert cache.get(cache.embed("Goodbye"), "en", "ru") == "Пока"
+
+    def test_clear(self, cache: SemanticCache) -> None:
+        cache.put(cache.embed("Hello world"), "en", "ru", "Привет, мир")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get(cache.embed("Hello world"), "en", "ru") is None
@@ -0,0 +1,43 @@
+"""Contract: every keyed service refuses to translate until it is configured."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+from app.services.base import TranslationService
+from app.services.claude import ClaudeService
+from app.services.groq_service import GroqService
+from app.services.localai import LocalAIService
+from app.services.openai_service import OpenAIService
+from app.services.openrouter import OpenRouterService
+
+_UNCONFIGURED = pytest.mark.parametrize(
+    ("factory", "message"),
+    [
+        (lambda: OpenAIService(api_key=""), "OpenAI API not configured"),
+        (lambda: OpenRouterService(api_key=""), "OpenRouter API not configured"),
+        (lambda: ClaudeService(api_key=""), "Claude API not configured"),
+        (lambda: GroqService(api_key=""), "Groq API not configured"),
+        (lambda: LocalAIService(base_url=""), "LocalAI not configured"),
+    ],
+    ids=["openai", "openrouter", "claude", "groq", "localai"],
+)
+
+
+@_UNCONFIGURED
+def test_translate_rejects_when_unconfigured(
+    factory: Callable[[], TranslationService], message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        factory().translate("Hello", "en", "ru")
+
+
+@_UNCONFIGURED
+async def test_atranslate_rejects_when_unconfigured(
+    factory: Callable[[], TranslationService], message: str
+) -> None:
+    # Must fail before the async SDK client is built, which itself raises without a key
+    with pytest.raises(ValueError, match=message):
+        await factory().atranslate("Hello", "en", "ru")
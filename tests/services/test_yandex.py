@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
+from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
@@ -14,59 +16,151 @@ from app.services.yandex import YandexService
 class TestYandexService:
     """Tests for YandexService class."""
 
-    def test_not_configured_without_key(self) -> None:
+    @pytest.mark.parametrize("api_key", ["", "test_key"])
+    def test_always_configured(self, api_key: str) -> None:
+        # The free endpoint needs no key, so the service is usable either way
+        assert YandexService(api_key=api_key).is_configured() is True
+
+    @pytest.mark.parametrize(
+        ("api_key", "expected"),
+        [("test_key", "Yandex Translate"), ("", "Yandex Translate (Free)")],
+    )
+    def test_get_name(self, api_key: str, expected: str) -> None:
+        assert YandexService(api_key=api_key).get_name() == expected
+
+    def test_uuid_is_lazy_and_stable(self) -> None:
         service = YandexService(api_key="")
-        assert service.is_configured() is True
+        assert "uuid" not in vars(service)
+        device_id = service.uuid
+        assert len(device_id) == 32
+        int(device_id, 16)
+        assert service.uuid == device_id
+        assert YandexService(api_key="").uuid != device_id
+
+    def test_client_is_reused(self) -> None:
+        service = YandexService(api_key="")
+        client = service._get_client()
+        assert service._get_client() is client
+        service.close()
+        assert client.is_closed
+        assert service._client is None
+
+    def test_context_manager_closes_client(self) -> None:
+        with YandexService(api_key="") as service:
+            client = service._get_client()
+        assert client.is_closed
+
+    @patch("app.services.yandex.H2_AVAILABLE", True)
+    @patch("app.services.yandex.httpx.Client")
+    def test_client_uses_http2_when_available(self, mock_client_class: MagicMock) -> None:
+        YandexService(api_key="")._get_client()
+        assert mock_client_class.call_args.kwargs["http2"] is True
+
+    @staticmethod
+    def _echo_batch(request: httpx.Request) -> httpx.Response:
+        texts = json.loads(request.content)["texts"]
+        return httpx.Response(200, json={"translations": [{"text": f"ru:{t}"} for t in texts]})
+
+    async def test_translate_many(self, router: respx.MockRouter) -> None:
+        route = router.post("https://translate.api.cloud.yandex.net/translate/v2/translate")
+        route.side_effect = self._echo_batch
 
-    def test_configured_with_key(self) -> None:
         service = YandexService(api_key="test_key")
-        assert service.is_configured() is True
+        results = await service.translate_many(["a", "b", "a"], "en", "ru")
+        assert results == ["ru:a", "ru:b", "ru:a"]
+        assert route.call_count == 1
+        assert json.loads(route.calls.last.request.content)["texts"] == ["a", "b"]
+
+    async def test_translate_many_free(self, router: respx.MockRouter) -> None:
+        route = router.post("https://translate.yandex.net/api/v1/tr.json/translate")
+        route.side_effect = lambda request: httpx.Response(
+            200, json={"code": 200, "text": ["ru:" + request.content.decode().split("=")[1]]}
+        )
+
+        service = YandexService(api_key="")
+        results = await service.translate_many(["a", "b", "a"], "en", "ru")
+        assert results == ["ru:a", "ru:b", "ru:a"]
+        assert route.call_count == 2
+
+    def test_translate_batch_splits_by_char_limit(
+        self, router: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(YandexService, "MAX_BATCH_CHARS", 5)
+        route = router.post("https://translate.api.cloud.yandex.net/translate/v2/translate")
+        route.side_effect = self._echo_batch
 
-    def test_get_name(self) -> None:
         service = YandexService(api_key="test_key")
-        assert service.get_name() == "Yandex Translate"
+        results = service.translate_batch(["aa", "bb", "cc", "dddddddd", "e"], "en", "ru")
+        assert results == ["ru:aa", "ru:bb", "ru:cc", "ru:dddddddd", "ru:e"]
+        assert [json.loads(call.request.content)["texts"] for call in route.calls] == [
+            ["aa", "bb"],
+            ["cc"],
+            ["dddddddd"],
+            ["e"],
+        ]
 
-    def test_get_name_free(self) -> None:
-        service = YandexService(api_key="")
-        assert service.get_name() == "Yandex Translate (Free)"
+    def test_translate_batch_empty(self) -> None:
+        assert YandexService(api_key="test_key").translate_batch([], "en", "ru") == []
 
-    @respx.mock
-    def test_translate_success(self, mock_yandex_response: dict[str, Any]) -> None:
-        respx.post("https://translate.api.cloud.yandex.net/translate/v2/translate").mock(
-            return_value=httpx.Response(200, json=mock_yandex_response)
+    def test_translate_batch_count_mismatch_falls_back_to_free(
+        self, router: respx.MockRouter
+    ) -> None:
+        router.post("https://translate.api.cloud.yandex.net/translate/v2/translate").mock(
+            return_value=httpx.Response(200, json={"translations": [{"text": "x"}]})
+        )
+        free_route = router.post("https://translate.yandex.net/api/v1/tr.json/translate").mock(
+            return_value=httpx.Response(200, json={"code": 200, "text": ["Привет"]})
         )
 
         service = YandexService(api_key="test_key")
-        result = service.translate("Hello, world!", "en", "ru")
-        assert result == "Привет, мир!"
+        assert service.translate_batch(["a", "b"], "en", "ru") == ["Привет", "Привет"]
+        assert free_route.call_count == 2
 
-    @respx.mock
-    def test_translate_with_auto_detect(self, mock_yandex_response: dict[str, Any]) -> None:
-        respx.post("https://translate.api.cloud.yandex.net/translate/v2/translate").mock(
+    async def test_atranslate(
+        self, router: respx.MockRouter, mock_yandex_response: dict[str, Any]
+    ) -> None:
+        router.post("https://translate.api.cloud.yandex.net/translate/v2/translate").mock(
             return_value=httpx.Response(200, json=mock_yandex_response)
         )
 
         service = YandexService(api_key="test_key")
-        result = service.translate("Hello, world!", "auto", "ru")
-        assert result == "Привет, мир!"
+        assert await service.atranslate("Hello, world!", "en", "ru") == "Привет, мир!"
 
-    @respx.mock
-    def test_translate_api_error_fallback_to_free(self) -> None:
-        respx.post("https://translate.api.cloud.yandex.net/translate/v2/translate").mock(
-            return_value=httpx.Response(401, json={"message": "Invalid API key"})
-        )
+    @pytest.mark.parametrize(("source_lang", "sends_source"), [("en", True), ("auto", False)])
+    def test_translate_success(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_yandex_response: dict[str, Any],
+        source_lang: str,
+        sends_source: bool,
+    ) -> None:
+        calls: list[tuple[str, dict[str, Any]]] = []
 
-        respx.post("https://translate.yandex.net/api/v1/tr.json/translate").mock(
-            return_value=httpx.Response(200, json={"code": 200, "text": ["Привет"]})
-        )
+        def fake_post(self: YandexService, url: str, **kwargs: Any) -> httpx.Response:
+            calls.append((url, kwargs))
+            return httpx.Response(200, json=mock_yandex_response)
+
+        monkeypatch.setattr(YandexService, "_http_post", fake_post)
+
+        service = YandexService(api_key="test_key")
+        assert service.translate("Hello, world!", source_lang, "ru") == "Привет, мир!"
+        [(url, kwargs)] = calls
+        assert url == YandexService.API_URL
+        assert ("sourceLanguageCode" in kwargs["json"]) is sends_source
+
+    def test_translate_api_error_fallback_to_free(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fake_post(self: YandexService, url: str, **kwargs: Any) -> httpx.Response:
+            if url == YandexService.API_URL:
+                return httpx.Response(401, json={"message": "Invalid API key"})
+            return httpx.Response(200, json={"code": 200, "text": ["Привет"]})
+
+        monkeypatch.setattr(YandexService, "_http_post", fake_post)
 
         service = YandexService(api_key="invalid_key")
-        result = service.translate("Hello", "en", "ru")
-        assert result == "Привет"
+        assert service.translate("Hello", "en", "ru") == "Привет"
 
-    @respx.mock
-    def test_translate_with_free_api(self) -> None:
-        respx.post("https://translate.yandex.net/api/v1/tr.json/translate").mock(
+    def test_translate_with_free_api(self, router: respx.MockRouter) -> None:
+        router.post("https://translate.yandex.net/api/v1/tr.json/translate").mock(
             return_value=httpx.Response(200, json={"code": 200, "text": ["Привет"]})
         )
 
@@ -74,20 +168,17 @@ class TestYandexService:
         result = service.translate("Hello", "en", "ru")
         assert result == "Привет"
 
-    @respx.mock
-    def test_translate_free_api_error(self) -> None:
-        respx.post("https://translate.yandex.net/api/v1/tr.json/translate").mock(
+    def test_translate_free_api_error(self, router: respx.MockRouter) -> None:
+        router.post("https://translate.yandex.net/api/v1/tr.json/translate").mock(
             return_value=httpx.Response(200, json={"code": 500, "message": "Server error"})
         )
 
         service = YandexService(api_key="")
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Yandex free API error"):
             service.translate("Hello", "en", "ru")
-        assert "Yandex free API error" in str(exc_info.value)
 
-    @respx.mock
-    def test_translate_paid_api_error(self) -> None:
-        respx.post("https://translate.api.cloud.yandex.net/translate/v2/translate").mock(
+    def test_translate_paid_api_error(self, router: respx.MockRouter) -> None:
+        router.post("https://translate.api.cloud.yandex.net/translate/v2/translate").mock(
             return_value=httpx.Response(401, json={"message": "Unauthorized"})
         )
 
@@ -95,9 +186,8 @@ class TestYandexService:
         with pytest.raises(ValueError, match="Yandex API error"):
             service._translate_with_api_key("Hello", "en", "ru")
 
-    @respx.mock
-    def test_translate_paid_api_request_exception(self) -> None:
-        respx.post("https://translate.api.cloud.yandex.net/translate/v2/translate").mock(
+    def test_translate_paid_api_request_exception(self, router: respx.MockRouter) -> None:
+        router.post("https://translate.api.cloud.yandex.net/translate/v2/translate").mock(
             side_effect=httpx.ConnectError("timeout")
         )
 
@@ -105,9 +195,9 @@ class TestYandexService:
         with pytest.raises(ValueError, match="Yandex API request failed"):
             service._translate_with_api_key("Hello", "en", "ru")
 
-    @respx.mock
-    def test_translate_free_api_429_retry_then_success(self) -> None:
-        route = respx.post("https://translate.yandex.net/api/v1/tr.json/translate")
+    @pytest.mark.slow
+    def test_translate_free_api_429_retry_then_success(self, router: respx.MockRouter) -> None:
+        route = router.post("https://translate.yandex.net/api/v1/tr.json/translate")
         route.side_effect = [
             httpx.Response(429),
             httpx.Response(200, json={"code": 200, "text": ["Привет"]}),
@@ -117,9 +207,9 @@ class TestYandexService:
         result = service._translate_free("Hello", "en", "ru")
         assert result == "Привет"
 
-    @respx.mock
-    def test_translate_free_api_429_exhausted(self) -> None:
-        respx.post("https://translate.yandex.net/api/v1/tr.json/translate").mock(
+    @pytest.mark.slow
+    def test_translate_free_api_429_exhausted(self, router: respx.MockRouter) -> None:
+        router.post("https://translate.yandex.net/api/v1/tr.json/translate").mock(
             return_value=httpx.Response(429)
         )
 
@@ -127,9 +217,9 @@ class TestYandexService:
         with pytest.raises(ValueError, match="rate limit"):
             service._translate_free("Hello", "en", "ru")
 
-    @respx.mock
-    def test_translate_free_api_request_error_retry(self) -> None:
-        route = respx.post("https://translate.yandex.net/api/v1/tr.json/translate")
+    @pytest.mark.slow
+    def test_translate_free_api_request_error_retry(self, router: respx.MockRouter) -> None:
+        route = router.post("https://translate.yandex.net/api/v1/tr.json/translate")
         route.side_effect = [
             httpx.ConnectError("fail"),
             httpx.Response(200, json={"code": 200, "text": ["Привет"]}),
@@ -139,9 +229,9 @@ class TestYandexService:
         result = service._translate_free("Hello", "en", "ru")
         assert result == "Привет"
 
-    @respx.mock
-    def test_translate_free_api_request_error_exhausted(self) -> None:
-        respx.post("https://translate.yandex.net/api/v1/tr.json/translate").mock(
+    @pytest.mark.slow
+    def test_translate_free_api_request_error_exhausted(self, router: respx.MockRouter) -> None:
+        router.post("https://translate.yandex.net/api/v1/tr.json/translate").mock(
             side_effect=httpx.ConnectError("fail")
         )
 
@@ -149,12 +239,21 @@ class TestYandexService:
         with pytest.raises(ValueError, match="request failed"):
             service._translate_free("Hello", "en", "ru")
 
-    @respx.mock
-    def test_translate_free_api_http_error(self) -> None:
-        respx.post("https://translate.yandex.net/api/v1/tr.json/translate").mock(
+    def test_translate_free_api_http_error(self, router: respx.MockRouter) -> None:
+        router.post("https://translate.yandex.net/api/v1/tr.json/translate").mock(
             return_value=httpx.Response(500, text="Internal error")
         )
 
         service = YandexService(api_key="")
         with pytest.raises(ValueError, match="HTTP error"):
             service._translate_free("Hello", "en", "ru")
+
+    def test_translate_paid_api_error_body_truncated(self, router: respx.MockRouter) -> None:
+        router.post("https://translate.api.cloud.yandex.net/translate/v2/translate").mock(
+            return_value=httpx.Response(502, content=b"x" * 5000)
+        )
+
+        service = YandexService(api_key="test_key")
+        with pytest.raises(ValueError) as exc_info:
+            service._translate_with_api_key("Hello", "en", "ru")
+        assert str(exc_info.value) == "Yandex API error 502: " + "x" * 512
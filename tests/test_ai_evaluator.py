@@ -1,19 +1,139 @@
 """Tests for AI evaluator service."""
 
 import json
+import re
+import types
+from dataclasses import dataclass
+from unittest.mock import Mock
 
 import pytest
 
+from app.services import ai_evaluator
 from app.services.ai_evaluator import AIEvaluator, EvaluationResult
 
+pytestmark = pytest.mark.xdist_group("ai_evaluator")
 
+# Expected error messages, compiled once for pytest.raises(match=...)
+_RE_NO_TRANS = re.compile("No translations provided")
+_RE_NOT_CONF = re.compile("is not configured")
+_RE_EVAL_FAIL = re.compile("Evaluation failed")
+_RE_PARSE_FAIL = re.compile("Failed to parse")
+
+# Shared translation inputs; read-only so no test can leak changes into another
+_TRANS_DEEPL = types.MappingProxyType({"deepl": "Привет мир"})
+_TRANS_TWO = types.MappingProxyType({"deepl": "Привет мир", "yandex": "Здравствуй мир"})
+_TRANS_TEST = types.MappingProxyType({"deepl": "Тест"})
+
+# Canned evaluation replies, serialized once at import
+_EVAL_DEEPL_YANDEX = json.dumps(
+    {
+        "evaluations": [
+            {
+                "service": "deepl",
+                "score": 8.5,
+                "explanation": "Excellent translation with natural flow",
+            },
+            {
+                "service": "yandex",
+                "score": 7.2,
+                "explanation": "Good translation with minor issues",
+            },
+        ]
+    }
+)
+
+_EVAL_WITH_IMPROVEMENT = json.dumps(
+    {
+        "evaluations": [
+            {"service": "deepl", "score": 8.5, "explanation": "Excellent translation"},
+            {"service": "yandex", "score": 7.2, "explanation": "Good translation"},
+        ],
+        "improved_translation": "Превосходный перевод",
+    }
+)
+
+_EVAL_OUT_OF_RANGE = json.dumps(
+    {
+        "evaluations": [
+            {"service": "deepl", "score": 15.0, "explanation": "Too high"},
+            {"service": "yandex", "score": -5.0, "explanation": "Too low"},
+        ]
+    }
+)
+
+_EVAL_DEEPL_GOOD = json.dumps(
+    {
+        "evaluations": [
+            {"service": "deepl", "score": 8.0, "explanation": "Good"},
+        ]
+    }
+)
+
+_EVAL_CODE_BLOCK = """```json
+{
+  "evaluations": [
+    {"service": "deepl", "score": 9.0, "explanation": "Perfect"}
+  ]
+}
+```"""
+
+_EVAL_MISSING_FIELDS = json.dumps(
+    {
+        "evaluations": [
+            {"service": "deepl"},  # Missing score and explanation
+        ]
+    }
+)
+
+_EVAL_DEEPL_GREAT = json.dumps(
+    {
+        "evaluations": [
+            {
+                "service": "deepl",
+                "score": 8.5,
+                "explanation": "Great translation",
+            }
+        ]
+    }
+)
+
+# Re-evaluation: the previous improved translation is scored like any other service
+_EVAL_REEVALUATION = json.dumps(
+    {
+        "evaluations": [
+            {"service": "deepl", "score": 7.0, "explanation": "Good"},
+            {"service": "ai_improved", "score": 9.0, "explanation": "Best"},
+        ]
+    }
+)
+
+# Unescaped quotes in the improved translation break the JSON after the scores
+_EVAL_MALFORMED_IMPROVEMENT = """{
+  "evaluations": [
+    {"service": "deepl", "score": 8.0, "explanation": "Good"}
+  ],
+  "improved_translation": "Он сказал "привет""
+}"""
+
+# Everything the evaluation prompt must carry through for the sample inputs
+_EVALUATION_PROMPT_TERMS = (
+    "Hello world",
+    "Привет мир",
+    "Здравствуй мир",
+    "en",
+    "ru",
+    "JSON",
+    "improved_translation",
+)
+
+
+@dataclass
 class MockLLMService:
     """Mock LLM service for testing."""
 
-    def __init__(self, response: str = "", configured: bool = True):
-        self.response = response
-        self.configured = configured
-        self.call_count = 0
+    response: str = ""
+    configured: bool = True
+    call_count: int = 0
 
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         self.call_count += 1
@@ -28,6 +148,27 @@ class MockLLMService:
         return "MockLLM"
 
 
+# Stand-in for tests that never reach the LLM (prompt building, parsing, Ren'Py helpers)
+_STUB = types.SimpleNamespace(
+    is_configured=lambda: True, get_name=lambda: "stub", translate=lambda *a, **k: ""
+)
+
+
+@pytest.fixture
+def mock_service() -> MockLLMService:
+    return MockLLMService()
+
+
+@pytest.fixture
+def evaluator(mock_service: MockLLMService) -> AIEvaluator:
+    return AIEvaluator(mock_service)
+
+
+@pytest.fixture(scope="module")
+def stub_evaluator() -> AIEvaluator:
+    return AIEvaluator(_STUB)
+
+
 class TestEvaluationResult:
     """Tests for EvaluationResult dataclass."""
 
@@ -63,17 +204,11 @@ class TestEvaluationResult:
 class TestAIEvaluator:
     """Tests for AIEvaluator class."""
 
-    def test_init(self):
-        mock_service = MockLLMService()
-        evaluator = AIEvaluator(mock_service)
-
+    def test_init(self, evaluator, mock_service):
         assert evaluator.llm_service == mock_service
 
-    def test_evaluate_translations_empty_dict(self):
-        mock_service = MockLLMService()
-        evaluator = AIEvaluator(mock_service)
-
-        with pytest.raises(ValueError, match="No translations provided"):
+    def test_evaluate_translations_empty_dict(self, evaluator):
+        with pytest.raises(ValueError, match=_RE_NO_TRANS):
             evaluator.evaluate_translations(
                 original_text="Hello world",
                 translations={},
@@ -81,56 +216,43 @@ class TestAIEvaluator:
                 target_lang="ru",
             )
 
-    def test_evaluate_translations_service_not_configured(self):
-        mock_service = MockLLMService(configured=False)
-        evaluator = AIEvaluator(mock_service)
+    def test_evaluate_translations_service_not_configured(self, evaluator, mock_service):
+        mock_service.configured = False
 
-        with pytest.raises(RuntimeError, match="is not configured"):
+        with pytest.raises(RuntimeError, match=_RE_NOT_CONF):
             evaluator.evaluate_translations(
                 original_text="Hello world",
-                translations={"deepl": "Привет мир"},
+                translations=_TRANS_DEEPL,
                 source_lang="en",
                 target_lang="ru",
             )
 
-    def test_evaluate_translations_success(self):
-        eval_response = json.dumps(
-            {
-                "evaluations": [
-                    {
-                        "service": "deepl",
-                        "score": 8.5,
-                        "explanation": "Excellent translation with natural flow",
-                    },
-                    {
-                        "service": "yandex",
-                        "score": 7.2,
-                        "explanation": "Good translation with minor issues",
-                    },
-                ]
-            }
-        )
-
-        improved_translation = "Превосходный перевод"
+    def test_evaluate_translations_success(self, evaluator, mock_service):
+        mock_service.response = _EVAL_WITH_IMPROVEMENT
 
-        mock_service = MockLLMService(response=eval_response)
-        evaluator = AIEvaluator(mock_service)
+        results = evaluator.evaluate_translations(
+            original_text="Hello world",
+            translations=_TRANS_TWO,
+            source_lang="en",
+            target_lang="ru",
+        )
 
-        # Override second call to return improved translation
-        call_count = [0]
+        # Scores and the improved translation come back from a single LLM call
+        assert mock_service.call_count == 1
+        assert results["deepl"].score == 8.5
+        assert results["yandex"].score == 7.2
+        assert results["ai_improved"] == "Превосходный перевод"
 
-        def mock_translate(text: str, source_lang: str, target_lang: str) -> str:
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return eval_response
-            else:
-                return improved_translation
+    def test_evaluate_translations_separate_improvement_fallback(self, evaluator, mock_service):
+        improved_translation = "Превосходный перевод"
 
-        mock_service.translate = mock_translate  # type: ignore[method-assign]
+        mock_service.translate = Mock(  # type: ignore[method-assign]
+            side_effect=[_EVAL_DEEPL_YANDEX, improved_translation]
+        )
 
         results = evaluator.evaluate_translations(
             original_text="Hello world",
-            translations={"deepl": "Привет мир", "yandex": "Здравствуй мир"},
+            translations=_TRANS_TWO,
             source_lang="en",
             target_lang="ru",
         )
@@ -148,112 +270,57 @@ class TestAIEvaluator:
 
         assert results["ai_improved"] == improved_translation
 
-    def test_evaluate_translations_json_with_code_blocks(self):
-        eval_response = """```json
-{
-  "evaluations": [
-    {"service": "deepl", "score": 9.0, "explanation": "Perfect"}
-  ]
-}
-```"""
-
-        mock_service = MockLLMService(response=eval_response)
-        evaluator = AIEvaluator(mock_service)
-
-        # Mock second call
-        call_count = [0]
-
-        def mock_translate(text: str, source_lang: str, target_lang: str) -> str:
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return eval_response
-            else:
-                return "Improved"
-
-        mock_service.translate = mock_translate  # type: ignore[method-assign]
-
-        results = evaluator.evaluate_translations(
-            original_text="Test",
-            translations={"deepl": "Тест"},
-            source_lang="en",
-            target_lang="ru",
+    @pytest.mark.parametrize(
+        ("response", "translations", "expected_scores"),
+        [
+            (_EVAL_REEVALUATION, {**_TRANS_DEEPL, "ai_improved": "Привет, мир"}, {"deepl": 7.0}),
+            (_EVAL_MALFORMED_IMPROVEMENT, _TRANS_DEEPL, {"deepl": 8.0}),
+            (
+                json.dumps({**json.loads(_EVAL_DEEPL_GOOD), "improved_translation": ["x"]}),
+                _TRANS_DEEPL,
+                {"deepl": 8.0},
+            ),
+        ],
+        ids=["re-evaluation", "malformed-improvement", "non-string-improvement"],
+    )
+    def test_evaluate_translations_falls_back_to_separate_improvement(
+        self, evaluator, mock_service, response, translations, expected_scores
+    ):
+        mock_service.translate = Mock(  # type: ignore[method-assign]
+            side_effect=[response, "Привет всем"]
         )
 
-        assert isinstance(results["deepl"], EvaluationResult)
-        assert results["deepl"].score == 9.0
-
-    def test_evaluate_translations_score_clamping(self):
-        eval_response = json.dumps(
-            {
-                "evaluations": [
-                    {"service": "deepl", "score": 15.0, "explanation": "Too high"},
-                    {"service": "yandex", "score": -5.0, "explanation": "Too low"},
-                ]
-            }
-        )
-
-        mock_service = MockLLMService(response=eval_response)
-        evaluator = AIEvaluator(mock_service)
-
-        call_count = [0]
-
-        def mock_translate(text: str, source_lang: str, target_lang: str) -> str:
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return eval_response
-            else:
-                return "Improved"
-
-        mock_service.translate = mock_translate  # type: ignore[method-assign]
-
         results = evaluator.evaluate_translations(
-            original_text="Test",
-            translations={"deepl": "Тест", "yandex": "Проверка"},
+            original_text="Hello world",
+            translations=translations,
             source_lang="en",
             target_lang="ru",
         )
 
-        assert results["deepl"].score == 10.0
-        assert results["yandex"].score == 0.0
+        assert mock_service.translate.call_count == 2
+        for service, score in expected_scores.items():
+            assert results[service].score == score
+        assert results["ai_improved"] == "Привет всем"
 
-    def test_evaluate_translations_evaluation_error(self):
-        mock_service = MockLLMService(response="")
-        evaluator = AIEvaluator(mock_service)
+    def test_evaluate_translations_evaluation_error(self, evaluator, mock_service):
+        mock_service.response = ""
 
-        with pytest.raises(RuntimeError, match="Evaluation failed"):
+        with pytest.raises(RuntimeError, match=_RE_EVAL_FAIL):
             evaluator.evaluate_translations(
                 original_text="Test",
-                translations={"deepl": "Тест"},
+                translations=_TRANS_TEST,
                 source_lang="en",
                 target_lang="ru",
             )
 
-    def test_evaluate_translations_improvement_error(self):
-        eval_response = json.dumps(
-            {
-                "evaluations": [
-                    {"service": "deepl", "score": 8.0, "explanation": "Good"},
-                ]
-            }
+    def test_evaluate_translations_improvement_error(self, evaluator, mock_service):
+        mock_service.translate = Mock(  # type: ignore[method-assign]
+            side_effect=[_EVAL_DEEPL_GOOD, RuntimeError("Improvement failed")]
         )
 
-        mock_service = MockLLMService(response=eval_response)
-        evaluator = AIEvaluator(mock_service)
-
-        call_count = [0]
-
-        def mock_translate(text: str, source_lang: str, target_lang: str) -> str:
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return eval_response
-            else:
-                raise RuntimeError("Improvement failed")
-
-        mock_service.translate = mock_translate  # type: ignore[method-assign]
-
         results = evaluator.evaluate_translations(
             original_text="Test",
-            translations={"deepl": "Тест"},
+            translations=_TRANS_TEST,
             source_lang="en",
             target_lang="ru",
         )
@@ -262,31 +329,21 @@ class TestAIEvaluator:
         assert "deepl" in results
         assert "ai_improved" not in results
 
-    def test_create_evaluation_prompt(self):
-        mock_service = MockLLMService()
-        evaluator = AIEvaluator(mock_service)
-
-        prompt = evaluator._create_evaluation_prompt(
+    def test_create_evaluation_prompt(self, stub_evaluator):
+        prompt = stub_evaluator._create_evaluation_prompt(
             original_text="Hello world",
-            translations={"deepl": "Привет мир", "yandex": "Здравствуй мир"},
+            translations=_TRANS_TWO,
             source_lang="en",
             target_lang="ru",
         )
 
-        assert "Hello world" in prompt
-        assert "Привет мир" in prompt
-        assert "Здравствуй мир" in prompt
-        assert "en" in prompt
-        assert "ru" in prompt
-        assert "JSON" in prompt
+        missing = [term for term in _EVALUATION_PROMPT_TERMS if term not in prompt]
+        assert not missing, missing
 
-    def test_create_improvement_prompt_no_renpy(self):
-        mock_service = MockLLMService()
-        evaluator = AIEvaluator(mock_service)
-
-        prompt = evaluator._create_improvement_prompt(
+    def test_create_improvement_prompt_no_renpy(self, stub_evaluator):
+        prompt = stub_evaluator._create_improvement_prompt(
             original_text="Hello world",
-            translations={"deepl": "Привет мир"},
+            translations=_TRANS_DEEPL,
             source_lang="en",
             target_lang="ru",
             is_renpy=False,
@@ -296,13 +353,10 @@ class TestAIEvaluator:
         assert "Привет мир" in prompt
         assert "CRITICAL" not in prompt
 
-    def test_create_improvement_prompt_with_renpy(self):
-        mock_service = MockLLMService()
-        evaluator = AIEvaluator(mock_service)
-
-        prompt = evaluator._create_improvement_prompt(
+    def test_create_improvement_prompt_with_renpy(self, stub_evaluator):
+        prompt = stub_evaluator._create_improvement_prompt(
             original_text='    character "Hello world"',
-            translations={"deepl": "Привет мир"},
+            translations=_TRANS_DEEPL,
             source_lang="en",
             target_lang="ru",
             is_renpy=True,
@@ -311,36 +365,31 @@ class TestAIEvaluator:
         assert "CRITICAL" in prompt
         assert "Ren'Py" in prompt
 
-    def test_parse_evaluation_response_invalid_json(self):
-        mock_service = MockLLMService()
-        evaluator = AIEvaluator(mock_service)
-
-        with pytest.raises(RuntimeError, match="Failed to parse"):
-            evaluator._parse_evaluation_response("invalid json", "2024-01-01")
-
-    def test_parse_evaluation_response_missing_fields(self):
-        mock_service = MockLLMService()
-        evaluator = AIEvaluator(mock_service)
-
-        response = json.dumps(
-            {
-                "evaluations": [
-                    {"service": "deepl"},  # Missing score and explanation
-                ]
-            }
-        )
-
-        results = evaluator._parse_evaluation_response(response, "2024-01-01")
-
-        # Should handle missing fields with defaults
-        assert "deepl" in results
-        assert results["deepl"].score == 0.0
-        assert results["deepl"].explanation == ""
-
-    def test_preserve_renpy_structure(self):
-        mock_service = MockLLMService()
-        evaluator = AIEvaluator(mock_service)
-
+    def test_parse_evaluation_response_invalid_json(self, stub_evaluator):
+        with pytest.raises(RuntimeError, match=_RE_PARSE_FAIL):
+            stub_evaluator._parse_evaluation_response("invalid json", "2024-01-01")
+
+    @pytest.mark.parametrize(
+        ("response", "expected_scores"),
+        [
+            # Scores outside 0-10 are clamped
+            (_EVAL_OUT_OF_RANGE, {"deepl": 10.0, "yandex": 0.0}),
+            # Replies wrapped in a Markdown code fence
+            (_EVAL_CODE_BLOCK, {"deepl": 9.0}),
+            # Missing score and explanation fall back to defaults
+            (_EVAL_MISSING_FIELDS, {"deepl": 0.0}),
+        ],
+        ids=["clamped", "code-block", "missing-fields"],
+    )
+    def test_parse_evaluation_response(self, stub_evaluator, response, expected_scores):
+        results = stub_evaluator._parse_evaluation_response(response, "2024-01-01")
+
+        assert {service: result.score for service, result in results.items()} == expected_scores
+        assert all(isinstance(result, EvaluationResult) for result in results.values())
+        if response is _EVAL_MISSING_FIELDS:
+            assert results["deepl"].explanation == ""
+
+    def test_preserve_renpy_structure(self, stub_evaluator):
         original = """label start:
     character "Hello world"
     another "How are you?"
@@ -349,70 +398,47 @@ class TestAIEvaluator:
         improved = """Привет мир
 Как дела?"""
 
-        result = evaluator._preserve_renpy_structure(original, improved)
+        result = stub_evaluator._preserve_renpy_structure(original, improved)
 
         assert 'character "Привет мир"' in result
         assert 'another "Как дела?"' in result
         assert "label start:" in result
         assert result.startswith("label start:")
 
-    def test_preserve_renpy_structure_non_renpy(self):
-        mock_service = MockLLMService()
-        evaluator = AIEvaluator(mock_service)
-
+    def test_preserve_renpy_structure_non_renpy(self, stub_evaluator):
         original = "Just plain text"
         improved = "Просто текст"
 
-        result = evaluator._preserve_renpy_structure(original, improved)
+        result = stub_evaluator._preserve_renpy_structure(original, improved)
 
         assert result == improved
 
-    def test_is_renpy_dialogue(self):
-        mock_service = MockLLMService()
-        evaluator = AIEvaluator(mock_service)
-
+    def test_is_renpy_dialogue(self, stub_evaluator):
         # Test Ren'Py dialogue
-        assert evaluator._is_renpy_dialogue('    character "Hello"')
-        assert evaluator._is_renpy_dialogue('character "Hello"')
+        assert stub_evaluator._is_renpy_dialogue('    character "Hello"')
+        assert stub_evaluator._is_renpy_dialogue('character "Hello"')
 
         # Test non-Ren'Py text
-        assert not evaluator._is_renpy_dialogue("Plain text")
-        assert not evaluator._is_renpy_dialogue("No dialogue here")
+        assert not stub_evaluator._is_renpy_dialogue("Plain text")
+        assert not stub_evaluator._is_renpy_dialogue("No dialogue here")
 
-    def test_integration_with_mock_service(self):
-        # Use MockLLMService instead of real OpenAI to avoid API calls
-        eval_response = json.dumps(
-            {
-                "evaluations": [
-                    {
-                        "service": "deepl",
-                        "score": 8.5,
-                        "explanation": "Great translation",
-                    }
-                ]
-            }
-        )
+    def test_renpy_patterns_compiled_once(self, stub_evaluator):
+        pattern = ai_evaluator._RENPY_RE
+        stub_evaluator._is_renpy_dialogue('character "Hello"')
+        stub_evaluator._preserve_renpy_structure('character "Hello"', "Привет")
+        assert ai_evaluator._RENPY_RE is pattern
 
+    def test_integration_with_mock_service(self, evaluator, mock_service):
+        # Use MockLLMService instead of real OpenAI to avoid API calls
         improvement_response = "Превосходный перевод"
 
-        # Create mock service with sequential responses
-        call_count = [0]
-
-        def mock_translate(text: str, source_lang: str, target_lang: str) -> str:
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return eval_response
-            else:
-                return improvement_response
-
-        mock_service = MockLLMService()
-        mock_service.translate = mock_translate  # type: ignore[method-assign]
-
-        evaluator = AIEvaluator(mock_service)
+        mock_service.translate = Mock(  # type: ignore[method-assign]
+            side_effect=[_EVAL_DEEPL_GREAT, improvement_response]
+        )
 
         results = evaluator.evaluate_translations(
             original_text="Hello world",
-            translations={"deepl": "Привет мир"},
+            translations=_TRANS_DEEPL,
             source_lang="en",
             target_lang="ru",
         )
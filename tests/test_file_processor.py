@@ -2,43 +2,55 @@
 
 from __future__ import annotations
 
+import uuid
 from pathlib import Path
 
+import pytest
+
 from app.core.file_processor import FileProcessor
 
+pytestmark = pytest.mark.xdist_group("file_processor")
+
+
+@pytest.fixture(scope="module")
+def parsed_rpy(sample_rpy_content: bytes) -> str:
+    """The sample script parsed once with the default options."""
+    return FileProcessor.read_rpy(sample_rpy_content)
+
 
 class TestFileProcessor:
     """Tests for FileProcessor class."""
 
-    def test_detect_encoding_utf8(self) -> None:
-        content = b"Hello, world!"
-        encoding = FileProcessor.detect_encoding(content)
-        assert encoding.lower() in ["utf-8", "ascii"]
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            (b"Hello, world!", {"utf-8"}),
+            ("Привет, мир!".encode(), {"utf-8"}),
+            ("Привет, мир!".encode("utf-8-sig"), {"utf-8-sig"}),
+            ("Привет, мир! Как дела?".encode("cp1251"), {"windows-1251", "cp1251"}),
+            # Empty content cannot be detected and falls back to utf-8
+            (b"", {"utf-8"}),
+        ],
+    )
+    def test_detect_encoding(self, content: bytes, expected: set[str]) -> None:
+        assert FileProcessor.detect_encoding(content).lower() in expected
 
     def test_detect_encoding_utf16(self) -> None:
         content = "Hello, world!".encode("utf-16")
         encoding = FileProcessor.detect_encoding(content)
         assert "utf" in encoding.lower() or "16" in encoding.lower()
 
-    def test_read_txt(self) -> None:
-        content = b"Hello, world!"
-        result = FileProcessor.read_txt(content)
-        assert result == "Hello, world!"
-
-    def test_read_txt_with_unicode(self) -> None:
-        content = "Привет, мир!".encode()
-        result = FileProcessor.read_txt(content)
-        assert result == "Привет, мир!"
+    @pytest.mark.parametrize("text", ["Hello, world!", "Привет, мир!"])
+    def test_read_txt(self, text: str) -> None:
+        assert FileProcessor.read_txt(text.encode()) == text
 
-    def test_read_rpy_dialogue(self, sample_rpy_content: bytes) -> None:
-        result = FileProcessor.read_rpy(sample_rpy_content)
-        assert "Hello, how are you?" in result
-        assert "fine, thanks" in result
+    def test_read_rpy_dialogue(self, parsed_rpy: str) -> None:
+        assert "Hello, how are you?" in parsed_rpy
+        assert "fine, thanks" in parsed_rpy
 
-    def test_read_rpy_menu_options(self, sample_rpy_content: bytes) -> None:
-        result = FileProcessor.read_rpy(sample_rpy_content)
-        assert "Good option" in result
-        assert "Bad option" in result
+    def test_read_rpy_menu_options(self, parsed_rpy: str) -> None:
+        assert "Good option" in parsed_rpy
+        assert "Bad option" in parsed_rpy
 
     def test_read_rpy_translatable_strings(self, sample_rpy_content: bytes) -> None:
         result = FileProcessor.read_rpy(sample_rpy_content, translate_strings=True)
@@ -61,10 +73,21 @@ class TestFileProcessor:
         result = FileProcessor.process_bytes(content, "txt")
         assert result == "Test content"
 
-    def test_read_html(self) -> None:
-        html_content = b"<html><body><p>Hello, world!</p></body></html>"
-        result = FileProcessor.read_html(html_content)
-        assert "Hello, world!" in result
+    @pytest.mark.parametrize(
+        ("html_content", "expected"),
+        [
+            (b"<html><body><p>Hello, world!</p></body></html>", "Hello, world!"),
+            # Missing closing tags
+            (b"<html><body><p>Test</p>", "Test"),
+        ],
+    )
+    def test_read_html(self, html_content: bytes, expected: str) -> None:
+        assert expected in FileProcessor.read_html(html_content)
+
+    def test_read_html_without_selectolax(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("app.core.file_processor.SELECTOLAX_AVAILABLE", False)
+        html_content = b"<html><style>p {}</style><body><p>Hello,  world!</p></body></html>"
+        assert FileProcessor.read_html(html_content) == "Hello, world!"
 
     def test_read_html_strips_scripts(self) -> None:
         html_content = b"<html><script>alert('bad')</script><body><p>Good text</p></body></html>"
@@ -72,11 +95,16 @@ class TestFileProcessor:
         assert "Good text" in result
         assert "alert" not in result
 
-    def test_read_md(self) -> None:
-        md_content = b"# Hello\n\nThis is **bold** text."
+    @pytest.mark.parametrize(
+        ("md_content", "expected"),
+        [
+            (b"# Hello\n\nThis is **bold** text.", ("Hello", "bold")),
+            (b"# Title\n\nContent", ("Title", "Content")),
+        ],
+    )
+    def test_read_md(self, md_content: bytes, expected: tuple[str, ...]) -> None:
         result = FileProcessor.read_md(md_content)
-        assert "Hello" in result
-        assert "bold" in result
+        assert all(part in result for part in expected)
 
     def test_supported_extensions(self) -> None:
         assert "txt" in FileProcessor.SUPPORTED_EXTENSIONS
@@ -91,8 +119,8 @@ class TestFileProcessor:
         # The reconstruction should preserve structure
         assert 'e "' in result
 
-    def test_unsupported_format(self, temp_dir: Path) -> None:
-        file_path = temp_dir / "test.xyz"
+    def test_unsupported_format(self, shared_temp_dir: Path) -> None:
+        file_path = shared_temp_dir / f"test_{uuid.uuid4().hex}.xyz"
         file_path.write_text("Some content", encoding="utf-8")
 
         # Should fall back to text reading
@@ -105,31 +133,12 @@ class TestFileProcessor:
         encoding = FileProcessor.detect_encoding(content)
         assert encoding is not None
 
-    def test_detect_encoding_exception_handling(self) -> None:
-        # Empty content should trigger fallback to utf-8
-        content = b""
-        encoding = FileProcessor.detect_encoding(content)
-        assert encoding == "utf-8"
-
     def test_read_txt_with_fallback_encoding(self) -> None:
         # Create invalid UTF-8 sequence
         content = b"\xff\xfe\x41\x00Invalid\xff\xff"
         result = FileProcessor.read_txt(content)
         assert "Invalid" in result or "A" in result
 
-    def test_read_html_error_handling(self) -> None:
-        # Create content that might cause parsing issues
-        html_content = b"<html><body><p>Test</p>"  # Missing closing tags
-        result = FileProcessor.read_html(html_content)
-        assert "Test" in result
-
-    def test_read_md_error_handling(self) -> None:
-        # Valid markdown but testing error path coverage
-        md_content = b"# Title\n\nContent"
-        result = FileProcessor.read_md(md_content)
-        assert "Title" in result
-        assert "Content" in result
-
     def test_read_rpy_old_dialogue_format(self) -> None:
         rpy_content = b'"Old style dialogue"'
         result = FileProcessor.read_rpy(rpy_content)
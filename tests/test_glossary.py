@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
 from app.utils.glossary import Glossary
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 class TestGlossary:
     """Tests for Glossary class."""
@@ -26,6 +30,37 @@ class TestGlossary:
         assert glossary.get_entry("Hello") == "Привет"
         assert glossary.get_entry("world") == "мир"
 
+    def test_load_invalid_json(self, temp_dir: Path) -> None:
+        glossary_path = temp_dir / "glossary.json"
+        glossary_path.write_text("{not json", encoding="utf-8")
+        glossary = Glossary(glossary_path)
+        assert len(glossary) == 0
+
+    def test_reload_after_file_removed(self, temp_glossary: Path) -> None:
+        glossary = Glossary(temp_glossary)
+        temp_glossary.unlink()
+        glossary.load()
+        assert len(glossary) == 0
+        assert glossary.apply("Hello") == "Hello"
+
+    def test_from_dict_skips_disk(
+        self, temp_dir: Path, glossary_entries: Mapping[str, str]
+    ) -> None:
+        glossary_path = temp_dir / "glossary.json"
+        glossary = Glossary.from_dict(
+            glossary_entries, case_sensitive=True, glossary_path=glossary_path
+        )
+
+        assert glossary.get_all_entries() == glossary_entries
+        assert glossary.is_case_sensitive()
+        assert not glossary_path.exists()
+
+        # Entries are copied, and save() writes to the given path
+        glossary.add_entry("test", "тест")
+        assert "test" not in glossary_entries
+        glossary.save()
+        assert Glossary(glossary_path).get_entry("test") == "тест"
+
     def test_add_entry(self, temp_dir: Path) -> None:
         glossary_path = temp_dir / "glossary.json"
         glossary = Glossary(glossary_path)
@@ -43,15 +78,15 @@ class TestGlossary:
         with pytest.raises(ValueError):
             glossary.add_entry("key", "")
 
-    def test_remove_entry(self, temp_glossary: Path) -> None:
-        glossary = Glossary(temp_glossary)
+    def test_remove_entry(self, glossary_entries: Mapping[str, str]) -> None:
+        glossary = Glossary.from_dict(glossary_entries)
 
         assert glossary.remove_entry("Hello") is True
         assert glossary.get_entry("Hello") is None
         assert len(glossary) == 1
 
-    def test_remove_nonexistent_entry(self, temp_glossary: Path) -> None:
-        glossary = Glossary(temp_glossary)
+    def test_remove_nonexistent_entry(self, glossary_entries: Mapping[str, str]) -> None:
+        glossary = Glossary.from_dict(glossary_entries)
         assert glossary.remove_entry("nonexistent") is False
 
     def test_save_glossary(self, temp_dir: Path) -> None:
@@ -67,15 +102,15 @@ class TestGlossary:
         assert glossary2.get_entry("key1") == "value1"
         assert glossary2.get_entry("key2") == "value2"
 
-    def test_apply_replacements(self, temp_glossary: Path) -> None:
-        glossary = Glossary(temp_glossary)
+    def test_apply_replacements(self, glossary_entries: Mapping[str, str]) -> None:
+        glossary = Glossary.from_dict(glossary_entries)
 
         text = "Hello, world!"
         result = glossary.apply(text)
         assert result == "Привет, мир!"
 
-    def test_apply_case_insensitive(self, temp_glossary: Path) -> None:
-        glossary = Glossary(temp_glossary)
+    def test_apply_case_insensitive(self, glossary_entries: Mapping[str, str]) -> None:
+        glossary = Glossary.from_dict(glossary_entries)
         glossary.set_case_sensitive(False)
 
         text = "HELLO, WORLD!"
@@ -102,8 +137,8 @@ class TestGlossary:
         result = glossary.apply(text)
         assert result == text
 
-    def test_clear_glossary(self, temp_glossary: Path) -> None:
-        glossary = Glossary(temp_glossary)
+    def test_clear_glossary(self, glossary_entries: Mapping[str, str]) -> None:
+        glossary = Glossary.from_dict(glossary_entries)
         assert len(glossary) > 0
 
         glossary.clear()
@@ -133,8 +168,8 @@ class TestGlossary:
         exported = glossary.export_to_dict()
         assert exported == {"x": "y"}
 
-    def test_contains(self, temp_glossary: Path) -> None:
-        glossary = Glossary(temp_glossary)
+    def test_contains(self, glossary_entries: Mapping[str, str]) -> None:
+        glossary = Glossary.from_dict(glossary_entries)
 
         assert "Hello" in glossary
         assert "nonexistent" not in glossary
@@ -150,3 +185,104 @@ class TestGlossary:
         result = glossary.apply(text)
         # "testing" should be replaced, not "test"
         assert result == "Y"
+
+    def test_apply_recompiles_after_edit(self, temp_dir: Path) -> None:
+        glossary = Glossary(temp_dir / "glossary.json")
+        glossary.add_entry("cat", "кот")
+        assert glossary.apply("cat") == "кот"
+
+        glossary.add_entry("dog", "пёс")
+        assert glossary.apply("cat dog") == "кот пёс"
+
+        glossary.set_case_sensitive(True)
+        assert glossary.apply("Cat dog") == "Cat пёс"
+
+        glossary.remove_entry("dog")
+        assert glossary.apply("cat dog") == "кот dog"
+
+    def test_apply_reuses_compiled_pattern(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("app.utils.glossary.AHOCORASICK_AVAILABLE", False)
+        glossary = Glossary(temp_dir / "glossary.json")
+        glossary.set_entries({"cat": "кот", "category": "категория"})
+        glossary.apply("cat")
+        compiled = glossary._compiled
+
+        for text in ("category", "cat cat", "no match"):
+            glossary.apply(text)
+        assert glossary._compiled is compiled
+
+        glossary.import_from_dict({"dog": "пёс"})
+        assert glossary._compiled is None
+
+    def test_get_all_entries_is_read_only_view(self, temp_dir: Path) -> None:
+        glossary = Glossary(temp_dir / "glossary.json")
+        glossary.add_entry("cat", "кот")
+        entries = glossary.get_all_entries()
+        with pytest.raises(TypeError):
+            entries["dog"] = "пёс"  # type: ignore[index]
+
+        exported = glossary.export_to_dict()
+        exported["dog"] = "пёс"
+        assert "dog" not in glossary
+        assert dict(entries) == {"cat": "кот"}
+
+    @pytest.mark.parametrize("case_sensitive", [True, False])
+    def test_apply_into_appends_spans(self, temp_dir: Path, case_sensitive: bool) -> None:
+        glossary = Glossary(temp_dir / "glossary.json")
+        glossary.set_entries({"cat": "кот", "dog": "пёс"})
+        glossary.set_case_sensitive(case_sensitive)
+
+        out = ["> "]
+        glossary.apply_into("a cat and a dog.", out)
+        glossary.apply_into(" zzz", out)
+        assert "".join(out) == "> a кот and a пёс. zzz"
+        assert out[-1] == " zzz"
+
+    def test_apply_replacement_is_literal(self, temp_dir: Path) -> None:
+        glossary = Glossary(temp_dir / "glossary.json")
+        glossary.add_entry("path", r"C:\new\1")
+        assert glossary.apply("PATH") == r"C:\new\1"
+
+    def test_apply_single_pass_does_not_rereplace(self, temp_dir: Path) -> None:
+        glossary = Glossary(temp_dir / "glossary.json")
+        glossary.set_entries({"cat": "dog", "dog": "wolf"})
+        assert glossary.apply("cat and dog") == "dog and wolf"
+
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_apply_case_sensitive_longest_match(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch, use_automaton: bool
+    ) -> None:
+        if use_automaton:
+            pytest.importorskip("ahocorasick")
+        monkeypatch.setattr("app.utils.glossary.AHOCORASICK_AVAILABLE", use_automaton)
+        glossary = Glossary(temp_dir / "glossary.json")
+        glossary.set_entries({"he": "X", "hello": "Y", "lo w": "Z", "world": "W"})
+        glossary.set_case_sensitive(True)
+
+        assert glossary.apply("hello world, he said. Hello") == "Y W, X said. Hello"
+        assert glossary.apply("nothing here") == "nothing Xre"
+        assert glossary.apply("") == ""
+
+    def test_apply_shared_prefixes(self, temp_dir: Path) -> None:
+        glossary = Glossary(temp_dir / "glossary.json")
+        glossary.set_entries({"car": "1", "cart": "2", "carton": "3", "cat": "4", "c.t": "5"})
+        assert glossary.apply("CAR cart cartons cat c.t cut") == "1 2 3s 4 5 cut"
+
+    def test_apply_case_insensitive_longest_match_across_case(self, temp_dir: Path) -> None:
+        glossary = Glossary(temp_dir / "glossary.json")
+        glossary.set_entries({"ab": "X", "Abc": "Y", "AB": "Z"})
+        assert glossary.apply("abc abd ABC") == "Y Xd Y"
+
+    def test_apply_skips_text_without_term_start(self, temp_dir: Path) -> None:
+        glossary = Glossary(temp_dir / "glossary.json")
+        glossary.set_entries({"zebra": "зебра"})
+        text = "nothing to replace here"
+        assert glossary.apply(text) is text
+
+    def test_apply_prefilter_honours_ignorecase_equivalents(self, temp_dir: Path) -> None:
+        glossary = Glossary(temp_dir / "glossary.json")
+        glossary.add_entry("kilo", "кило")
+        # KELVIN SIGN case-folds to "k" under re.IGNORECASE
+        assert glossary.apply("\u212ailo") == "кило"
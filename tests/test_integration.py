@@ -2,25 +2,56 @@
 
 from __future__ import annotations
 
+import io
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
 
 from app.config.settings import Settings
 from app.core.file_processor import FileProcessor
 from app.core.translator import Translator
+from app.services.chatgpt_proxy import ChatGPTProxyService
 from app.utils.glossary import Glossary
 
+pytestmark = pytest.mark.integration
+
+_SENTENCES = tuple(f"Sentence number {i}." for i in range(10))
+_LARGE_TEXT = " ".join(f"Sentence {i}." for i in range(1000))
+
+
+def _with_proxy_post(translator: Translator, post: MagicMock) -> Translator:
+    """Route the translator's ChatGPT Proxy requests through *post*."""
+    translator.services["chatgpt_proxy"] = ChatGPTProxyService(http_post=post)
+    return translator
+
+
+@pytest.fixture
+def mock_post() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def executor() -> Generator[ThreadPoolExecutor, None, None]:
+    """One worker pool for the module's parallel translations."""
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+def _proxy_reply(translated_text: str) -> SimpleNamespace:
+    """Just the attributes ChatGPTProxyService reads off a successful httpx response."""
+    payload = {"response": {"translated_text": translated_text}}
+    return SimpleNamespace(status_code=200, json=lambda: payload, text="")
+
 
 class TestEndToEndTranslation:
     """End-to-end integration tests."""
 
-    @patch("app.services.chatgpt_proxy.httpx.post")
     def test_translate_text_file_end_to_end(self, mock_post: MagicMock, temp_dir: Path) -> None:
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": {"translated_text": "Привет, мир!"}}
-        mock_post.return_value = mock_response
+        mock_post.return_value = _proxy_reply("Привет, мир!")
 
         # Create test file
         input_file = temp_dir / "input.txt"
@@ -31,7 +62,7 @@ class TestEndToEndTranslation:
         assert text == "Hello, world!"
 
         # Translate
-        translator = Translator()
+        translator = _with_proxy_post(Translator(), mock_post)
         result = translator.translate(text, "en", "ru", "chatgpt_proxy")
         assert isinstance(result, str)
 
@@ -40,34 +71,28 @@ class TestEndToEndTranslation:
         output_file.write_text(result, encoding="utf-8")
         assert output_file.exists()
 
-    @patch("app.services.chatgpt_proxy.httpx.post")
-    def test_parallel_translation_workflow(self, mock_post: MagicMock, temp_dir: Path) -> None:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": {"translated_text": "Переведено"}}
-        mock_post.return_value = mock_response
+    def test_parallel_translation_workflow(
+        self, mock_post: MagicMock, temp_dir: Path, executor: ThreadPoolExecutor
+    ) -> None:
+        mock_post.return_value = _proxy_reply("Переведено")
 
         # Create settings
         settings = Settings(temp_dir / "config.json")
-        translator = Translator(settings)
+        translator = _with_proxy_post(Translator(settings), mock_post)
 
         # Translate with multiple chunks
         text = "First sentence. Second sentence. Third sentence."
         results = translator.translate_parallel(
-            text, "en", "ru", ["chatgpt_proxy"], chunk_size=20, max_workers=2
+            text, "en", "ru", ["chatgpt_proxy"], chunk_size=20, max_workers=2, executor=executor
         )
 
         assert "chatgpt_proxy" in results
         assert isinstance(results["chatgpt_proxy"], str)
 
-    @patch("app.services.chatgpt_proxy.httpx.post")
     def test_translation_with_glossary_integration(
         self, mock_post: MagicMock, temp_dir: Path
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": {"translated_text": "API is great"}}
-        mock_post.return_value = mock_response
+        mock_post.return_value = _proxy_reply("API is great")
 
         # Setup glossary
         glossary_path = temp_dir / "glossary.json"
@@ -76,7 +101,7 @@ class TestEndToEndTranslation:
         glossary.save()
 
         # Setup translator
-        translator = Translator()
+        translator = _with_proxy_post(Translator(), mock_post)
         translator.glossary = glossary
 
         # Translate
@@ -103,28 +128,23 @@ class TestEndToEndTranslation:
         assert settings2.get_theme() == "light"
         assert settings2.get_chunk_size() == 1500
 
-    def test_glossary_persistence(self, temp_dir: Path) -> None:
-        glossary_path = temp_dir / "glossary.json"
-
-        # Create and save glossary
-        glossary1 = Glossary(glossary_path)
+    def test_glossary_persistence(self) -> None:
+        # Round-trips the saved document in memory; test_save_glossary covers the disk write
+        glossary1 = Glossary.from_dict({})
         glossary1.add_entry("hello", "привет")
         glossary1.add_entry("world", "мир")
-        glossary1.save()
+        glossary1.set_case_sensitive(True)
 
-        # Load in new instance
-        glossary2 = Glossary(glossary_path)
+        glossary2 = Glossary.from_dict({})
+        glossary2.load_from_string(glossary1._serialize())
+        assert glossary2.is_case_sensitive()
         assert glossary2.get_entry("hello") == "привет"
         assert glossary2.get_entry("world") == "мир"
 
-    @patch("app.services.chatgpt_proxy.httpx.post")
     def test_multi_service_comparison(self, mock_post: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": {"translated_text": "Результат перевода"}}
-        mock_post.return_value = mock_response
+        mock_post.return_value = _proxy_reply("Результат перевода")
 
-        translator = Translator()
+        translator = _with_proxy_post(Translator(), mock_post)
         text = "Hello, world!"
 
         # Translate with one service (chatgpt_proxy)
@@ -149,20 +169,14 @@ class TestEndToEndTranslation:
         if result_ru is not None:
             assert result_ru == "ru"
 
-    @patch("app.services.chatgpt_proxy.httpx.post")
     def test_error_handling_in_parallel_translation(self, mock_post: MagicMock) -> None:
         # First call succeeds, second fails
-        mock_response_success = MagicMock()
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {"response": {"translated_text": "Success"}}
-
-        mock_response_error = MagicMock()
-        mock_response_error.status_code = 500
-        mock_response_error.text = "Server error"
-
-        mock_post.side_effect = [mock_response_success, mock_response_error]
+        mock_post.side_effect = [
+            _proxy_reply("Success"),
+            SimpleNamespace(status_code=500, text="Server error"),
+        ]
 
-        translator = Translator()
+        translator = _with_proxy_post(Translator(), mock_post)
         # Should handle errors gracefully
         results = translator.translate_parallel(
             "Test. Test.", "en", "ru", ["chatgpt_proxy"], chunk_size=10, max_workers=1
@@ -174,9 +188,7 @@ class TestEndToEndTranslation:
     def test_chunk_reassembly(self) -> None:
         translator = Translator()
 
-        # Create text that will be split
-        sentences = [f"Sentence number {i}." for i in range(10)]
-        original_text = " ".join(sentences)
+        original_text = " ".join(_SENTENCES)
 
         # Split text
         chunks = translator.split_text(original_text, chunk_size=50)
@@ -186,17 +198,13 @@ class TestEndToEndTranslation:
         reassembled = " ".join(chunks)
 
         # Should contain all original sentences
-        for sentence in sentences:
+        for sentence in _SENTENCES:
             assert sentence in reassembled or sentence in original_text
 
-    @patch("app.services.chatgpt_proxy.httpx.post")
     def test_progress_tracking(self, mock_post: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": {"translated_text": "Translated"}}
-        mock_post.return_value = mock_response
+        mock_post.return_value = _proxy_reply("Translated")
 
-        translator = Translator()
+        translator = _with_proxy_post(Translator(), mock_post)
         progress_updates = []
 
         def track_progress(completed: int, total: int) -> None:
@@ -233,39 +241,31 @@ class TestEndToEndTranslation:
         result = translator.detect_language("")
         assert result is None
 
-    def test_special_characters_handling(self, temp_dir: Path) -> None:
-        # Create file with special characters
-        input_file = temp_dir / "special.txt"
+    def test_special_characters_handling(self) -> None:
         special_text = "Special: @#$%^&*() \n\t émojis: 😀🎉"
-        input_file.write_text(special_text, encoding="utf-8")
 
-        # Process file
-        result = FileProcessor.process_file(input_file)
+        result = FileProcessor.process_stream(io.BytesIO(special_text.encode("utf-8")), "txt")
         assert "@#$%^&*()" in result
+        assert "😀🎉" in result
 
     def test_large_text_processing(self) -> None:
         translator = Translator()
 
-        # Create large text (1000 sentences)
-        large_text = " ".join([f"Sentence {i}." for i in range(1000)])
-
         # Should split into multiple chunks
-        chunks = translator.split_text(large_text, chunk_size=500)
+        chunks = translator.split_text(_LARGE_TEXT, chunk_size=500)
         assert len(chunks) > 5
 
-    @patch("app.services.chatgpt_proxy.httpx.post")
-    def test_concurrent_service_calls(self, mock_post: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": {"translated_text": "Результат"}}
-        mock_post.return_value = mock_response
+    def test_concurrent_service_calls(
+        self, mock_post: MagicMock, executor: ThreadPoolExecutor
+    ) -> None:
+        mock_post.return_value = _proxy_reply("Результат")
 
-        translator = Translator()
+        translator = _with_proxy_post(Translator(), mock_post)
 
         # Translate with max workers > 1
         text = "One. Two. Three. Four. Five. Six. Seven. Eight."
         results = translator.translate_parallel(
-            text, "en", "ru", ["chatgpt_proxy"], chunk_size=10, max_workers=3
+            text, "en", "ru", ["chatgpt_proxy"], chunk_size=10, max_workers=3, executor=executor
         )
 
         assert "chatgpt_proxy" in results
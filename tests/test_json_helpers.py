@@ -6,7 +6,7 @@ import json
 
 import pytest
 
-from app.utils.json_helpers import parse_json_response
+from app.utils.json_helpers import dumps_json, loads_json, parse_json_response
 
 
 class TestParseJsonResponse:
@@ -49,3 +49,40 @@ class TestParseJsonResponse:
         # Starts with ``` but not ```json — only the generic ``` prefix strip applies
         result = parse_json_response('```\n{"ok": true}\n```')
         assert result == {"ok": True}
+
+    def test_large_fenced_body(self) -> None:
+        # Fences are peeled with prefix/suffix checks, so padding costs one linear scan
+        raw = '```json\n{"x": 1}' + " " * 100_000 + "\n```"
+        assert parse_json_response(raw) == {"x": 1}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+class TestJsonBytes:
+    @pytest.fixture(autouse=True)
+    def _backend(self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr("app.utils.json_helpers.ORJSON_AVAILABLE", use_orjson)
+
+    def test_round_trip_keeps_unicode(self) -> None:
+        payload = {"entries": {"Hello": "Привет"}, "case_sensitive": False}
+        raw = dumps_json(payload)
+        assert "Привет".encode() in raw
+        assert loads_json(raw) == payload
+
+    def test_indent(self) -> None:
+        assert dumps_json({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+
+    def test_invalid_raises_json_decode_error(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            loads_json(b"{not json")
+
+    def test_parse_fenced_response(self) -> None:
+        assert parse_json_response('```json\n{"score": 8, "note": "Хорошо"}\n```') == {
+            "score": 8,
+            "note": "Хорошо",
+        }
+
+    def test_parse_invalid_response_raises_json_decode_error(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            parse_json_response("not json at all")
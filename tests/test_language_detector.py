@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -17,17 +20,23 @@ class TestLanguageDetector:
         result = LanguageDetector.is_available()
         assert isinstance(result, bool)
 
-    def test_detect_english(self) -> None:
-        text = "This is a sample text in English language with enough words."
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("This is a sample text in English language with enough words.", {"en"}),
+            ("Это пример текста на русском языке с достаточным количеством слов.", {"ru"}),
+            ("Este es un texto de ejemplo en español con suficientes palabras.", {"es"}),
+            ("Dies ist ein Beispieltext in deutscher Sprache mit genug Wörtern.", {"de"}),
+            ("Ceci est un exemple de texte en français avec assez de mots.", {"fr"}),
+            ("这是一个中文文本的例子，包含足够的单词来进行语言检测。", {"zh-cn", "zh-tw", "zh"}),
+            ("これは日本語のテキストのサンプルで、言語検出に十分な単語が含まれています。", {"ja"}),
+        ],
+        ids=["en", "ru", "es", "de", "fr", "zh", "ja"],
+    )
+    def test_detect(self, text: str, expected: set[str]) -> None:
         result = LanguageDetector.detect(text)
         if result is not None:  # Only if langdetect is available
-            assert result == "en"
-
-    def test_detect_russian(self) -> None:
-        text = "Это пример текста на русском языке с достаточным количеством слов."
-        result = LanguageDetector.detect(text)
-        if result is not None:
-            assert result == "ru"
+            assert result in expected
 
     def test_detect_short_text(self) -> None:
         text = "Hi"
@@ -95,24 +104,6 @@ class TestLanguageDetector:
         assert "en" in LanguageDetector.SUPPORTED_LANGUAGES
         assert "ru" in LanguageDetector.SUPPORTED_LANGUAGES
 
-    def test_detect_spanish(self) -> None:
-        text = "Este es un texto de ejemplo en español con suficientes palabras."
-        result = LanguageDetector.detect(text)
-        if result is not None:
-            assert result == "es"
-
-    def test_detect_german(self) -> None:
-        text = "Dies ist ein Beispieltext in deutscher Sprache mit genug Wörtern."
-        result = LanguageDetector.detect(text)
-        if result is not None:
-            assert result == "de"
-
-    def test_detect_french(self) -> None:
-        text = "Ceci est un exemple de texte en français avec assez de mots."
-        result = LanguageDetector.detect(text)
-        if result is not None:
-            assert result == "fr"
-
     @patch("app.core.language_detector.detect")
     def test_detect_exception_handling(self, mock_detect: pytest.fixture) -> None:
         from app.core.language_detector import LANGDETECT_AVAILABLE
@@ -139,17 +130,72 @@ class TestLanguageDetector:
         )
         assert results == []
 
-    def test_chinese_language_detection(self) -> None:
-        text = "这是一个中文文本的例子，包含足够的单词来进行语言检测。"
-        result = LanguageDetector.detect(text)
-        if result is not None:
-            assert result in ["zh-cn", "zh-tw", "zh"]
+    def test_detect_many_mixed(self) -> None:
+        from app.core.language_detector import LANGDETECT_AVAILABLE
 
-    def test_japanese_language_detection(self) -> None:
-        text = "これは日本語のテキストのサンプルで、言語検出に十分な単語が含まれています。"
-        result = LanguageDetector.detect(text)
-        if result is not None:
-            assert result == "ja"
+        if not LANGDETECT_AVAILABLE:
+            pytest.skip("langdetect not available")
+
+        texts = [
+            "This is a sample text in English language with enough words.",
+            "",
+            "Это пример текста на русском языке с достаточным количеством слов.",
+            "Hi",
+        ]
+        assert LanguageDetector.detect_many(texts) == ["en", None, "ru", None]
+
+    def test_detect_many_threadsafe(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from app.core.language_detector import LANGDETECT_AVAILABLE
+
+        if not LANGDETECT_AVAILABLE:
+            pytest.skip("langdetect not available")
+
+        texts = [
+            "This is a sample text in English language with enough words.",
+            "Это пример текста на русском языке с достаточным количеством слов.",
+            "Dies ist ein Beispieltext in deutscher Sprache mit genug Wörtern.",
+            "안녕하세요 여러분 반갑습니다",
+        ] * 5
+        expected = LanguageDetector.detect_many(texts)
+        # A tiny cache makes every thread evict entries the others are reading
+        monkeypatch.setattr("app.core.language_detector._CACHE_MAX_SIZE", 2)
+        LanguageDetector.clear_cache()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(LanguageDetector.detect_many, [texts] * 8))
+
+        assert results == [expected] * 8
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("これは日本語のテキストです。", "ja"),
+            ("안녕하세요 여러분 반갑습니다", "ko"),
+            ("Γειά σου κόσμε τι κάνεις", "el"),
+            ("שלום עולם מה שלומך", "he"),
+            ("مرحبا بالعالم كيف حالك", "ar"),
+            ("สวัสดีชาวโลก", "th"),
+            # Shared scripts and mixed text still go to langdetect
+            ("这是一个中文文本的例子", None),
+            ("Привет мир как дела", None),
+            ("Hello world", None),
+            ("Hello Γειά world", None),
+        ],
+    )
+    def test_script_language(self, text: str, expected: str | None) -> None:
+        from app.core.language_detector import _script_language
+
+        assert _script_language(text) == expected
+
+    @patch("app.core.language_detector.detect")
+    def test_unique_script_skips_langdetect(self, mock_detect: pytest.fixture) -> None:
+        from app.core.language_detector import LANGDETECT_AVAILABLE
+
+        if not LANGDETECT_AVAILABLE:
+            pytest.skip("langdetect not available")
+
+        assert LanguageDetector.detect("안녕하세요 여러분 반갑습니다") == "ko"
+        mock_detect.assert_not_called()
 
     def test_detect_with_confidence_sorted(self) -> None:
         text = "This is a sample text in English language with enough words."
@@ -242,3 +288,114 @@ class TestLanguageDetectorCache:
         mock_detect.return_value = "en"
         result2 = LanguageDetector.detect(text)
         assert result2 is None  # cached None
+
+    def test_confidence_is_deterministic(self) -> None:
+        from app.core.language_detector import LANGDETECT_AVAILABLE, _get_factory
+
+        if not LANGDETECT_AVAILABLE:
+            pytest.skip("langdetect not available")
+
+        # The seeded detector factory is built once and reused by every call
+        text = "Hola amigo, ciao bella, bonjour mon ami."
+        first = LanguageDetector.detect_with_confidence(text)
+        LanguageDetector.clear_cache()
+        assert LanguageDetector.detect_with_confidence(text) == first
+        assert _get_factory() is _get_factory()
+
+    def test_only_supported_profiles_loaded(self) -> None:
+        from app.core.language_detector import LANGDETECT_AVAILABLE, _get_factory
+
+        if not LANGDETECT_AVAILABLE:
+            pytest.skip("langdetect not available")
+
+        langs = _get_factory().get_lang_list()
+        assert {"en", "ru", "zh-cn", "zh-tw", "pl"} <= set(langs)
+        assert "af" not in langs
+
+    @patch("app.core.language_detector.detect_langs")
+    def test_confidence_cache_hit_avoids_second_call(
+        self, mock_detect_langs: pytest.fixture
+    ) -> None:
+        from app.core.language_detector import LANGDETECT_AVAILABLE
+
+        if not LANGDETECT_AVAILABLE:
+            pytest.skip("langdetect not available")
+
+        mock_detect_langs.return_value = [SimpleNamespace(lang="en", prob=0.99)]
+        text = "This is a sample text in English language with enough words."
+
+        first = LanguageDetector.detect_with_confidence(text)
+        first.clear()  # callers get their own list
+        assert LanguageDetector.detect_with_confidence(text) == [("en", 0.99)]
+        mock_detect_langs.assert_called_once()
+
+        LanguageDetector.clear_cache()
+        LanguageDetector.detect_with_confidence(text)
+        assert mock_detect_langs.call_count == 2
+
+
+class _FakeFastText:
+    """Stands in for a loaded fastText model: fixed labels, records its input."""
+
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+        self.f = self  # the native binding the detector calls
+
+    def predict(
+        self, text: str, k: int, threshold: float, on_unicode_error: str
+    ) -> list[tuple[float, str]]:
+        self.seen.append(text)
+        return [(0.9, "__label__de"), (0.06, "__label__nl"), (0.04, "__label__en")][:k]
+
+
+class TestFastTextBackend:
+    """Tests for the optional fastText backend."""
+
+    @pytest.fixture
+    def model(self, monkeypatch: pytest.MonkeyPatch) -> _FakeFastText:
+        model = _FakeFastText()
+        monkeypatch.setattr(LanguageDetector, "_fasttext_model", model)
+        return model
+
+    def test_detect_uses_model(self, model: _FakeFastText) -> None:
+        with patch("app.core.language_detector.detect") as mock_detect:
+            result = LanguageDetector.detect("Ein Satz\nüber zwei Zeilen.")
+
+        assert result == "de"
+        assert model.seen == ["Ein Satz über zwei Zeilen.\n"]
+        mock_detect.assert_not_called()
+
+    def test_detect_with_confidence_uses_model(self, model: _FakeFastText) -> None:
+        results = LanguageDetector.detect_with_confidence("Ein Satz mit genug Wörtern.")
+        assert results == [("de", 0.9), ("nl", 0.06), ("en", 0.04)]
+
+    @patch("app.core.language_detector.LANGDETECT_AVAILABLE", False)
+    def test_model_works_without_langdetect(self, model: _FakeFastText) -> None:
+        assert LanguageDetector.is_available()
+        assert LanguageDetector.detect("Ein Satz mit genug Wörtern.") == "de"
+
+    def test_real_model(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        fasttext = pytest.importorskip("fasttext")
+        train = tmp_path / "train.txt"
+        train.write_text(
+            "__label__de ein kurzer satz auf deutsch\n__label__en a short sentence in english\n"
+            * 50,
+            encoding="utf-8",
+        )
+        trained = fasttext.train_supervised(
+            str(train), epoch=25, lr=1.0, minCount=1, dim=8, thread=1, verbose=0
+        )
+        trained.save_model(str(tmp_path / "lid.bin"))
+
+        monkeypatch.setattr(LanguageDetector, "_fasttext_model", None)
+        LanguageDetector.load_fasttext_model(tmp_path / "lid.bin")
+
+        assert LanguageDetector.detect("ein kurzer satz\nauf deutsch") == "de"
+        results = LanguageDetector.detect_with_confidence("a short sentence in english")
+        assert [lang for lang, _ in results] == ["en", "de"]
+        assert all(isinstance(prob, float) for _, prob in results)
+
+    @patch("app.core.language_detector.FASTTEXT_AVAILABLE", False)
+    def test_load_model_without_fasttext(self) -> None:
+        with pytest.raises(RuntimeError, match="fasttext is not installed"):
+            LanguageDetector.load_fasttext_model("lid.176.bin")
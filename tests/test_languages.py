@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
+import pytest
+
 from app.config.languages import (
     CHATGPT_PROXY_LANG_MAP,
     DEEPL_LANG_MAP,
@@ -47,15 +51,18 @@ class TestLanguages:
 
     def test_get_source_languages(self) -> None:
         source_langs = get_source_languages()
-        assert isinstance(source_langs, dict)
+        assert isinstance(source_langs, Mapping)
         assert "auto" in source_langs
         assert "en" in source_langs
-        # Should be a copy, not the same object
+        # A shared read-only view, so callers cannot mutate LANGUAGES through it
         assert source_langs is not LANGUAGES
+        assert source_langs is get_source_languages()
+        with pytest.raises(TypeError):
+            source_langs["xx"] = "Test"  # type: ignore[index]
 
     def test_get_target_languages(self) -> None:
         target_langs = get_target_languages()
-        assert isinstance(target_langs, dict)
+        assert isinstance(target_langs, Mapping)
         assert "auto" not in target_langs
         assert "en" in target_langs
         assert len(target_langs) == len(LANGUAGES) - 1
@@ -72,6 +79,12 @@ class TestLanguages:
         assert get_deepl_code("EN") == "EN"
         assert get_deepl_code("RU") == "RU"
 
+    @pytest.mark.parametrize("code", ["en", "EN", "En"])
+    def test_lookups_ignore_case(self, code: str) -> None:
+        assert get_language_name(code) == "English"
+        assert get_deepl_code(code) == "EN"
+        assert get_chatgpt_proxy_code(code) == "en"
+
     def test_get_chatgpt_proxy_code_existing(self) -> None:
         assert get_chatgpt_proxy_code("en") == "en"
         assert get_chatgpt_proxy_code("ru") == "ru"
@@ -83,10 +96,11 @@ class TestLanguages:
     def test_chatgpt_proxy_chinese_code(self) -> None:
         # Base Chinese code maps to simplified
         assert get_chatgpt_proxy_code("zh") == "zh-CN"
-        # CHATGPT_PROXY_LANG_MAP has uppercase keys, but function uses .lower()
-        # So we verify the mapping exists in the dict
+        # CHATGPT_PROXY_LANG_MAP has mixed-case keys; lookups ignore case
         assert "zh-CN" in CHATGPT_PROXY_LANG_MAP
         assert "zh-TW" in CHATGPT_PROXY_LANG_MAP
+        assert get_chatgpt_proxy_code("zh-CN") == get_chatgpt_proxy_code("zh-cn")
+        assert get_chatgpt_proxy_code("zh-TW") is not None
 
     def test_deepl_lang_map_structure(self) -> None:
         assert isinstance(DEEPL_LANG_MAP, dict)
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
-from app.services.llm_base import LLMTranslationService
+from app.services.llm_base import LLMTranslationService, _prompt_prefix
+from tests.services._fakes import FakeAsyncOpenAIClient, FakeOpenAIClient, api_error
 
 
 class _DummyLLM(LLMTranslationService):
@@ -41,6 +43,14 @@ class TestLLMTranslationServiceBase:
         svc = _DummyLLM(api_key="sk-123", available=False)
         assert svc.is_configured() is False
 
+    def test_close_releases_sdk_client(self) -> None:
+        svc = _DummyLLM()
+        client = svc._get_client()
+        svc.close()
+        client.close.assert_called_once_with()
+        assert svc._get_client() is not client
+        svc.close()
+
     def test_get_name(self) -> None:
         svc = _DummyLLM(model="model-b")
         assert svc.get_name() == "Dummy (model-b)"
@@ -178,3 +188,161 @@ class TestLLMTranslationServiceBase:
         assert len(msgs) == 2
         assert msgs[0]["role"] == "system"
         assert msgs[1]["content"] == "test prompt"
+
+    def test_build_prompt(self) -> None:
+        prompt = LLMTranslationService._build_prompt("Hi {name}", "en", "ru")
+        assert prompt == (
+            "Translate the following text from English to Russian. "
+            "Be accurate and preserve meaning:\n\nHi {name}"
+        )
+
+    def test_messages_share_prefix_across_calls(self) -> None:
+        # Provider-side prompt caching only kicks in for byte-identical prefixes
+        first = LLMTranslationService._build_messages(
+            LLMTranslationService._build_prompt("One.", "en", "ru")
+        )
+        second = LLMTranslationService._build_messages(
+            LLMTranslationService._build_prompt("Two.", "en", "ru")
+        )
+        assert first[0] is second[0]
+        prefix = _prompt_prefix("en", "ru")
+        assert _prompt_prefix("en", "ru") is prefix
+        assert first[1]["content"] == prefix + "One."
+        assert second[1]["content"] == prefix + "Two."
+
+
+class TestLLMTranslateMany:
+    def test_translate_many_sync_preserves_order(self) -> None:
+        svc = _DummyLLM()
+        client = FakeOpenAIClient()
+        client.reply = lambda request: request["messages"][1]["content"].rsplit("\n", 1)[-1].upper()
+        svc._client = client
+
+        result = svc.translate_many_sync(["a", "b", "c"], "en", "ru", concurrency=2)
+        assert result == ["A", "B", "C"]
+
+    async def test_translate_many_uses_async_client(self) -> None:
+        svc = _DummyLLM()
+        async_client = FakeAsyncOpenAIClient()
+        async_client.reply = " Hola "
+        svc._create_async_client = lambda: async_client  # type: ignore[method-assign]
+
+        result = await svc.translate_many(["Hello", "Hi"], "en", "es")
+        assert result == ["Hola", "Hola"]
+        assert await svc.atranslate("Hey", "en", "es") == "Hola"
+        assert len(async_client.requests) == 3
+        # Kept open for the next call on this loop until aclose()
+        assert async_client.closed == 0
+        await svc.aclose()
+        assert async_client.closed == 1
+
+    def test_translate_many_sync_closes_async_client(self) -> None:
+        svc = _DummyLLM()
+        created: list[FakeAsyncOpenAIClient] = []
+
+        def create() -> FakeAsyncOpenAIClient:
+            client = FakeAsyncOpenAIClient()
+            client.reply = "Hola"
+            created.append(client)
+            return client
+
+        svc._create_async_client = create  # type: ignore[method-assign]
+        assert svc.translate_many_sync(["Hello", "Hi"], "en", "es") == ["Hola", "Hola"]
+        assert svc.translate_many_sync(["Hello"], "en", "es") == ["Hola"]
+        # One client per asyncio.run loop, each closed before its loop goes away
+        assert [client.closed for client in created] == [1, 1]
+
+    async def test_atranslate_uses_semantic_cache(self) -> None:
+        svc = _DummyLLM()
+        svc.EMBEDDING_MODEL = "embed-model"
+        svc.enable_semantic_cache()
+        async_client = FakeAsyncOpenAIClient()
+        svc._create_async_client = lambda: async_client  # type: ignore[method-assign]
+        svc.translate = MagicMock(return_value="Hola")  # type: ignore[method-assign]
+
+        assert await svc.atranslate("Hello", "en", "es") == "Hola"
+        svc.translate.assert_called_once_with("Hello", "en", "es")
+        assert not async_client.requests
+
+    async def test_translate_many_deduplicates_inputs(self) -> None:
+        svc = _DummyLLM()
+        client = FakeOpenAIClient()
+        client.reply = "Привет"
+        svc._client = client
+
+        result = await svc.translate_many(["Hello", "Hello", "Hello"], "en", "ru")
+        assert result == ["Привет", "Привет", "Привет"]
+        assert len(client.requests) == 1
+
+    async def test_atranslate_wraps_exception(self) -> None:
+        svc = _DummyLLM()
+        client = FakeOpenAIClient()
+        client.reply = api_error("API down")
+        svc._client = client
+
+        with pytest.raises(ValueError, match="Dummy API error"):
+            await svc.atranslate("Hello", "en", "ru")
+
+    async def test_atranslate_not_configured_raises(self) -> None:
+        svc = _DummyLLM(api_key="")
+        svc._create_async_client = MagicMock()  # type: ignore[method-assign]
+        with pytest.raises(ValueError, match="not configured"):
+            await svc.atranslate("hello", "en", "ru")
+        svc._create_async_client.assert_not_called()
+
+    async def test_translate_many_not_configured_raises(self) -> None:
+        svc = _DummyLLM(api_key="")
+        with pytest.raises(ValueError, match="not configured"):
+            await svc.translate_many(["hello"], "en", "ru")
+
+    async def test_translate_many_sync_inside_running_loop(self) -> None:
+        svc = _DummyLLM()
+        client = FakeOpenAIClient()
+        client.reply = "Привет"
+        svc._client = client
+
+        assert svc.translate_many_sync(["Hello"], "en", "ru") == ["Привет"]
+
+
+class TestLLMSemanticCache:
+    @staticmethod
+    def _service(vectors: dict[str, list[float]]) -> tuple[_DummyLLM, FakeOpenAIClient]:
+        svc = _DummyLLM()
+        svc.EMBEDDING_MODEL = "embed-model"
+        client = FakeOpenAIClient()
+        client.reply = "Привет, мир"
+        embed = MagicMock(
+            side_effect=lambda model, input: SimpleNamespace(
+                data=[SimpleNamespace(embedding=vectors[input])]
+            )
+        )
+        client.embeddings = SimpleNamespace(create=embed)  # type: ignore[attr-defined]
+        svc._client = client
+        svc.enable_semantic_cache()
+        return svc, client
+
+    def test_requires_embedding_model(self) -> None:
+        with pytest.raises(ValueError, match="does not support embeddings"):
+            _DummyLLM().enable_semantic_cache()
+
+    def test_near_duplicate_skips_llm(self) -> None:
+        svc, client = self._service({"Hello world": [1.0, 0.0], "Hello world!": [0.99, 0.01]})
+
+        assert svc.translate("Hello world", "en", "ru") == "Привет, мир"
+        assert svc.translate("Hello world!", "en", "ru") == "Привет, мир"
+        assert len(client.requests) == 1
+        client.embeddings.create.assert_called_with(model="embed-model", input="Hello world!")
+
+    def test_other_language_pair_misses(self) -> None:
+        svc, client = self._service({"Hello world": [1.0, 0.0]})
+
+        svc.translate("Hello world", "en", "ru")
+        svc.translate("Hello world", "en", "de")
+        assert len(client.requests) == 2
+
+    def test_embedding_failure_falls_back_to_llm(self) -> None:
+        svc, client = self._service({})
+
+        assert svc.translate("Hello world", "en", "ru") == "Привет, мир"
+        assert svc._semantic_cache is not None
+        assert len(svc._semantic_cache) == 0
@@ -0,0 +1,85 @@
+"""Tests for NLTK resource download."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from app.core.translator import safe_sent_tokenize
+from app.utils.nltk_resources import (
+    download_nltk_resources,
+    nltk_missing,
+    nltk_ready,
+    start_nltk_download,
+)
+
+
+class TestDownloadNltkResources:
+    @patch("nltk.download")
+    @patch("nltk.data.find")
+    def test_skips_resources_already_present(
+        self, mock_find: MagicMock, mock_download: MagicMock
+    ) -> None:
+        download_nltk_resources()
+        mock_download.assert_not_called()
+        assert nltk_ready.is_set()
+
+    @patch("nltk.download")
+    @patch("nltk.data.find", side_effect=LookupError)
+    def test_downloads_missing_resources(
+        self, mock_find: MagicMock, mock_download: MagicMock
+    ) -> None:
+        download_nltk_resources()
+        assert [c.args[0] for c in mock_download.call_args_list] == ["punkt", "punkt_tab"]
+
+    @patch("nltk.download")
+    @patch("nltk.data.find", side_effect=LookupError)
+    def test_download_attempt_clears_missing(
+        self, mock_find: MagicMock, mock_download: MagicMock
+    ) -> None:
+        nltk_missing.set()
+        download_nltk_resources()
+        assert not nltk_missing.is_set()
+
+    @patch("nltk.download", side_effect=OSError("offline"))
+    @patch("nltk.data.find", side_effect=LookupError)
+    def test_download_errors_still_set_ready(
+        self, mock_find: MagicMock, mock_download: MagicMock
+    ) -> None:
+        nltk_ready.clear()
+        download_nltk_resources()
+        assert nltk_ready.is_set()
+
+    @patch("app.utils.nltk_resources.download_nltk_resources")
+    def test_start_runs_in_background(self, mock_download: MagicMock) -> None:
+        thread = start_nltk_download()
+        thread.join(timeout=5)
+        assert thread.daemon
+        mock_download.assert_called_once_with()
+        nltk_ready.set()
+
+
+class TestSentTokenizeGate:
+    @patch("app.core.translator.sent_tokenize")
+    def test_uses_simple_tokenizer_while_downloading(self, mock_tokenize: MagicMock) -> None:
+        nltk_ready.clear()
+        try:
+            sentences = safe_sent_tokenize("Hello world. How are you?")
+        finally:
+            nltk_ready.set()
+        mock_tokenize.assert_not_called()
+        assert sentences == ["Hello world.", "How are you?"]
+
+    @patch("app.core.translator.sent_tokenize", side_effect=LookupError("punkt_tab"))
+    def test_missing_data_checked_once(self, mock_tokenize: MagicMock) -> None:
+        for _ in range(3):
+            sentences = safe_sent_tokenize("Hello world. How are you?")
+        mock_tokenize.assert_called_once()
+        assert nltk_missing.is_set()
+        assert sentences == ["Hello world.", "How are you?"]
+
+    @patch("app.core.translator.sent_tokenize", return_value=["Hello world.", "How are you?"])
+    def test_punkt_splits_are_cached(self, mock_tokenize: MagicMock) -> None:
+        first = safe_sent_tokenize("Hello world. How are you?")
+        first.append("caller-owned")
+        assert safe_sent_tokenize("Hello world. How are you?") == ["Hello world.", "How are you?"]
+        mock_tokenize.assert_called_once()
@@ -110,6 +110,22 @@ class TestRetryWithBackoff:
         with pytest.raises(ValueError, match="request failed"):
             retry_with_backoff(limiter, always_fail, "svc", max_retries=1, base_delay=0.01)
 
+    def test_without_rate_limiter(self) -> None:
+        response = MagicMock(spec=httpx.Response)
+        response.status_code = 200
+        call_count = 0
+
+        def flaky() -> httpx.Response:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise httpx.RequestError("timeout")
+            return response
+
+        result = retry_with_backoff(None, flaky, "test", max_retries=2, base_delay=0.01)
+        assert result is response
+        assert call_count == 2
+
     def test_retries_on_429(self) -> None:
         limiter = RateLimiter(min_interval=0.0)
         ok_response = MagicMock(spec=httpx.Response)
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import json
+import stat
+import sys
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from app.config.schema import SettingsSchema
 from app.config.settings import Settings
 
 
@@ -41,6 +46,60 @@ class TestSettings:
         assert settings2.get_api_key("deepl") == "new_key"
         assert settings2.get_theme() == "light"
 
+    def test_save_replaces_atomically(self, temp_dir: Path) -> None:
+        config_path = temp_dir / "config.json"
+        config_path.write_text('{"theme": "light"}', encoding="utf-8")
+        settings = Settings(config_path)
+        settings.set_chunk_size(1500)
+        settings.save()
+
+        assert json.loads(config_path.read_bytes())["chunk_size"] == 1500
+        assert list(temp_dir.iterdir()) == [config_path]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+    def test_save_preserves_file_mode(self, temp_dir: Path) -> None:
+        config_path = temp_dir / "config.json"
+        config_path.write_text("{}", encoding="utf-8")
+        config_path.chmod(0o640)
+        Settings(config_path).save()
+        assert stat.S_IMODE(config_path.stat().st_mode) == 0o640
+
+        new_path = temp_dir / "new.json"
+        Settings(new_path).save()
+        assert stat.S_IMODE(new_path.stat().st_mode) == 0o600
+
+    def test_concurrent_saves(self, temp_dir: Path) -> None:
+        config_path = temp_dir / "config.json"
+        errors: list[Exception] = []
+
+        def save(chunk_size: int) -> None:
+            settings = Settings(config_path)
+            settings.set_chunk_size(chunk_size)
+            try:
+                for _ in range(20):
+                    settings.save()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=save, args=(1000 + i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert json.loads(config_path.read_bytes())["chunk_size"] in range(1000, 1004)
+        assert list(temp_dir.iterdir()) == [config_path]
+
+    def test_save_keeps_non_ascii(self, temp_dir: Path) -> None:
+        config_path = temp_dir / "config.json"
+        settings = Settings(config_path)
+        settings.set_window_geometry("Окно")
+        settings.save()
+
+        assert "Окно".encode() in config_path.read_bytes()
+        assert Settings(config_path).get_window_geometry() == "Окно"
+
     def test_get_api_keys(self, temp_config: Path) -> None:
         settings = Settings(temp_config)
         keys = settings.get_api_keys()
@@ -191,6 +250,24 @@ class TestSettings:
         settings.set_api_key("deepl", "new_key")
         assert settings.get_api_key("deepl") == "new_key"
 
+    def test_set_validates_once(self, temp_dir: Path) -> None:
+        settings = Settings(temp_dir / "config.json")
+        with patch.object(
+            SettingsSchema, "model_validate", wraps=SettingsSchema.model_validate
+        ) as validate:
+            settings.set_chunk_size(1500)
+
+        validate.assert_called_once()
+        assert settings.get_chunk_size() == 1500
+
+    def test_api_key_for_unlisted_service(self, temp_dir: Path) -> None:
+        settings = Settings(temp_dir / "config.json")
+        settings.set_api_key("custom_service", "custom_key")
+
+        assert settings.get_api_key("custom_service") == "custom_key"
+        assert settings.get_api_key("model_dump") == ""
+        assert settings.get_api_key("deepl") == ""
+
     def test_window_geometry(self, temp_dir: Path) -> None:
         config_path = temp_dir / "config.json"
         settings = Settings(config_path)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,6 +10,22 @@ import pytest
 
 from app.config.settings import Settings
 from app.core.translator import SimpleTokenizer, Translator, safe_sent_tokenize
+from app.services.chatgpt_proxy import ChatGPTProxyService
+
+
+@pytest.fixture
+def proxy_post() -> MagicMock:
+    """POST callable for the ChatGPT Proxy service that answers "Привет"."""
+    post = MagicMock()
+    post.return_value.status_code = 200
+    post.return_value.json.return_value = {"response": {"translated_text": "Привет"}}
+    return post
+
+
+def _proxy_translator(post: MagicMock) -> Translator:
+    translator = Translator()
+    translator.services["chatgpt_proxy"] = ChatGPTProxyService(http_post=post)
+    return translator
 
 
 class TestSimpleTokenizer:
@@ -28,6 +45,18 @@ class TestSimpleTokenizer:
         # Should not split on decimal point
         assert "3.14" in sentences[0]
 
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Wait... what?! No.", ["Wait.", "..", "what?", "! No."]),
+            ("Version 2.0 is out. Update now", ["Version 2.0 is out.", "Update now"]),
+            ("  Trailing space.   ", ["Trailing space."]),
+            (".Leading dot. Next", [".Leading dot.", "Next"]),
+        ],
+    )
+    def test_sent_tokenize_boundaries(self, text: str, expected: list[str]) -> None:
+        assert SimpleTokenizer.sent_tokenize(text) == expected
+
     def test_sent_tokenize_empty(self) -> None:
         text = ""
         sentences = SimpleTokenizer.sent_tokenize(text)
@@ -131,6 +160,28 @@ class TestTranslator:
         assert len(translator.services) > initial_count
         assert "openai" in translator.services
 
+    def test_reload_services_closes_old_clients(self, temp_dir: Path) -> None:
+        translator = Translator(Settings(temp_dir / "config.json"))
+        old = translator.services["chatgpt_proxy"]
+        old._get_client()
+        assert old._client is not None
+
+        translator.reload_services()
+        assert old._client is None
+        assert translator.services["chatgpt_proxy"] is not old
+
+    def test_close_closes_services(self, temp_dir: Path) -> None:
+        translator = Translator(Settings(temp_dir / "config.json"))
+        failing = MagicMock()
+        failing.close.side_effect = RuntimeError("boom")
+        translator.services["failing"] = failing
+        closing = MagicMock()
+        translator.services["closing"] = closing
+
+        translator.close()
+        failing.close.assert_called_once_with()
+        closing.close.assert_called_once_with()
+
     def test_get_available_services_empty(self, temp_dir: Path) -> None:
         settings = Settings(temp_dir / "config.json")
         translator = Translator(settings)
@@ -173,6 +224,7 @@ class TestTranslator:
             translator.translate("Hello", "en", "ru", "nonexistent")
         assert "not available" in str(exc_info.value)
 
+    @pytest.mark.slow
     def test_translate_service_not_configured(self, temp_dir: Path) -> None:
         settings = Settings(temp_dir / "config.json")
         translator = Translator(settings)
@@ -180,43 +232,31 @@ class TestTranslator:
         with pytest.raises(ValueError):
             translator.translate("Hello", "en", "ru", "deepl")
 
-    @patch("app.services.chatgpt_proxy.httpx.post")
-    def test_translate_success(self, mock_post: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": {"translated_text": "Привет"}}
-        mock_post.return_value = mock_response
-
-        translator = Translator()
+    def test_translate_success(self, proxy_post: MagicMock) -> None:
+        translator = _proxy_translator(proxy_post)
         result = translator.translate("Hello", "en", "ru", "chatgpt_proxy")
         assert isinstance(result, str)
 
-    @patch("app.services.chatgpt_proxy.httpx.post")
-    def test_translate_with_glossary(self, mock_post: MagicMock, temp_dir: Path) -> None:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": {"translated_text": "Hello world"}}
-        mock_post.return_value = mock_response
+    def test_translate_with_glossary(self, proxy_post: MagicMock) -> None:
+        proxy_post.return_value.json.return_value = {"response": {"translated_text": "Hello world"}}
 
-        translator = Translator()
+        translator = _proxy_translator(proxy_post)
         translator.glossary.add_entry("world", "мир")
         result = translator.translate("Test", "en", "ru", "chatgpt_proxy")
         # Glossary should be applied
         assert isinstance(result, str)
 
-    def test_translate_chunk(self) -> None:
-        translator = Translator()
+    def test_translate_chunk(self, proxy_post: MagicMock) -> None:
         # Only use chatgpt_proxy which is always available
-        with patch("app.services.chatgpt_proxy.httpx.post") as mock_post:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"response": {"translated_text": "Привет"}}
-            mock_post.return_value = mock_response
-
-            results = translator.translate_chunk("Hello", "en", "ru", ["chatgpt_proxy"])
-            assert "chatgpt_proxy" in results
+        translator = _proxy_translator(proxy_post)
+        results = translator.translate_chunk("Hello", "en", "ru", ["chatgpt_proxy"])
+        assert "chatgpt_proxy" in results
 
-    def test_translate_chunk_with_error(self, temp_dir: Path) -> None:
+    @pytest.mark.slow
+    def test_translate_chunk_with_error(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("app.utils.rate_limiter.time.sleep", lambda _: None)
         settings = Settings(temp_dir / "config.json")
         settings.set_api_key("deepl", "invalid_key")
         translator = Translator(settings)
@@ -225,14 +265,8 @@ class TestTranslator:
         # Should have error message
         assert "Error" in results["deepl"] or "error" in results["deepl"].lower()
 
-    @patch("app.services.chatgpt_proxy.httpx.post")
-    def test_translate_parallel(self, mock_post: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": {"translated_text": "Привет"}}
-        mock_post.return_value = mock_response
-
-        translator = Translator()
+    def test_translate_parallel(self, proxy_post: MagicMock) -> None:
+        translator = _proxy_translator(proxy_post)
         text = "Hello. How are you?"
         results = translator.translate_parallel(
             text, "en", "ru", ["chatgpt_proxy"], chunk_size=50, max_workers=1
@@ -240,14 +274,8 @@ class TestTranslator:
         assert "chatgpt_proxy" in results
         assert isinstance(results["chatgpt_proxy"], str)
 
-    @patch("app.services.chatgpt_proxy.httpx.post")
-    def test_translate_parallel_with_progress(self, mock_post: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": {"translated_text": "Привет"}}
-        mock_post.return_value = mock_response
-
-        translator = Translator()
+    def test_translate_parallel_with_progress(self, proxy_post: MagicMock) -> None:
+        translator = _proxy_translator(proxy_post)
         progress_calls = []
 
         def progress_callback(completed: int, total: int) -> None:
@@ -266,19 +294,88 @@ class TestTranslator:
         # Progress callback should have been called
         assert len(progress_calls) > 0
 
-    @patch("app.services.chatgpt_proxy.httpx.post")
-    def test_translate_parallel_multiple_services(self, mock_post: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": {"translated_text": "Привет"}}
-        mock_post.return_value = mock_response
-
+    @pytest.mark.parametrize("in_loop", [False, True], ids=["async", "sync-fallback"])
+    def test_translate_parallel_applies_glossary_once(self, in_loop: bool) -> None:
         translator = Translator()
+        echo = MagicMock()
+        echo.is_configured.return_value = True
+        echo.translate.side_effect = lambda text, _src, _tgt: text
+        translator.services["echo"] = echo
+        # Matches only across the chunk boundary; "a" -> "ab" would double on a second pass
+        translator.glossary.set_entries({"end. Start": "JOINED", "a": "ab"})
+
+        def run() -> dict[str, str]:
+            return translator.translate_parallel(
+                "The end. Start again.", "en", "ru", ["echo"], chunk_size=10
+            )
+
+        if in_loop:
+
+            async def inside_loop() -> dict[str, str]:
+                return run()
+
+            results = asyncio.run(inside_loop())
+        else:
+            results = run()
+        assert results == {"echo": "The JOINED abgabin."}
+
+    def test_translate_parallel_progress_is_batched(self, proxy_post: MagicMock) -> None:
+        translator = _proxy_translator(proxy_post)
+        progress_calls: list[tuple[int, int]] = []
+        text = " ".join(f"Line {i} ends here." for i in range(250))
+        translator.translate_parallel(
+            text,
+            "en",
+            "ru",
+            ["chatgpt_proxy"],
+            chunk_size=10,
+            max_workers=4,
+            progress_callback=lambda done, total: progress_calls.append((done, total)),
+        )
+        assert progress_calls[-1] == (250, 250)
+        assert len(progress_calls) <= 101
+
+    def test_translate_parallel_multiple_services(self, proxy_post: MagicMock) -> None:
+        translator = _proxy_translator(proxy_post)
         results = translator.translate_parallel(
             "Hello", "en", "ru", ["chatgpt_proxy"], chunk_size=100, max_workers=2
         )
         assert len(results) >= 1
 
+    async def test_atranslate_parallel(self, proxy_post: MagicMock) -> None:
+        translator = _proxy_translator(proxy_post)
+        results = await translator.atranslate_parallel(
+            "Hello. How are you?", "en", "ru", ["chatgpt_proxy"], chunk_size=10
+        )
+        assert results == {"chatgpt_proxy": "Привет Привет"}
+        translator.close()
+
+    def test_translate_parallel_reuses_pool(self, proxy_post: MagicMock) -> None:
+        with _proxy_translator(proxy_post) as translator:
+            translator.translate_parallel("Hello", "en", "ru", ["chatgpt_proxy"], max_workers=2)
+            pool = translator._executor
+            assert pool is not None
+            translator.translate_parallel("Bye", "en", "ru", ["chatgpt_proxy"], max_workers=4)
+            assert translator._executor is pool
+            # More workers than the shared pool has: a one-off pool, the shared one untouched
+            results = translator.translate_parallel(
+                "Again", "en", "ru", ["chatgpt_proxy"], max_workers=32
+            )
+            assert results == {"chatgpt_proxy": "Привет"}
+            assert translator._executor is pool
+        assert translator._executor is None
+
+    async def test_concurrent_calls_share_pool(self, proxy_post: MagicMock) -> None:
+        translator = _proxy_translator(proxy_post)
+        text = " ".join(f"Line {i} ends here." for i in range(20))
+        first, second = await asyncio.gather(
+            translator.atranslate_parallel(text, "en", "ru", ["chatgpt_proxy"], 10, 2),
+            translator.atranslate_parallel(text, "en", "ru", ["chatgpt_proxy"], 10, 8),
+        )
+        assert first == second
+        assert "Error" not in first["chatgpt_proxy"]
+        translator.close()
+
     def test_detect_language_available(self) -> None:
         translator = Translator()
         result = translator.detect_language("Hello, how are you?")
@@ -80,6 +80,23 @@ class TestTranslatorTranslate:
         assert "привет" in result
         mock_svc.translate.assert_not_called()
 
+    @patch("app.core.translator.discover_plugins", return_value=[])
+    def test_translate_cache_keyed_by_llm_model(self, _: MagicMock) -> None:
+        from app.services.llm_base import LLMTranslationService
+
+        t = Translator(_make_settings(api_keys={"openai": "sk-test"}))
+        svc = t.services["openai"]
+        assert isinstance(svc, LLMTranslationService)
+        t.cache.put("hello", "en", "ru", "openai:gpt-4o-mini", "привет")
+
+        with patch.object(svc, "translate", return_value="здравствуй") as mock_translate:
+            assert t.translate("hello", "en", "ru", "openai") == "привет"
+            mock_translate.assert_not_called()
+
+            svc.model = "gpt-4o"
+            assert t.translate("hello", "en", "ru", "openai") == "здравствуй"
+            mock_translate.assert_called_once()
+
 
 class TestTranslateParallel:
     @patch("app.core.translator.discover_plugins", return_value=[])